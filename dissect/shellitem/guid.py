@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Known folder ids of Windows (FOLDERID_* in KnownFolders.h)
+KNOWN_FOLDERS = {
+    "de61d971-5ebc-4f02-a3a9-6c82895e5c04": "FOLDERID_AddNewPrograms",
+    "724ef170-a42d-4fef-9f26-b60e846fba4f": "FOLDERID_AdminTools",
+    "a305ce99-f527-492b-8b1a-7e76fa98d6e4": "FOLDERID_AppUpdates",
+    "ab5fb87b-7ce2-4f83-915d-550846c9537b": "FOLDERID_CameraRoll",
+    "9e52ab10-f80d-49df-acb8-4330f5687855": "FOLDERID_CDBurning",
+    "df7266ac-9274-4867-8d55-3bd661de872d": "FOLDERID_ChangeRemovePrograms",
+    "d0384e7d-bac3-4797-8f14-cba229b392b5": "FOLDERID_CommonAdminTools",
+    "c1bae2d0-10df-4334-bedd-7aa20b227a9d": "FOLDERID_CommonOEMLinks",
+    "0139d44e-6afe-49f2-8690-3dafcae6ffb8": "FOLDERID_CommonPrograms",
+    "a4115719-d62e-491d-aa7c-e74b8be3b067": "FOLDERID_CommonStartMenu",
+    "82a5ea35-d9cd-47c5-9629-e15d2f714e6e": "FOLDERID_CommonStartup",
+    "b94237e7-57ac-4347-9151-b08c6c32d1f7": "FOLDERID_CommonTemplates",
+    "0ac0837c-bbf8-452a-850d-79d08e667ca7": "FOLDERID_ComputerFolder",
+    "4bfefb45-347d-4006-a5be-ac0cb0567192": "FOLDERID_ConflictFolder",
+    "6f0cd92b-2e97-45d1-88ff-b0d186b8dedd": "FOLDERID_ConnectionsFolder",
+    "56784854-c6cb-462b-8169-88e350acb882": "FOLDERID_Contacts",
+    "82a74aeb-aeb4-465c-a014-d097ee346d63": "FOLDERID_ControlPanelFolder",
+    "2b0f765d-c0e9-4171-908e-08a611b84ff6": "FOLDERID_Cookies",
+    "b4bfcc3a-db2c-424c-b029-7fe99a87c641": "FOLDERID_Desktop",
+    "fdd39ad0-238f-46af-adb4-6c85480369c7": "FOLDERID_Documents",
+    "374de290-123f-4565-9164-39c4925e467b": "FOLDERID_Downloads",
+    "1777f761-68ad-4d8a-87bd-30b759fa33dd": "FOLDERID_Favorites",
+    "fd228cb7-ae11-4ae3-864c-16f3910ab8fe": "FOLDERID_Fonts",
+    "d9dc8a3b-b784-432e-a781-5a1130a75963": "FOLDERID_History",
+    "bcb5256f-79f6-4cee-b725-dc34e402fd46": "FOLDERID_ImplicitAppShortcuts",
+    "352481e8-33be-4251-ba85-6007caedcf9d": "FOLDERID_InternetCache",
+    "4d9f7874-4e0c-4904-967b-40b0d20c3e4b": "FOLDERID_InternetFolder",
+    "1b3ea5dc-b587-4786-b4ef-bd1dc332aeae": "FOLDERID_Libraries",
+    "bfb9d5e0-c6a9-404c-b2b2-ae6db6af4968": "FOLDERID_Links",
+    "f1b32785-6fba-4fcf-9d55-7b8e7f157091": "FOLDERID_LocalAppData",
+    "a520a1a4-1780-4ff6-bd18-167343c5af16": "FOLDERID_LocalAppDataLow",
+    "4bd8d571-6d19-48d3-be97-422220080e43": "FOLDERID_Music",
+    "c5abbf53-e17f-4121-8900-86626fc2c973": "FOLDERID_NetHood",
+    "d20beec4-5ca8-4905-ae3b-bf251ea09b53": "FOLDERID_NetworkFolder",
+    "31c0dd25-9439-4f12-bf41-7ff4eda38722": "FOLDERID_Objects3D",
+    "a52bba46-e9e1-435f-b3d9-28daa648c0f6": "FOLDERID_OneDrive",
+    "33e28130-4e1e-4676-835a-98395c3bc3bb": "FOLDERID_Pictures",
+    "de92c1c7-837f-4f69-a3bb-86e631204a23": "FOLDERID_Playlists",
+    "76fc4e2d-d6ad-4519-a663-37bd56068185": "FOLDERID_PrintersFolder",
+    "9274bd8d-cfd1-41c3-b35e-b13f55a758f4": "FOLDERID_PrintHood",
+    "5e6c858f-0e22-4760-9afe-ea3317b67173": "FOLDERID_Profile",
+    "62ab5d82-fdc1-4dc3-a9dd-070d1d495d97": "FOLDERID_ProgramData",
+    "905e63b6-c1bf-494e-b29c-65b732d3d21a": "FOLDERID_ProgramFiles",
+    "6d809377-6af0-444b-8957-a3773f02200e": "FOLDERID_ProgramFilesX64",
+    "7c5a40ef-a0fb-4bfc-874a-c0f2e0b9fa8e": "FOLDERID_ProgramFilesX86",
+    "f7f1ed05-9f6d-47a2-aaae-29d317c6f066": "FOLDERID_ProgramFilesCommon",
+    "6365d5a7-0f0d-45e5-87f6-0da56b6a4f7d": "FOLDERID_ProgramFilesCommonX64",
+    "de974d24-d9c6-4d3e-bf91-f4455120b917": "FOLDERID_ProgramFilesCommonX86",
+    "a77f5d77-2e2b-44c3-a6a2-aba601054a51": "FOLDERID_Programs",
+    "dfdf76a2-c82a-4d63-906a-5644ac457385": "FOLDERID_Public",
+    "c4aa340d-f20f-4863-afef-f87ef2e6ba25": "FOLDERID_PublicDesktop",
+    "ed4824af-dce4-45a8-81e2-fc7965083634": "FOLDERID_PublicDocuments",
+    "3d644c9b-1fb8-4f30-9b45-f670235f79c0": "FOLDERID_PublicDownloads",
+    "3214fab5-9757-4298-bb61-92a9deaa44ff": "FOLDERID_PublicMusic",
+    "b6ebfb86-6907-413c-9af7-4fc2abf07cc5": "FOLDERID_PublicPictures",
+    "2400183a-6185-49fb-a2d8-4a392a602ba3": "FOLDERID_PublicVideos",
+    "52a4f021-7b75-48a9-9f6b-4b87a210bc8f": "FOLDERID_QuickLaunch",
+    "ae50c081-ebd2-438a-8655-8a092e34987a": "FOLDERID_Recent",
+    "b7534046-3ecb-4c18-be4e-64cd4cb7d6ac": "FOLDERID_RecycleBinFolder",
+    "8ad10c31-2adb-4296-a8f7-e4701232c972": "FOLDERID_ResourceDir",
+    "3eb685db-65f9-4cf6-a03a-e3ef65729f3d": "FOLDERID_RoamingAppData",
+    "4c5c32ff-bb9d-43b0-b5b4-2d72e54eaaa4": "FOLDERID_SavedGames",
+    "7d1d3a04-debb-4115-95cf-2f29da2920da": "FOLDERID_SavedSearches",
+    "b7bede81-df94-4682-a7d8-57a52620b86f": "FOLDERID_Screenshots",
+    "8983036c-27c0-404b-8f08-102d10dcfd74": "FOLDERID_SendTo",
+    "625b53c3-ab48-4ec1-ba1f-a1ef4146fc19": "FOLDERID_StartMenu",
+    "b97d20bb-f46a-4c97-ba10-5e3608430854": "FOLDERID_Startup",
+    "1ac14e77-02e7-4e5d-b744-2eb1ae5198b7": "FOLDERID_System",
+    "d65231b0-b2f1-4857-a4ce-a8e7c6ea7d27": "FOLDERID_SystemX86",
+    "a63293e8-664e-48db-a079-df759e0509f7": "FOLDERID_Templates",
+    "9e3995ab-1f9c-4f13-b827-48b24b6c7174": "FOLDERID_UserPinned",
+    "0762d272-c50a-4bb0-a382-697dcd729b80": "FOLDERID_UserProfiles",
+    "f3ce0f7c-4901-4acc-8648-d5d44b04ef8f": "FOLDERID_UsersFiles",
+    "a302545d-deff-464b-abe8-61c8648d939b": "FOLDERID_UsersLibraries",
+    "18989b1d-99b5-455b-841c-ab7c74e4ddfc": "FOLDERID_Videos",
+    "f38bf404-1d43-42f2-9305-67de0b28fc23": "FOLDERID_Windows",
+}
+
+# Class ids of the shell folders that appear as root folder items (CLSID_* in shlguid.h)
+SHELL_FOLDERS = {
+    "00021400-0000-0000-c000-000000000046": "CLSID_ShellDesktop",
+    "00021401-0000-0000-c000-000000000046": "CLSID_ShellLink",
+    "20d04fe0-3aea-1069-a2d8-08002b30309d": "CLSID_MyComputer",
+    "450d8fba-ad25-11d0-98a8-0800361b1103": "CLSID_MyDocuments",
+    "208d2c60-3aea-1069-a2d7-08002b30309d": "CLSID_NetworkPlaces",
+    "f02c1a0d-be21-4350-88b0-7367fc96ef3c": "CLSID_NetworkExplorerFolder",
+    "645ff040-5081-101b-9f08-00aa002f954e": "CLSID_RecycleBin",
+    "21ec2020-3aea-1069-a2dd-08002b30309d": "CLSID_ControlPanel",
+    "26ee0668-a00a-44d7-9371-beb064c98683": "CLSID_ControlPanelCategories",
+    "2227a280-3aea-1069-a2de-08002b30309d": "CLSID_Printers",
+    "871c5380-42a0-1069-a2ea-08002b30309d": "CLSID_Internet",
+    "59031a47-3f72-44a7-89c5-5595fe6b30ee": "CLSID_UsersFiles",
+    "031e4825-7b94-4dc3-b131-e946b44c8dd5": "CLSID_UsersLibraries",
+    "b4fb3f98-c1ea-428d-a78a-d1f5659cba93": "CLSID_HomeGroup",
+    "679f85cb-0220-4080-b29b-5540cc05aab6": "CLSID_QuickAccess",
+    "018d5c66-4533-4307-9b53-224de2ed1fe6": "CLSID_OneDrive",
+    "5e591a74-df96-48d3-8d67-1733bcee28ba": "CLSID_DelegateItem",
+}
+
+
+class GuidRegistry:
+    """A registry of interned GUIDs, looked up by the 16 raw bytes they are stored as in shell items and LNK files.
+
+    Every distinct GUID is represented by a single ``UUID`` object, so GUIDs that repeat between files, such as known
+    folder ids and the class ids of root folders, share one object. Named GUIDs are always interned, other GUIDs only
+    while the registry holds fewer than ``maxsize`` of them, so unique values such as file droids can't grow it
+    without bound.
+
+    Args:
+        names: The names of GUIDs, by their string representation or ``UUID``.
+        maxsize: Maximum number of unnamed GUIDs to intern.
+    """
+
+    def __init__(self, names: dict[str | UUID, str] | None = None, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._guids: dict[bytes, UUID] = {}
+        self._names: dict[bytes, str] = {}
+        self._unnamed = 0
+
+        for guid, name in (names or {}).items():
+            self.register(guid, name)
+
+    def __len__(self) -> int:
+        return len(self._guids)
+
+    def __contains__(self, raw: bytes) -> bool:
+        return raw in self._guids
+
+    def register(self, guid: str | UUID, name: str) -> UUID:
+        """Register the name of a GUID, and return its interned ``UUID``."""
+        guid = UUID(guid) if isinstance(guid, str) else guid
+        raw = guid.bytes_le
+        if raw not in self._guids:
+            self._guids[raw] = guid
+        elif raw not in self._names:
+            self._unnamed -= 1
+
+        self._names[raw] = name
+        return self._guids[raw]
+
+    def guid(self, raw: bytes | memoryview) -> UUID:
+        """Return the interned ``UUID`` of a GUID, given as the 16 bytes in little endian (``bytes_le``) order."""
+        try:
+            return self._guids[raw]
+        except KeyError:
+            pass
+        except TypeError:
+            # bytearray and writable memoryview objects aren't hashable
+            raw = bytes(raw)
+            if (guid := self._guids.get(raw)) is not None:
+                return guid
+
+        guid = UUID(bytes_le=bytes(raw))
+        if self._unnamed < self.maxsize:
+            self._guids[guid.bytes_le] = guid
+            self._unnamed += 1
+        return guid
+
+    def name(self, guid: bytes | memoryview | UUID | None) -> str | None:
+        """Return the name of a GUID, given as a ``UUID`` or its raw 16 bytes, or ``None`` if it's not known."""
+        if guid is None:
+            return None
+        return self._names.get(guid.bytes_le if isinstance(guid, UUID) else bytes(guid))
+
+    def names(self) -> Iterable[tuple[UUID, str]]:
+        """Return the named GUIDs and their names."""
+        return ((self._guids[raw], name) for raw, name in self._names.items())
+
+    def clear(self) -> None:
+        """Forget the interned GUIDs that don't have a name."""
+        self._guids = {raw: self._guids[raw] for raw in self._names}
+        self._unnamed = 0
+
+
+# The registry that is shared by all parsers
+registry = GuidRegistry({**KNOWN_FOLDERS, **SHELL_FOLDERS})
+
+
+def guid(raw: bytes | memoryview) -> UUID:
+    """Return the interned ``UUID`` of the raw 16 bytes of a GUID, see :meth:`GuidRegistry.guid`."""
+    return registry.guid(raw)
+
+
+def guid_name(guid: bytes | memoryview | UUID | None) -> str | None:
+    """Return the name of a known folder id or shell folder class id, see :meth:`GuidRegistry.name`."""
+    return registry.name(guid)
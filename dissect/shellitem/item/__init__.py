@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dissect.shellitem.item.item import (
+    ControlPanelItem,
+    DelegateItem,
+    ExtensionBlock,
+    FileEntryExtensionBlock,
+    FileEntryItem,
+    NetworkLocationItem,
+    RootFolderItem,
+    ShellItem,
+    ShellItemList,
+    UriItem,
+    VolumeItem,
+    shell_item,
+)
+
+__all__ = [
+    "ControlPanelItem",
+    "DelegateItem",
+    "ExtensionBlock",
+    "FileEntryExtensionBlock",
+    "FileEntryItem",
+    "NetworkLocationItem",
+    "RootFolderItem",
+    "ShellItem",
+    "ShellItemList",
+    "UriItem",
+    "VolumeItem",
+    "shell_item",
+]
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import logging
+from struct import Struct
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from dissect.util import ts
+
+from dissect.shellitem.guid import registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from datetime import datetime
+
+    from dissect.cstruct import Structure
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+# Class type indicators of the shell items, stored in the first byte after the ITEMID size
+CLASS_TYPE_ROOT_FOLDER = 0x1F
+CLASS_TYPE_VOLUME = 0x20
+CLASS_TYPE_FILE_ENTRY = 0x30
+CLASS_TYPE_NETWORK_LOCATION = 0x40
+CLASS_TYPE_URI = 0x61
+CLASS_TYPE_CONTROL_PANEL = 0x71
+CLASS_TYPE_USERS_FILES_FOLDER = 0x74
+
+# File entry class type flags
+FILE_ENTRY_DIRECTORY = 0x01
+FILE_ENTRY_FILE = 0x02
+FILE_ENTRY_UNICODE = 0x04
+
+# Network location flags
+NETWORK_HAS_DESCRIPTION = 0x80
+NETWORK_HAS_COMMENTS = 0x40
+
+DELEGATE_SIGNATURE = b"CFSF"
+DELEGATE_ITEM_CLSID = UUID("5e591a74-df96-48d3-8d67-1733bcee28ba")
+
+EXTENSION_BLOCK_SIGNATURE_MASK = 0xFFFF0000
+EXTENSION_BLOCK_SIGNATURE = 0xBEEF0000
+FILE_ENTRY_EXTENSION_SIGNATURE = 0xBEEF0004
+
+# Precompiled structures of the fixed parts of the items, all offsets are relative to the data after the ITEMID size
+_UINT16 = Struct("<H")
+_FILE_ENTRY = Struct("<BxIIH")  # class type, file size, modification time, file attributes
+_EXTENSION_BLOCK_HEADER = Struct("<HHI")  # size, version, signature
+_FILE_ENTRY_EXTENSION = Struct("<IIH")  # creation time, access time, identifier
+_FILE_REFERENCE = Struct("<2xQ8x")  # file reference, for version 7 and up
+_URI = Struct("<BBH")  # class type, flags, data size
+
+
+def _guid(buf: bytes | memoryview, offset: int) -> UUID | None:
+    if len(buf) < offset + 16:
+        return None
+    return registry.guid(buf[offset : offset + 16])
+
+
+def _dostimestamp(value: int) -> datetime | None:
+    # Stored as a FAT date followed by a FAT time
+    if not value:
+        return None
+
+    try:
+        return ts.dostimestamp(value, swap=True)
+    except ValueError:
+        return None
+
+
+def _read_string(buf: bytes | memoryview, offset: int, unicode: bool) -> tuple[str, int]:
+    """Read a NULL terminated string and return it with the offset following the terminator."""
+    data = bytes(buf[offset:])
+
+    if unicode:
+        # The terminator must be aligned to a character boundary
+        end = data.find(b"\x00\x00")
+        while end != -1 and end & 1:
+            end = data.find(b"\x00\x00", end + 1)
+        if end == -1:
+            end = len(data) & ~1
+        return data[:end].decode("utf-16-le", errors="surrogatepass"), offset + end + 2
+
+    end = data.find(b"\x00")
+    if end == -1:
+        end = len(data)
+    return data[:end].decode(errors="backslashreplace"), offset + end + 1
+
+
+class ExtensionBlock:
+    """A BEEF extension block, which stores additional data of a shell item.
+
+    Args:
+        data: The data of the extension block, including its size, version and signature.
+    """
+
+    __slots__ = ("data", "signature", "size", "version")
+
+    def __init__(self, data: bytes | memoryview):
+        self.data = data
+        self.size, self.version, self.signature = _EXTENSION_BLOCK_HEADER.unpack_from(data, 0)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} signature={self.signature:#x} version={self.version} size={self.size}>"
+
+
+class FileEntryExtensionBlock(ExtensionBlock):
+    """The BEEF0004 extension block of file entry items, which contains the long name and additional timestamps."""
+
+    __slots__ = ("access_time", "creation_time", "file_reference", "identifier", "localized_name", "long_name")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        creation_time, access_time, self.identifier = _FILE_ENTRY_EXTENSION.unpack_from(data, 8)
+        self.creation_time = _dostimestamp(creation_time)
+        self.access_time = _dostimestamp(access_time)
+        self.file_reference = None
+        self.long_name = None
+        self.localized_name = None
+
+        version = self.version
+        offset = 18
+        if version >= 7:
+            self.file_reference = _FILE_REFERENCE.unpack_from(data, offset)[0]
+            offset += _FILE_REFERENCE.size
+
+        localized_name_size = 0
+        if version >= 3:
+            localized_name_size = _UINT16.unpack_from(data, offset)[0]
+            offset += 2
+        if version >= 9:
+            offset += 4
+        if version >= 8:
+            offset += 4
+
+        # The last 2 bytes contain the offset of the extension block version
+        end = len(data) - 2 if version >= 3 else len(data)
+        self.long_name, offset = _read_string(data[:end], offset, True)
+        if localized_name_size and offset < end:
+            self.localized_name = _read_string(data[:end], offset, version >= 7)[0]
+
+    @property
+    def mft_entry(self) -> int | None:
+        return self.file_reference & 0xFFFFFFFFFFFF if self.file_reference is not None else None
+
+    @property
+    def mft_sequence(self) -> int | None:
+        return self.file_reference >> 48 if self.file_reference is not None else None
+
+
+EXTENSION_BLOCKS = {
+    FILE_ENTRY_EXTENSION_SIGNATURE: FileEntryExtensionBlock,
+}
+
+
+def extension_blocks(buf: bytes | memoryview, offset: int) -> Iterator[ExtensionBlock]:
+    """Iterate over the BEEF extension blocks in a shell item, starting at the given offset.
+
+    Args:
+        buf: The data of the shell item.
+        offset: The offset of the first extension block.
+    """
+    end = len(buf)
+    while offset + _EXTENSION_BLOCK_HEADER.size <= end:
+        size, _, signature = _EXTENSION_BLOCK_HEADER.unpack_from(buf, offset)
+        if size < _EXTENSION_BLOCK_HEADER.size or offset + size > end:
+            break
+        if signature & EXTENSION_BLOCK_SIGNATURE_MASK != EXTENSION_BLOCK_SIGNATURE:
+            break
+
+        data = buf[offset : offset + size]
+        try:
+            yield EXTENSION_BLOCKS.get(signature, ExtensionBlock)(data)
+        except Exception as e:
+            log.debug("Failed to decode extension block %#x", signature, exc_info=e)
+            yield ExtensionBlock(data)
+
+        offset += size
+
+
+class ShellItem:
+    """A shell item of which the class type is unknown. Also the base class of all decoded shell items.
+
+    Args:
+        data: The data of the ITEMID, not including its size field.
+    """
+
+    __slots__ = ("class_type", "data")
+
+    def __init__(self, data: bytes | memoryview):
+        self.data = data
+        self.class_type = data[0] if len(data) else None
+
+    def __repr__(self) -> str:
+        class_type = f"{self.class_type:#x}" if self.class_type is not None else None
+        return f"<{self.__class__.__name__} class_type={class_type} size={self.size}>"
+
+    @property
+    def size(self) -> int:
+        """The size of the ITEMID, including its size field."""
+        return len(self.data) + 2
+
+    @property
+    def name(self) -> str | None:
+        """A displayable name of the item, if any."""
+        return None
+
+
+class RootFolderItem(ShellItem):
+    """A root folder shell item, such as My Computer or the Control Panel, identified by a shell folder GUID."""
+
+    __slots__ = ("folder_id", "sort_index")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        self.sort_index = data[1]
+        self.folder_id = _guid(data, 2)
+
+    @property
+    def name(self) -> str | None:
+        if not self.folder_id:
+            return None
+        return registry.name(self.folder_id) or str(self.folder_id)
+
+
+class VolumeItem(ShellItem):
+    """A volume shell item, which contains the drive letter of the volume, such as ``C:\\``."""
+
+    __slots__ = ("volume_name",)
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        self.volume_name = _read_string(data, 1, False)[0] if self.class_type & 0x01 else None
+
+    @property
+    def name(self) -> str | None:
+        return self.volume_name
+
+
+class FileEntryItem(ShellItem):
+    """A file entry shell item, which represents a file or directory. Windows XP and up store the long name and
+    additional timestamps in a BEEF0004 extension block.
+    """
+
+    __slots__ = ("_extension_offset", "file_attributes", "file_size", "modification_time", "primary_name")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        _, self.file_size, modification_time, self.file_attributes = _FILE_ENTRY.unpack_from(data, 0)
+        self.modification_time = _dostimestamp(modification_time)
+        self.primary_name, offset = _read_string(data, _FILE_ENTRY.size, bool(self.class_type & FILE_ENTRY_UNICODE))
+        # The primary name is padded to a 16-bit boundary
+        self._extension_offset = offset + (offset & 1)
+
+    @property
+    def is_directory(self) -> bool:
+        return bool(self.class_type & FILE_ENTRY_DIRECTORY)
+
+    @property
+    def is_file(self) -> bool:
+        return bool(self.class_type & FILE_ENTRY_FILE)
+
+    @property
+    def extension_blocks(self) -> list[ExtensionBlock]:
+        return list(extension_blocks(self.data, self._extension_offset))
+
+    @property
+    def extension(self) -> FileEntryExtensionBlock | None:
+        """The BEEF0004 extension block, if present."""
+        for block in extension_blocks(self.data, self._extension_offset):
+            if isinstance(block, FileEntryExtensionBlock):
+                return block
+        return None
+
+    @property
+    def name(self) -> str | None:
+        extension = self.extension
+        if extension and extension.long_name:
+            return extension.long_name
+        return self.primary_name
+
+
+class NetworkLocationItem(ShellItem):
+    """A network location shell item, such as a server or share name."""
+
+    __slots__ = ("comments", "description", "flags", "location")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        self.flags = data[2]
+        self.location, offset = _read_string(data, 3, False)
+        self.description = self.comments = None
+        if self.flags & NETWORK_HAS_DESCRIPTION:
+            self.description, offset = _read_string(data, offset, False)
+        if self.flags & NETWORK_HAS_COMMENTS:
+            self.comments = _read_string(data, offset, False)[0]
+
+    @property
+    def name(self) -> str | None:
+        return self.location
+
+
+class UriItem(ShellItem):
+    """A URI shell item, such as an FTP or HTTP location."""
+
+    __slots__ = ("flags", "timestamp", "uri")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        _, self.flags, data_size = _URI.unpack_from(data, 0)
+        self.timestamp = None
+        if data_size >= 16:
+            self.timestamp = ts.wintimestamp(int.from_bytes(data[12:20], "little"))
+        self.uri = _read_string(data, _URI.size + data_size, bool(self.flags & 0x80))[0]
+
+    @property
+    def name(self) -> str | None:
+        return self.uri
+
+
+class ControlPanelItem(ShellItem):
+    """A control panel shell item, identified by the GUID of the control panel item."""
+
+    __slots__ = ("item_id",)
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        self.item_id = _guid(data, 12)
+
+    @property
+    def name(self) -> str | None:
+        return str(self.item_id) if self.item_id else None
+
+
+class DelegateItem(ShellItem):
+    """A delegate shell item, such as a users files folder item. It wraps a file entry item of which the actual
+    location is determined by the delegate folder class.
+    """
+
+    __slots__ = ("_extension_offset", "delegate_class_id", "delegate_item_id", "item")
+
+    def __init__(self, data: bytes | memoryview):
+        super().__init__(data)
+        # The wrapped item starts with its own size
+        inner_size = _UINT16.unpack_from(data, 8)[0]
+        self.item = shell_item(data[10 : 8 + inner_size]) if inner_size >= 2 else None
+
+        offset = 8 + inner_size + 2
+        self.delegate_item_id = _guid(data, offset)
+        self.delegate_class_id = _guid(data, offset + 16)
+        self._extension_offset = offset + 32
+
+    @property
+    def extension_blocks(self) -> list[ExtensionBlock]:
+        return list(extension_blocks(self.data, self._extension_offset))
+
+    @property
+    def name(self) -> str | None:
+        return self.item.name if self.item else None
+
+
+def _build_dispatch_table() -> tuple[type[ShellItem], ...]:
+    table = [ShellItem] * 256
+    table[CLASS_TYPE_ROOT_FOLDER] = RootFolderItem
+    for class_type in range(0x10):
+        table[CLASS_TYPE_VOLUME | class_type] = VolumeItem
+        table[CLASS_TYPE_FILE_ENTRY | class_type] = FileEntryItem
+        table[CLASS_TYPE_NETWORK_LOCATION | class_type] = NetworkLocationItem
+    table[CLASS_TYPE_URI] = UriItem
+    table[CLASS_TYPE_CONTROL_PANEL] = ControlPanelItem
+    table[CLASS_TYPE_USERS_FILES_FOLDER] = DelegateItem
+    return tuple(table)
+
+
+# Shell item classes indexed by class type
+SHELL_ITEM_CLASSES = _build_dispatch_table()
+
+
+def shell_item(data: bytes | memoryview) -> ShellItem:
+    """Decode a shell item, dispatching on its class type.
+
+    Items of an unknown class type, or that fail to decode, are returned as a plain :class:`ShellItem`.
+
+    Args:
+        data: The data of the ITEMID, not including its size field.
+    """
+    if not len(data):
+        return ShellItem(data)
+
+    # Delegate items of other class types than users files folder are identified by their signature
+    cls = DelegateItem if data[4:8] == DELEGATE_SIGNATURE else SHELL_ITEM_CLASSES[data[0]]
+
+    try:
+        return cls(data)
+    except Exception as e:
+        log.debug("Failed to decode shell item with class type %#x", data[0], exc_info=e)
+        return ShellItem(data)
+
+
+class ShellItemList:
+    """A sequence of shell items that are decoded when they are accessed.
+
+    Args:
+        itemids: The ITEMID structures of an IDLIST.
+    """
+
+    def __init__(self, itemids: Sequence[Structure]):
+        self.itemids = itemids
+        self._items: dict[int, ShellItem] = {}
+
+    def __len__(self) -> int:
+        return len(self.itemids)
+
+    def __getitem__(self, idx: int) -> ShellItem:
+        if idx < 0:
+            idx += len(self.itemids)
+
+        if (item := self._items.get(idx)) is None:
+            item = self._items[idx] = shell_item(self.itemids[idx].data)
+        return item
+
+    def __iter__(self) -> Iterator[ShellItem]:
+        for idx in range(len(self.itemids)):
+            yield self[idx]
+
+    def __repr__(self) -> str:
+        return f"<ShellItemList items={len(self.itemids)}>"
+
+    def path(self, separator: str = "\\") -> str:
+        """Join the names of the items into a path. Root folder items are left out."""
+        names = []
+        for item in self:
+            if isinstance(item, RootFolderItem) or not (name := item.name):
+                continue
+            names.append(name.rstrip("\\") if isinstance(item, VolumeItem) else name)
+        return separator.join(names)
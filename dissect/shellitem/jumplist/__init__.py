@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dissect.shellitem.jumplist.automatic import AutomaticDestinationEntry, AutomaticDestinations, DestListEntry
+from dissect.shellitem.jumplist.c_jumplist import c_jumplist
+from dissect.shellitem.jumplist.custom import CustomDestinationEntry, CustomDestinations
+from dissect.shellitem.jumplist.ole import OLE
+
+__all__ = [
+    "OLE",
+    "AutomaticDestinationEntry",
+    "AutomaticDestinations",
+    "CustomDestinationEntry",
+    "CustomDestinations",
+    "DestListEntry",
+    "c_jumplist",
+]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from dissect.shellitem.jumplist.c_jumplist import c_jumplist
+from dissect.shellitem.jumplist.ole import OLE
+from dissect.shellitem.lnk.lnk import Lnk, _wintimestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+    from dissect.shellitem.jumplist.ole import OleDirectoryEntry
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+
+class DestListEntry(NamedTuple):
+    """A single entry of the DestList stream of an AutomaticDestinations jump list."""
+
+    entry_id: int
+    """The entry number, which is also the name of the LNK stream in hexadecimal."""
+    mru_position: int
+    """The position of the entry in the DestList."""
+    access_time: datetime | None
+    hostname: str
+    pin_status: int
+    """The position of the entry amongst the pinned entries, -1 if unpinned."""
+    access_count: int
+    path: str
+
+
+class AutomaticDestinationEntry(NamedTuple):
+    """A LNK stream in an AutomaticDestinations jump list."""
+
+    entry_id: int
+    name: str
+    """The name of the LNK stream."""
+    lnk: Lnk
+    """The lazily decoded LNK file."""
+
+
+class AutomaticDestinations:
+    """Parser for ``*.automaticDestinations-ms`` jump list files, which are OLE compound files.
+
+    Only the FAT and the directory of the compound file are read up front. The DestList stream is parsed on first
+    access of :attr:`destlist`, and the LNK streams are only read when their LNK files are accessed.
+
+    Args:
+        fh: A file-like object to an AutomaticDestinations jump list file.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
+        self.ole = OLE(fh)
+
+        # LNK streams are named after their entry number in hexadecimal
+        self.streams = {}
+        for entry in self.ole.root.children():
+            if not entry.is_stream:
+                continue
+
+            try:
+                self.streams[int(entry.name, 16)] = entry
+            except ValueError:
+                pass
+
+    def __iter__(self) -> Iterator[AutomaticDestinationEntry]:
+        return self.entries()
+
+    def __len__(self) -> int:
+        return len(self.streams)
+
+    def entries(self) -> Iterator[AutomaticDestinationEntry]:
+        """Yield the LNK streams in order of their entry number."""
+        for entry_id in sorted(self.streams):
+            yield AutomaticDestinationEntry(entry_id, self.streams[entry_id].name, self.lnk(entry_id))
+
+    def lnk(self, entry_id: int) -> Lnk:
+        """Returns the lazily decoded LNK file in the stream with the given entry number.
+
+        Args:
+            entry_id: The entry number of the stream.
+        """
+        return Lnk(self.streams[entry_id].open(), lazy=True)
+
+    @cached_property
+    def destlist(self) -> list[DestListEntry]:
+        """Returns the entries of the DestList stream, which is parsed on first access."""
+        try:
+            stream = self.ole.get("DestList")
+        except KeyError:
+            return []
+
+        return list(self._parse_destlist(stream))
+
+    def _parse_destlist(self, stream: OleDirectoryEntry) -> Iterator[DestListEntry]:
+        fh = stream.open()
+        header = c_jumplist.DESTLIST_HEADER(fh)
+
+        entry_type = c_jumplist.DESTLIST_ENTRY if header.version == 1 else c_jumplist.DESTLIST_ENTRY_V3
+        for position in range(header.entry_count):
+            try:
+                entry = entry_type(fh)
+            except EOFError:
+                log.warning("Truncated DestList, %d of %d entries parsed", position, header.entry_count)
+                return
+
+            yield DestListEntry(
+                entry_id=entry.entry_number,
+                mru_position=position,
+                access_time=_wintimestamp(entry.access_time),
+                hostname=entry.hostname.split(b"\x00", 1)[0].decode(errors="backslashreplace"),
+                pin_status=entry.pin_status,
+                access_count=int(entry.access_count),
+                path=entry.path,
+            )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dissect.cstruct import cstruct
+
+# structs are reconstructed from the documentation of the jump list format by Joachim Metz
+# reference: https://github.com/libyal/dtformats/blob/main/documentation/Jump%20lists%20format.asciidoc
+# The compound file structs are reconstructed from the MS-CFB specification
+# reference: https://winprotocoldoc.blob.core.windows.net/productionwindowsarchives/MS-CFB/%5bMS-CFB%5d.pdf
+
+jumplist_def = """
+enum CATEGORY_TYPE : uint32 {
+    CUSTOM      = 0,                            // A custom category with a title and entries.
+    KNOWN       = 1,                            // A known category (frequent or recent), without entries.
+    TASKS       = 2,                            // The custom tasks of the application.
+};
+
+enum KNOWN_CATEGORY : int32 {
+    FREQUENT    = 1,
+    RECENT      = 2,
+};
+
+typedef struct CUSTOM_DESTINATIONS_HEADER {
+    uint32  version;                            // The format version, 2 as of Windows 7.
+    uint32  category_count;                     // The number of categories in the file.
+    uint32  reserved;
+};
+
+typedef struct DESTLIST_HEADER {
+    uint32  version;                            // The format version, 1 for Windows 7 and 8, 3 or 4 for Windows 10.
+    uint32  entry_count;                        // The number of entries in the DestList.
+    uint32  pinned_entry_count;                 // The number of pinned entries in the DestList.
+    float   unknown1;
+    uint32  last_entry_number;                  // The highest entry number that is in use.
+    uint32  unknown2;
+    uint32  last_revision_number;
+    uint32  unknown3;
+};
+
+typedef struct DESTLIST_ENTRY {
+    uint64  checksum;
+    char    volume_droid[16];                   // The volume identifier used by the Link Tracking service.
+    char    file_droid[16];                     // The file identifier used by the Link Tracking service.
+    char    volume_droid_birth[16];             // The birth volume identifier used by the Link Tracking service.
+    char    file_droid_birth[16];               // The birth file identifier used by the Link Tracking service.
+    char    hostname[16];                       // The NetBIOS name of the system the entry was created on.
+    uint32  entry_number;                       // The entry number, the name of the LNK stream in hexadecimal.
+    uint32  unknown1;
+    float   access_count;
+    uint64  access_time;                        // A FILETIME that specifies when the entry was last accessed.
+    int32   pin_status;                         // The position of the entry amongst the pinned entries, -1 if unpinned.
+    uint16  path_size;                          // The number of characters in the path.
+    wchar   path[path_size];
+};
+
+typedef struct DESTLIST_ENTRY_V3 {
+    uint64  checksum;
+    char    volume_droid[16];
+    char    file_droid[16];
+    char    volume_droid_birth[16];
+    char    file_droid_birth[16];
+    char    hostname[16];
+    uint32  entry_number;
+    uint32  unknown1;
+    float   unknown2;
+    uint64  access_time;
+    int32   pin_status;
+    uint32  unknown3;
+    uint32  access_count;
+    uint64  unknown4;
+    uint16  path_size;
+    wchar   path[path_size];
+    uint32  unknown5;
+};
+
+enum CFB_OBJECT_TYPE : uint8 {
+    UNKNOWN     = 0x00,                         // An unused directory entry.
+    STORAGE     = 0x01,
+    STREAM      = 0x02,
+    ROOT        = 0x05,                         // The root storage, which also holds the mini stream.
+};
+
+typedef struct CFB_HEADER {
+    char    signature[8];                       // MUST be D0 CF 11 E0 A1 B1 1A E1.
+    char    clsid[16];
+    uint16  minor_version;
+    uint16  major_version;                      // 3 for 512 byte sectors, 4 for 4096 byte sectors.
+    uint16  byte_order;                         // MUST be 0xFFFE.
+    uint16  sector_shift;                       // The sector size as a power of 2.
+    uint16  mini_sector_shift;                  // The mini stream sector size as a power of 2, MUST be 6.
+    char    reserved[6];
+    uint32  directory_sector_count;
+    uint32  fat_sector_count;                   // The number of FAT sectors.
+    uint32  first_directory_sector;             // The first sector of the directory chain.
+    uint32  transaction_signature;
+    uint32  mini_stream_cutoff;                 // Streams smaller than this size are stored in the mini stream.
+    uint32  first_mini_fat_sector;              // The first sector of the mini FAT chain.
+    uint32  mini_fat_sector_count;
+    uint32  first_difat_sector;                 // The first sector of the DIFAT chain.
+    uint32  difat_sector_count;
+    uint32  difat[109];                         // The first 109 FAT sector locations.
+};
+
+typedef struct CFB_DIRECTORY_ENTRY {
+    char    name[64];                           // The UTF-16 name of the entry, including the terminating NULL.
+    uint16  name_size;                          // The size of the name in bytes, including the terminating NULL.
+    CFB_OBJECT_TYPE object_type;
+    uint8   color;
+    uint32  left_sibling;
+    uint32  right_sibling;
+    uint32  child;
+    char    clsid[16];
+    uint32  state_bits;
+    uint64  creation_time;
+    uint64  modification_time;
+    uint32  start_sector;                       // The first sector of the stream, or of the mini stream for the root.
+    uint64  stream_size;
+};
+"""
+
+CFB_SIGNATURE = bytes.fromhex("d0cf11e0a1b11ae1")
+CFB_DIRECTORY_ENTRY_SIZE = 0x80
+
+# Special sector numbers in the FAT
+MAXREGSECT = 0xFFFFFFFA
+DIFSECT = 0xFFFFFFFC
+FATSECT = 0xFFFFFFFD
+ENDOFCHAIN = 0xFFFFFFFE
+FREESECT = 0xFFFFFFFF
+NOSTREAM = 0xFFFFFFFF
+
+c_jumplist = cstruct().load(jumplist_def)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+import struct
+from struct import pack, unpack
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from dissect.shellitem.jumplist.c_jumplist import c_jumplist
+from dissect.shellitem.lnk.c_lnk import JUMPLIST_FOOTER
+from dissect.shellitem.lnk.header import LINK_CLSID_BYTES
+from dissect.shellitem.lnk.lnk import Lnk
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+# Every entry is preceded by the LNK CLSID and every category is followed by the footer
+JUMPLIST_FOOTER_BYTES = pack("<I", JUMPLIST_FOOTER)
+
+
+class CustomDestinationEntry(NamedTuple):
+    """A LNK file embedded in a CustomDestinations jump list."""
+
+    offset: int
+    """Offset of the LNK file within the jump list file."""
+    category: str
+    """Title of the category the entry belongs to."""
+    lnk: Lnk
+    """The lazily decoded LNK file."""
+
+
+class CustomDestinations:
+    """Streaming parser for ``*.customDestinations-ms`` jump list files.
+
+    The file is walked one category and entry at a time, so it is never read as a whole. Every walked entry is
+    recorded in an index of ``(offset, category)`` tuples, after which any entry can be reached directly.
+
+    Entries are returned as lazy :class:`Lnk` objects, so the file-like object must remain open for as long as their
+    sections may still be accessed.
+
+    Args:
+        fh: A file-like object to a CustomDestinations jump list file.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
+        self.offset = fh.tell()
+        self.header = c_jumplist.CUSTOM_DESTINATIONS_HEADER(fh)
+        self.version = self.header.version
+        self.category_count = self.header.category_count
+
+        self._index = None
+
+    def __iter__(self) -> Iterator[CustomDestinationEntry]:
+        return self.entries()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, idx: int) -> CustomDestinationEntry:
+        return self.entry(idx)
+
+    @property
+    def index(self) -> list[tuple[int, str]]:
+        """Returns the ``(offset, category)`` tuples of all entries, walking the file if that has not happened yet."""
+        if self._index is None:
+            for _ in self._walk():
+                pass
+        return self._index
+
+    def entries(self) -> Iterator[CustomDestinationEntry]:
+        """Yield every entry in the jump list, walking the file as the entries are consumed."""
+        if self._index is not None:
+            for offset, category in self._index:
+                yield self._entry(offset, category)
+        else:
+            yield from self._walk()
+
+    def entry(self, idx: int) -> CustomDestinationEntry:
+        """Returns the entry at the given position, using the entry index.
+
+        Args:
+            idx: Position of the entry in the jump list.
+        """
+        offset, category = self.index[idx]
+        return self._entry(offset, category)
+
+    def _entry(self, offset: int, category: str) -> CustomDestinationEntry:
+        self.fh.seek(offset)
+        return CustomDestinationEntry(offset, category, Lnk(self.fh, lazy=True))
+
+    def _walk(self) -> Iterator[CustomDestinationEntry]:
+        """Walk the categories and their entries, recording the index once the walk has finished."""
+        index = []
+        try:
+            yield from self._walk_categories(index)
+        except (EOFError, struct.error) as e:
+            log.warning("Truncated jump list file: %s", e)
+
+        self._index = index
+
+    def _walk_categories(self, index: list[tuple[int, str]]) -> Iterator[CustomDestinationEntry]:
+        offset = self.offset + len(c_jumplist.CUSTOM_DESTINATIONS_HEADER)
+
+        for _ in range(self.category_count):
+            self.fh.seek(offset)
+            category_type = c_jumplist.CATEGORY_TYPE(self.fh)
+            entry_count = 0
+
+            if category_type == c_jumplist.CATEGORY_TYPE.CUSTOM:
+                title_size = unpack("<H", self.fh.read(2))[0] * 2
+                category = self.fh.read(title_size).decode("utf-16-le", errors="surrogatepass")
+                entry_count = c_jumplist.uint32(self.fh)
+                offset += 4 + 2 + title_size + 4
+            elif category_type == c_jumplist.CATEGORY_TYPE.KNOWN:
+                known_category = c_jumplist.KNOWN_CATEGORY(self.fh)
+                category = known_category.name.capitalize() if known_category.name else f"Known ({known_category})"
+                offset += 4 + 4
+            elif category_type == c_jumplist.CATEGORY_TYPE.TASKS:
+                category = "Tasks"
+                entry_count = c_jumplist.uint32(self.fh)
+                offset += 4 + 4
+            else:
+                log.warning("Unknown jump list category type %x at offset 0x%x", category_type, offset)
+                return
+
+            for _ in range(entry_count):
+                self.fh.seek(offset)
+                if self.fh.read(len(LINK_CLSID_BYTES)) != LINK_CLSID_BYTES:
+                    log.warning("Missing LNK CLSID for jump list entry at offset 0x%x", offset)
+                    return
+
+                offset += len(LINK_CLSID_BYTES)
+                entry = self._entry(offset, category)
+                if not entry.lnk.link_header:
+                    log.warning("Invalid LNK file in jump list entry at offset 0x%x", offset)
+                    return
+
+                index.append((offset, category))
+                yield entry
+
+                if (size := entry.lnk.size) is None:
+                    # The end of the LNK file is unknown, so the next entry can't be found
+                    log.warning("Unable to determine the size of the jump list entry at offset 0x%x", offset)
+                    return
+                offset += size
+
+            self.fh.seek(offset)
+            if (footer := self.fh.read(4)) != JUMPLIST_FOOTER_BYTES:
+                log.warning("Invalid jump list category footer %r at offset 0x%x", footer, offset)
+                return
+            offset += 4
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from functools import cached_property
+from struct import unpack
+from typing import TYPE_CHECKING, BinaryIO
+
+from dissect.util.stream import AlignedStream
+
+from dissect.shellitem.jumplist.c_jumplist import (
+    CFB_DIRECTORY_ENTRY_SIZE,
+    CFB_SIGNATURE,
+    MAXREGSECT,
+    NOSTREAM,
+    c_jumplist,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class OLE:
+    """Minimal reader for OLE compound files (MS-CFB), such as ``*.automaticDestinations-ms`` jump lists.
+
+    Only the header, the FAT and the directory are read up front. The mini FAT is read the first time a stream in
+    the mini stream is opened, and streams are read sector by sector as they are read.
+
+    Args:
+        fh: A file-like object to an OLE compound file.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
+
+        fh.seek(0)
+        self.header = c_jumplist.CFB_HEADER(fh)
+        if self.header.signature != CFB_SIGNATURE:
+            raise ValueError(f"Invalid OLE compound file signature: {self.header.signature.hex()}")
+
+        self.sector_size = 1 << self.header.sector_shift
+        self.mini_sector_size = 1 << self.header.mini_sector_shift
+        self.mini_stream_cutoff = self.header.mini_stream_cutoff
+
+        self.fat = self._read_fat()
+        self.entries = self._read_directory()
+        self.root = self.entries[0]
+
+    def _read_sectors(self, sector: int, count: int = 1) -> bytes:
+        self.fh.seek((sector + 1) * self.sector_size)
+        return self.fh.read(count * self.sector_size)
+
+    def _read_fat(self) -> list[int]:
+        fat_sector_count = self.header.fat_sector_count
+        fat_sectors = list(self.header.difat[:fat_sector_count])
+
+        # FAT sectors beyond the first 109 are listed in the DIFAT chain, of which the last entry points to the next
+        difat_sector = self.header.first_difat_sector
+        for _ in range(self.header.difat_sector_count):
+            if difat_sector > MAXREGSECT or len(fat_sectors) >= fat_sector_count:
+                break
+
+            data = self._read_sectors(difat_sector)
+            values = unpack(f"<{len(data) // 4}I", data)
+            fat_sectors.extend(values[:-1])
+            difat_sector = values[-1]
+
+        fat = []
+        for sector in fat_sectors[:fat_sector_count]:
+            data = self._read_sectors(sector)
+            fat.extend(unpack(f"<{len(data) // 4}I", data))
+
+        return fat
+
+    def _read_directory(self) -> list[OleDirectoryEntry]:
+        data = b"".join(self._read_sectors(sector) for sector in self.chain(self.header.first_directory_sector))
+
+        return [
+            OleDirectoryEntry(
+                self, index, c_jumplist.CFB_DIRECTORY_ENTRY(data[offset : offset + CFB_DIRECTORY_ENTRY_SIZE])
+            )
+            for index, offset in enumerate(range(0, len(data) - CFB_DIRECTORY_ENTRY_SIZE + 1, CFB_DIRECTORY_ENTRY_SIZE))
+        ]
+
+    @cached_property
+    def minifat(self) -> list[int]:
+        """Returns the mini FAT, which is read on first access."""
+        minifat = []
+        for sector in self.chain(self.header.first_mini_fat_sector):
+            data = self._read_sectors(sector)
+            minifat.extend(unpack(f"<{len(data) // 4}I", data))
+        return minifat
+
+    @cached_property
+    def mini_stream(self) -> OleStream:
+        """Returns the mini stream, which holds the sectors of all streams smaller than the mini stream cutoff."""
+        return OleStream(self, self.root.start_sector, self.root.size, mini=False)
+
+    def chain(self, start: int, mini: bool = False) -> list[int]:
+        """Returns the sectors of the chain starting at the given sector.
+
+        Args:
+            start: The first sector of the chain.
+            mini: Whether to follow the chain in the mini FAT instead of the FAT.
+        """
+        fat = self.minifat if mini else self.fat
+        chain = []
+
+        sector = start
+        while sector <= MAXREGSECT and sector < len(fat):
+            if len(chain) >= len(fat):
+                raise ValueError(f"Loop detected in sector chain starting at sector {start}")
+
+            chain.append(sector)
+            sector = fat[sector]
+
+        return chain
+
+    def listdir(self) -> dict[str, OleDirectoryEntry]:
+        """Returns the entries in the root storage by name."""
+        return {entry.name: entry for entry in self.root.children()}
+
+    def get(self, name: str) -> OleDirectoryEntry:
+        """Returns the entry with the given name in the root storage. Names are compared case-insensitively.
+
+        Args:
+            name: The name of the entry.
+        """
+        name = name.lower()
+        for entry in self.root.children():
+            if entry.name.lower() == name:
+                return entry
+        raise KeyError(name)
+
+    def open(self, name: str) -> OleStream:
+        """Returns a file-like object to the stream with the given name in the root storage.
+
+        Args:
+            name: The name of the stream.
+        """
+        return self.get(name).open()
+
+
+class OleDirectoryEntry:
+    """A single entry in the directory of an OLE compound file.
+
+    Args:
+        ole: The OLE compound file the entry belongs to.
+        index: The index of the entry in the directory.
+        entry: The parsed directory entry.
+    """
+
+    def __init__(self, ole: OLE, index: int, entry: c_jumplist.CFB_DIRECTORY_ENTRY):
+        self.ole = ole
+        self.index = index
+        self.entry = entry
+
+        name_size = min(entry.name_size, len(entry.name))
+        self.name = entry.name[:name_size].decode("utf-16-le", errors="surrogatepass").rstrip("\x00")
+        self.type = entry.object_type
+        self.start_sector = entry.start_sector
+        self.size = entry.stream_size
+        if ole.header.major_version == 3:
+            # The upper 32 bits may contain garbage in version 3 files
+            self.size &= 0xFFFFFFFF
+
+    def __repr__(self) -> str:
+        return f"<OleDirectoryEntry name={self.name!r} type={self.type.name} size={self.size}>"
+
+    @property
+    def is_stream(self) -> bool:
+        return self.type == c_jumplist.CFB_OBJECT_TYPE.STREAM
+
+    def children(self) -> list[OleDirectoryEntry]:
+        """Returns the entries in this storage, by walking the red-black tree of its children iteratively."""
+        entries = self.ole.entries
+        children = []
+        seen = set()
+
+        stack = [self.entry.child]
+        while stack:
+            index = stack.pop()
+            if index == NOSTREAM or index >= len(entries) or index in seen:
+                continue
+
+            seen.add(index)
+            entry = entries[index]
+            children.append(entry)
+            stack.extend((entry.entry.right_sibling, entry.entry.left_sibling))
+
+        return children
+
+    def open(self) -> OleStream:
+        """Returns a file-like object to the contents of this stream, which is read on demand."""
+        if not self.is_stream:
+            raise ValueError(f"Directory entry is not a stream: {self.name!r}")
+
+        return OleStream(self.ole, self.start_sector, self.size, mini=self.size < self.ole.mini_stream_cutoff)
+
+
+class OleStream(AlignedStream):
+    """A file-like object to a stream in an OLE compound file, which reads the sectors of the stream on demand.
+
+    Args:
+        ole: The OLE compound file the stream belongs to.
+        start: The first sector of the stream.
+        size: The size of the stream.
+        mini: Whether the stream is stored in the mini stream.
+    """
+
+    def __init__(self, ole: OLE, start: int, size: int, mini: bool):
+        self.ole = ole
+        self.mini = mini
+        self.sector_size = ole.mini_sector_size if mini else ole.sector_size
+        self.chain = ole.chain(start, mini)
+        super().__init__(size, align=self.sector_size)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        chain: Sequence[int] = self.chain
+        index = offset // self.sector_size
+        end = min(len(chain), -(-(offset + length) // self.sector_size))
+
+        result = []
+        while index < end:
+            # Read runs of consecutive sectors at once
+            sector = chain[index]
+            count = 1
+            while index + count < end and chain[index + count] == sector + count:
+                count += 1
+
+            result.append(self._read_sectors(sector, count))
+            index += count
+
+        return b"".join(result)
+
+    def _read_sectors(self, sector: int, count: int) -> bytes:
+        if self.mini:
+            self.ole.mini_stream.seek(sector * self.sector_size)
+            return self.ole.mini_stream.read(count * self.sector_size)
+
+        return self.ole._read_sectors(sector, count)
@@ -1,5 +1,76 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from dissect.shellitem.lnk.carve import carve, carve_parallel
+from dissect.shellitem.lnk.header import LinkHeader, read_header
+from dissect.shellitem.lnk.limits import DEFAULT_LIMITS, LimitExceeded, Limits
 from dissect.shellitem.lnk.lnk import Lnk, c_lnk
+from dissect.shellitem.lnk.propstore import Property, PropertyStore
+from dissect.shellitem.lnk.record import LnkRecord
+from dissect.shellitem.lnk.validate import ValidationReport, validate
+from dissect.shellitem.lnk.writer import LnkBuilder, build_idlist, build_linkinfo, new_header
+
+if TYPE_CHECKING:
+    from dissect.shellitem.lnk.aio import aparse_many
+    from dissect.shellitem.lnk.batch import ParseResult, parse_many
+    from dissect.shellitem.lnk.cache import ParseCache
+    from dissect.shellitem.lnk.columns import carve_header_columns, read_header_columns
+    from dissect.shellitem.lnk.manifest import Manifest, scan
+    from dissect.shellitem.lnk.sqlite import SqliteSink, to_sqlite
+
+# These modules pull in asyncio, concurrent.futures, sqlite3 or NumPy, so they are only imported on first use. Lazy
+# names can't be the same as the name of their module, as importing the module sets it as an attribute of this package
+_LAZY_IMPORTS = {
+    "aparse_many": "aio",
+    "ParseResult": "batch",
+    "parse_many": "batch",
+    "ParseCache": "cache",
+    "carve_header_columns": "columns",
+    "read_header_columns": "columns",
+    "Manifest": "manifest",
+    "scan": "manifest",
+    "SqliteSink": "sqlite",
+    "to_sqlite": "sqlite",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}")
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["Lnk", "c_lnk"]
+__all__ = [
+    "DEFAULT_LIMITS",
+    "LimitExceeded",
+    "Limits",
+    "LinkHeader",
+    "Lnk",
+    "LnkBuilder",
+    "LnkRecord",
+    "Manifest",
+    "ParseCache",
+    "ParseResult",
+    "Property",
+    "PropertyStore",
+    "SqliteSink",
+    "ValidationReport",
+    "aparse_many",
+    "build_idlist",
+    "build_linkinfo",
+    "c_lnk",
+    "carve",
+    "carve_header_columns",
+    "carve_parallel",
+    "new_header",
+    "parse_many",
+    "read_header",
+    "read_header_columns",
+    "scan",
+    "to_sqlite",
+    "validate",
+]
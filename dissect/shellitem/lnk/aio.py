@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from dissect.shellitem.lnk.batch import ParseResult, _parse_one
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable
+    from concurrent.futures import Executor
+
+
+class AsyncReader(Protocol):
+    """A file-like object with an asynchronous ``read()``, such as an ``asyncio.StreamReader``."""
+
+    async def read(self, n: int = -1) -> bytes: ...
+
+
+async def aread(source: str | os.PathLike | bytes | AsyncReader | Awaitable[bytes]) -> tuple[str | None, bytes]:
+    """Read the contents of a LNK file with a single awaited read.
+
+    Args:
+        source: A path, which is read in a worker thread, the bytes of the file, an object with an asynchronous
+            ``read()``, which is read until EOF, or an awaitable that returns the bytes of the file.
+
+    Returns:
+        The path or name of the source, if known, and the contents of the file.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        return path, await asyncio.to_thread(Path(path).read_bytes)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return None, bytes(source)
+
+    if inspect.isawaitable(source):
+        return None, bytes(await source)
+
+    name = getattr(source, "name", None)
+    return str(name) if name is not None else None, bytes(await source.read())
+
+
+async def aparse_many(
+    sources: Iterable[Any] | AsyncIterable[Any],
+    concurrency: int = 64,
+    ordered: bool = False,
+    compact: bool = False,
+    executor: Executor | None = None,
+) -> AsyncIterator[ParseResult]:
+    """Read and parse many LNK files concurrently, for sources where every read is a round trip.
+
+    At most ``concurrency`` sources are read at the same time. Every file is fetched with a single awaited read, see
+    :func:`aread`, after which it is parsed in ``executor`` so parsing doesn't block the event loop. Sources are
+    consumed lazily, so arbitrarily large inputs can be streamed through.
+
+    Errors don't abort the run, but are reported in the :class:`ParseResult` of the offending source.
+
+    Args:
+        sources: Paths, bytes, asynchronous readers or awaitables of the LNK files to parse, see :func:`aread`.
+        concurrency: Maximum number of sources that are read and parsed at the same time.
+        ordered: Whether to yield the results in the order of the sources, instead of as soon as they are finished.
+        compact: Whether to return the records as :class:`LnkRecord` objects instead of dictionaries.
+        executor: The executor to parse the files in, defaults to the default executor of the event loop.
+
+    Returns:
+        An asynchronous iterator of :class:`ParseResult` tuples, one for every source.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    sources = _aiter(sources)
+
+    async def process(index: int, source: Any) -> ParseResult:
+        try:
+            name, data = await aread(source)
+        except Exception as e:
+            return ParseResult(index, None, None, f"{type(e).__name__}: {e}")
+        return await loop.run_in_executor(executor, partial(_parse_one, index, name, data, compact))
+
+    pending = set()
+    finished = {}
+    index = next_index = 0
+    exhausted = False
+
+    try:
+        while pending or not exhausted:
+            # Don't read ahead further than the concurrency allows, including results that wait for an earlier source
+            while not exhausted and len(pending) + len(finished) < concurrency:
+                try:
+                    source = await anext(sources)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(process(index, source)))
+                index += 1
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if not ordered:
+                    yield result
+                    continue
+
+                finished[result.index] = result
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _aiter(sources: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    if hasattr(sources, "__aiter__"):
+        async for source in sources:
+            yield source
+    else:
+        for source in sources:
+            yield source
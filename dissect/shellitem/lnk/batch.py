@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, TypeVar
+
+from dissect.shellitem.lnk.cache import MISSING, content_key
+from dissect.shellitem.lnk.lnk import RECORD_PROJECTION, Lnk
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from dissect.shellitem.lnk.cache import ParseCache
+    from dissect.shellitem.lnk.record import LnkRecord
+
+_INVALID_HEADER = "Invalid LNK file header"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ParseResult(NamedTuple):
+    """The result of parsing a single LNK file with :func:`parse_many`.
+
+    Exactly one of ``record`` and ``error`` is set.
+    """
+
+    index: int
+    """Position of the source in the input."""
+    source: str | None
+    """Path or name of the source, if known."""
+    record: dict[str, Any] | LnkRecord | None
+    """The flat dictionary returned by :meth:`Lnk.to_dict`, or the :class:`LnkRecord` in compact mode."""
+    error: str | None
+    """Description of the error if the source could not be parsed."""
+
+
+def parse_many(
+    sources: Iterable[str | os.PathLike | BinaryIO | bytes],
+    workers: int | None = None,
+    ordered: bool = False,
+    chunksize: int = 64,
+    compact: bool = False,
+    cache: ParseCache | None = None,
+) -> Iterator[ParseResult]:
+    """Parse many LNK files using a pool of worker processes.
+
+    Paths are opened in the worker processes, file-like objects are read in the calling process and their contents
+    are sent to the workers. Sources are consumed lazily and at most two chunks per worker are in flight at any time,
+    so arbitrarily large inputs can be streamed through.
+
+    Errors don't abort the run, but are reported in the :class:`ParseResult` of the offending source.
+
+    Args:
+        sources: Paths, file-like objects or bytes of the LNK files to parse.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to parse in this process.
+        ordered: Whether to yield the results in the order of the sources, instead of as soon as they are finished.
+        chunksize: Number of sources to send to a worker at once.
+        compact: Whether to return the records as :class:`LnkRecord` objects instead of dictionaries, which use less
+            memory when many results are kept.
+        cache: A :class:`ParseCache` to look up files in before they are parsed, and to store the newly parsed files
+            in. Paths are read in this process to look them up, only files that are not in the cache are sent to the
+            workers.
+
+    Returns:
+        An iterator of :class:`ParseResult` tuples, one for every source.
+    """
+    tasks = ((index, *prepare_source(source), compact) for index, source in enumerate(sources))
+    if cache is not None:
+        return _parse_many_cached(tasks, cache, workers, ordered, chunksize, compact)
+    return run_chunks(_parse_chunk, tasks, workers=workers, ordered=ordered, chunksize=chunksize)
+
+
+def _parse_many_cached(
+    tasks: Iterable[tuple[int, str | None, str | bytes, bool]],
+    cache: ParseCache,
+    workers: int | None,
+    ordered: bool,
+    chunksize: int,
+    compact: bool,
+) -> Iterator[ParseResult]:
+    # Records of the files that were found in the cache, and keys of the files that are parsed, by index
+    hits = {}
+    parsing = {}
+    # Identical files are parsed once: keys of the copies of files that are being parsed by index, and the number of
+    # copies per key whose results are still to come
+    copies = {}
+    pending_copies = {}
+    # The (record, error) of parsed files of which copies are still to come, and copies that came before the original
+    resolved = {}
+    deferred = {}
+
+    def lookup() -> Iterator[tuple[int, str | None, str | bytes | None, bool]]:
+        for index, source, data, _ in tasks:
+            if isinstance(data, str):
+                try:
+                    data = Path(data).read_bytes()
+                except OSError:
+                    # Let the worker report the error
+                    yield index, source, data, True
+                    continue
+
+            key = content_key(data)
+            if key in pending_copies:
+                cache.hits += 1
+                copies[index] = key
+                pending_copies[key] += 1
+            elif (record := cache.lookup(key)) is not MISSING:
+                hits[index] = record
+            else:
+                parsing[index] = key
+                pending_copies[key] = 0
+                yield index, source, data, True
+                continue
+
+            # Only a placeholder is sent to the worker, to keep the results in order
+            yield index, source, None, True
+
+    def copy(result: ParseResult, key: bytes) -> ParseResult:
+        record, error = resolved[key]
+        pending_copies[key] -= 1
+        if not pending_copies[key]:
+            del pending_copies[key], resolved[key]
+        return ParseResult(result.index, result.source, record, error)
+
+    def finish(result: ParseResult) -> Iterator[ParseResult]:
+        index = result.index
+        if index in hits:
+            record = hits.pop(index)
+            yield ParseResult(index, result.source, record, None if record else _INVALID_HEADER)
+
+        elif index in copies:
+            key = copies.pop(index)
+            if key in resolved:
+                yield copy(result, key)
+            else:
+                deferred.setdefault(key, []).append(result)
+
+        elif index in parsing:
+            key = parsing.pop(index)
+            if result.record or result.error == _INVALID_HEADER:
+                cache[key] = result.record
+
+            yield result
+            if pending_copies[key]:
+                resolved[key] = (result.record, result.error)
+                for placeholder in deferred.pop(key, ()):
+                    yield copy(placeholder, key)
+            else:
+                del pending_copies[key]
+
+        else:
+            yield result
+
+    for result in run_chunks(_parse_chunk, lookup(), workers=workers, ordered=ordered, chunksize=chunksize):
+        for finished in finish(result):
+            if not compact and finished.record is not None:
+                finished = finished._replace(record=finished.record.to_dict())
+            yield finished
+
+
+def run_chunks(
+    func: Callable[[list[T]], list[R]],
+    tasks: Iterable[T],
+    workers: int | None = None,
+    ordered: bool = False,
+    chunksize: int = 64,
+) -> Iterator[R]:
+    """Run a function over chunks of tasks using a pool of worker processes, and yield the results.
+
+    Tasks are consumed lazily and at most two chunks per worker are in flight at any time.
+
+    Args:
+        func: A picklable function that takes a list of tasks and returns a list of results.
+        tasks: The tasks to run.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to run in this process.
+        ordered: Whether to yield the results in the order of the tasks, instead of as soon as they are finished.
+        chunksize: Number of tasks to send to a worker at once.
+    """
+    tasks = iter(tasks)
+    chunks = iter(lambda: list(islice(tasks, chunksize)), [])
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+
+            # Don't read ahead further than the workers can keep up with
+            if len(pending) >= workers * 2:
+                yield from _collect(pending, ordered)
+
+        while pending:
+            yield from _collect(pending, ordered)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def prepare_source(source: str | os.PathLike | BinaryIO | bytes) -> tuple[str | None, str | bytes]:
+    """Turn a source into something that can be sent to a worker process.
+
+    Paths are passed on as is, so the worker reads the file. File-like objects can't be sent to another process, but
+    LNK files are small enough to read them here.
+
+    Args:
+        source: A path, file-like object or bytes of a LNK file.
+
+    Returns:
+        A tuple of the name of the source, if known, and its path or contents.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        return path, path
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return None, bytes(source)
+
+    name = getattr(source, "name", None)
+    return str(name) if name is not None else None, source.read()
+
+
+def _collect(pending: deque[Future], ordered: bool) -> Iterator[Any]:
+    """Yield the results of at least one finished chunk and remove it from the pending chunks."""
+    if ordered:
+        yield from pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+
+def _parse_chunk(chunk: list[tuple[int, str | None, str | bytes, bool]]) -> list[ParseResult]:
+    return [_parse_one(*task) for task in chunk]
+
+
+def _parse_one(index: int, source: str | None, data: str | bytes | None, compact: bool = False) -> ParseResult:
+    if data is None:
+        # Placeholder of a file that was found in the cache
+        return ParseResult(index, source, None, None)
+
+    try:
+        if isinstance(data, str):
+            with Path(data).open("rb") as fh:
+                lnk = Lnk(fh, fields=RECORD_PROJECTION)
+                record = lnk.to_record() if compact else lnk.to_dict()
+        else:
+            lnk = Lnk.from_buffer(data, fields=RECORD_PROJECTION)
+            record = lnk.to_record() if compact else lnk.to_dict()
+    except Exception as e:
+        return ParseResult(index, source, None, f"{type(e).__name__}: {e}")
+
+    if not lnk.link_header:
+        return ParseResult(index, source, None, _INVALID_HEADER)
+
+    return ParseResult(index, source, record, None)
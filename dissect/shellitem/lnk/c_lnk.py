@@ -110,7 +110,6 @@ typedef struct DEVICE_NAME {
     char device_name[];                         // A NULL–terminated string, as defined by the system default code page, which specifies a device; for example, the drive letter "D:".
 };
 
-// TODO create unicode version
 typedef struct COMMON_NETWORK_RELATIVE_LINK_HEADER {
     uint32 common_network_relative_link_size;    // A 32-bit, unsigned integer that specifies the size, in bytes, of the CommonNetworkRelativeLink structure. This value MUST be greater than or equal to 0x00000014. All offsets specified in this structure MUST be less than this value, and all strings contained in this structure MUST fit within the extent defined by this size.
     COMMON_NETWORK_RELATIVE_LINK_FLAGS common_network_relative_link_flags;   // Flags that specify the contents of the DeviceNameOffset and NetProviderType fields.
@@ -119,7 +118,6 @@ typedef struct COMMON_NETWORK_RELATIVE_LINK_HEADER {
     uint32 net_provider_type;                    // A 32-bit, unsigned integer that specifies the type of network provider. If the ValidNetType flag is set, this value MUST be one of the following; otherwise, this value MUST be ignored.
 };
 
-// TODO create unicode version
 typedef struct COMMON_NETWORK_RELATIVE_LINK {
     uint32 common_network_relative_link_size;    // A 32-bit, unsigned integer that specifies the size, in bytes, of the CommonNetworkRelativeLink structure. This value MUST be greater than or equal to 0x00000014. All offsets specified in this structure MUST be less than this value, and all strings contained in this structure MUST fit within the extent defined by this size.
     COMMON_NETWORK_RELATIVE_LINK_FLAGS common_network_relative_link_flags;   // Flags that specify the contents of the DeviceNameOffset and NetProviderType fields.
@@ -130,6 +128,20 @@ typedef struct COMMON_NETWORK_RELATIVE_LINK {
     DEVICE_NAME device_name;
 };
 
+typedef struct COMMON_NETWORK_RELATIVE_LINK_UNICODE {
+    uint32 common_network_relative_link_size;    // A 32-bit, unsigned integer that specifies the size, in bytes, of the CommonNetworkRelativeLink structure. This value MUST be greater than or equal to 0x00000014. All offsets specified in this structure MUST be less than this value, and all strings contained in this structure MUST fit within the extent defined by this size.
+    COMMON_NETWORK_RELATIVE_LINK_FLAGS common_network_relative_link_flags;   // Flags that specify the contents of the DeviceNameOffset and NetProviderType fields.
+    uint32 net_name_offset;                      // A 32-bit, unsigned integer that specifies the location of the NetName field. This value is an offset, in bytes, from the start of the CommonNetworkRelativeLink structure.
+    uint32 device_name_offset;                   // A 32-bit, unsigned integer that specifies the location of the DeviceName field. If the ValidDevice flag is set, this value is an offset, in bytes, from the start of the CommonNetworkRelativeLink structure; otherwise, this value MUST be zero.
+    uint32 net_provider_type;                    // A 32-bit, unsigned integer that specifies the type of network provider. If the ValidNetType flag is set, this value MUST be one of the following; otherwise, this value MUST be ignored.
+    uint32 net_name_offset_unicode;              // An optional, 32-bit, unsigned integer that specifies the location of the NetNameUnicode field. This value is an offset, in bytes, from the start of the CommonNetworkRelativeLink structure. This field MUST be present if the value of the NetNameOffset field is greater than 0x00000014; otherwise, this field MUST NOT be present.
+    uint32 device_name_offset_unicode;           // An optional, 32-bit, unsigned integer that specifies the location of the DeviceNameUnicode field. This value is an offset, in bytes, from the start of the CommonNetworkRelativeLink structure. This field MUST be present if the value of the NetNameOffset field is greater than 0x00000014; otherwise, this field MUST NOT be present.
+    NET_NAME net_name;
+    DEVICE_NAME device_name;
+    wchar  net_name_unicode[];                   // An optional, NULL–terminated, Unicode string that is the Unicode version of the NetName string. This field MUST be present if the value of the NetNameOffset field is greater than 0x00000014; otherwise, this field MUST NOT be present.
+    wchar  device_name_unicode[];                // An optional, NULL–terminated, Unicode string that is the Unicode version of the DeviceName string. This field MUST be present if the value of the NetNameOffset field is greater than 0x00000014; otherwise, this field MUST NOT be present.
+};
+
 typedef struct LINK_INFO_FLAGS1 {
     uint32  volumeid_and_local_basepath:1;                 // If set, the VolumeID and LocalBasePath fields are present, and their locations are specified by the values of the VolumeIDOffset and LocalBasePathOffset fields, respectively. If the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024, the LocalBasePathUnicode field is present, and its location is specified by the value of the LocalBasePathOffsetUnicode field. If not set, the VolumeID, LocalBasePath, and LocalBasePathUnicode fields are not present, and the values of the VolumeIDOffset and LocalBasePathOffset fields are zero. If the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024, the value of the LocalBasePathOffsetUnicode field is zero.
     uint32  common_network_relative_link_and_pathsuffix:1; // If set, the CommonNetworkRelativeLink field is present, and its location is specified by the value of the CommonNetworkRelativeLinkOffset field. If not set, the CommonNetworkRelativeLink field is not present, and the value of the CommonNetworkRelativeLinkOffset field is zero.
@@ -257,14 +269,14 @@ typedef struct SERIALIZED_PROPERTY_STRING_VALUE {
     uint32  name_size;                  // An unsigned integer that specifies the size, in bytes, of the Name field, including the null-terminating character.
     char    reserved;                   // must be 0x00
     char    name[name_size];            // A null-terminated Unicode string that specifies the identity of the property. It has to be unique within the enclosing Serialized Property Storage structure.
-    TYPED_PROPERTY_VALUE value[value_size - name_size - 9];       // A TypedPropertyValue structure, as specified in [MS-OLEPS] section 2.15.
+    char    value[value_size - name_size - 9];       // A TypedPropertyValue structure, as specified in [MS-OLEPS] section 2.15.
 };
 
 typedef struct SERIALIZED_PROPERTY_INTEGER_VALUE {
     uint32  value_size;                 // An unsigned integer that specifies the total size, in bytes, of this structure. It MUST be 0x00000000 if this is the last Serialized Property Value in the enclosing Serialized Property Storage structure.
     uint32  id;                         // An unsigned integer that specifies the identity of the property. It MUST be unique within the enclosing Serialized Property Storage structure.
     char    reserved;                   // Must be 0x00
-    TYPED_PROPERTY_VALUE value[value_size - 9];  // A TypedPropertyValue structure, as specified in [MS-OLEPS] section 2.15
+    char    value[value_size - 9];      // A TypedPropertyValue structure, as specified in [MS-OLEPS] section 2.15
 };
 
 typedef struct PROPERTY_STORE_PROPS {
@@ -280,6 +292,14 @@ typedef struct CUSTOMDESTINATION_LINK_HEADER {
     char customdestination_clsid[16];
 }
 
+typedef struct CONSOLE_FE_PROPS {
+    uint32 codepage;                    // A 32-bit, unsigned integer that specifies a code page language code identifier. For details concerning the structure of LCIDs, see [MS-LCID].
+};
+
+typedef struct SHIM_PROPS {
+    wchar layer_name[];                 // A Unicode string that specifies the name of a shim layer to apply to a link target when it is being activated.
+};
+
 typedef struct VISTA_AND_ABOVE_IDLIST_PROPS {
     //uint32 block_size;              // A 32-bit, unsigned integer that specifies the size of the VistaAndAboveIDListDataBlock structure. This value MUST be greater than or equal to 0x0000000A.
     //uint32 block_signature;         // A 32-bit, unsigned integer that specifies the signature of the VistaAndAboveIDListDataBlock extra data section. This value MUST be 0xA000000C.
@@ -336,6 +356,11 @@ typedef struct KNOWN_FOLDER_PROPS {
     uint32 local_basepath_offset_unicode;       // An optional, 32-bit, unsigned integer that specifies the location of the LocalBasePathUnicode field. If the VolumeIDAndLocalBasePath flag is set, this value is an offset, in bytes, from the start of the LinkInfo structure; otherwise, this value MUST be zero. This field can be present only if the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024.
     uint32 common_pathsuffix_offset_unicode;    // An optional, 32-bit, unsigned integer that specifies the location of the CommonPathSuffixUnicode field. This value is an offset, in bytes, from the start of the LinkInfo structure. This field can be present only if the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024.
     VOLUME_ID_UNICODE volumeid;                 // An optional VolumeID structure (section 2.3.1) that specifies information about the volume that the link target was on when the link was created. This field is present if the VolumeIDAndLocalBasePath flag is set.
+    char local_base_path[];                     // An optional, NULL–terminated string, defined by the system default code page, which is used to construct the full path to the link item or link target by appending the string in the CommonPathSuffix field. This field is present if the VolumeIDAndLocalBasePath flag is set.
+    COMMON_NETWORK_RELATIVE_LINK_UNICODE common_network_relative_link;  // An optional CommonNetworkRelativeLink structure (section 2.3.2) that specifies information about the network location where the link target is stored.
+    char common_path_suffix[];                  // A NULL–terminated string, defined by the system default code page, which is used to construct the full path to the link item or link target by being appended to the string in the LocalBasePath field.
+    wchar local_base_path_unicode[];            // An optional, NULL–terminated, Unicode string that is used to construct the full path to the link item or link target by appending the string in the CommonPathSuffixUnicode field. This field can be present only if the VolumeIDAndLocalBasePath flag is set and the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024.
+    wchar common_path_suffix_unicode[];         // An optional, NULL–terminated, Unicode string that is used to construct the full path to the link item or link target by being appended to the string in the LocalBasePathUnicode field. This field can be present only if the value of the LinkInfoHeaderSize field is greater than or equal to 0x00000024.
 };
 """  # noqa E501
 
@@ -385,6 +410,8 @@ class EXTRA_DATA_BLOCK_SIGNATURES(IntEnum):
 LINK_HEADER_SIZE = 0x4C
 LINK_INFO_HEADER_SIZE = 0x0C
 LINK_INFO_BODY_SIZE = 0x10
+LINK_INFO_UNICODE_HEADER_SIZE = 0x24
+COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE = 0x14
 LINK_EXTRA_DATA_HEADER_SIZE = 0x08
 
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from dissect.shellitem.lnk.lnk import RECORD_PROJECTION, Lnk
+from dissect.shellitem.lnk.record import RECORD_FIELDS, LnkRecord
+
+if TYPE_CHECKING:
+    import os
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+# Version of the layout of the persistent store, a store with a different version is cleared when it is opened
+STORE_VERSION = 1
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Returned by ParseCache.lookup() for files that are not in the cache
+MISSING = _Missing()
+
+
+def content_key(data: bytes | memoryview) -> bytes:
+    """Return the cache key of the contents of a LNK file, a 128-bit BLAKE2b digest."""
+    return blake2b(data, digest_size=16).digest()
+
+
+class ParseCache:
+    """A cache of parsed LNK files, keyed by a hash of their contents.
+
+    Identical LNK files, such as the default shortcuts found on every installation, are parsed once. The parsed
+    :class:`LnkRecord` of the most recently used ``maxsize`` files are kept in memory. If ``path`` is given, all
+    records are also kept in a SQLite database, which can be shared between runs and is consulted on a miss in memory.
+
+    Files without a valid LNK header are cached as ``None``. Records are only derived from the contents of a file,
+    so they can be shared between files with different paths.
+
+    Args:
+        maxsize: Maximum number of records to keep in memory.
+        path: Path of the SQLite database to store the records in, or ``None`` to only keep them in memory.
+        commit_every: Number of new records after which they are committed to the database.
+    """
+
+    def __init__(self, maxsize: int = 65536, path: str | os.PathLike | None = None, commit_every: int = 1000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+
+        self._records: OrderedDict[bytes, LnkRecord | None] = OrderedDict()
+        self._uncommitted = 0
+        self._db = None
+        if path is not None:
+            self._db = self._open(path)
+
+    @staticmethod
+    def _open(path: str | os.PathLike) -> sqlite3.Connection:
+        db = sqlite3.connect(path)
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute("CREATE TABLE IF NOT EXISTS records (key BLOB PRIMARY KEY, record TEXT)")
+
+        layout = json.dumps([STORE_VERSION, RECORD_FIELDS])
+        row = db.execute("SELECT value FROM meta WHERE key = 'layout'").fetchone()
+        if row is None or row[0] != layout:
+            # Records stored with a different layout can't be read, start over
+            db.execute("DELETE FROM records")
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('layout', ?)", (layout,))
+        db.commit()
+        return db
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._records or self._load(key) is not MISSING
+
+    def __getitem__(self, key: bytes) -> LnkRecord | None:
+        """Return the record of the file with the given key, see :func:`content_key`."""
+        try:
+            record = self._records[key]
+        except KeyError:
+            record = self._load(key)
+            if record is MISSING:
+                raise
+            self._remember(key, record)
+        else:
+            self._records.move_to_end(key)
+        return record
+
+    def __setitem__(self, key: bytes, record: LnkRecord | None) -> None:
+        self._remember(key, record)
+
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?)", (key, record.to_json() if record is not None else None)
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.flush()
+
+    def _remember(self, key: bytes, record: LnkRecord | None) -> None:
+        self._records[key] = record
+        self._records.move_to_end(key)
+        if len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+
+    def _load(self, key: bytes) -> LnkRecord | None | object:
+        if self._db is None:
+            return MISSING
+
+        row = self._db.execute("SELECT record FROM records WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return MISSING
+        return LnkRecord.from_json(row[0]) if row[0] is not None else None
+
+    def lookup(self, key: bytes) -> LnkRecord | None | object:
+        """Return the record of the file with the given key, or :data:`MISSING` if it isn't cached.
+
+        Unlike item access, the hit and miss counters are updated.
+        """
+        try:
+            record = self[key]
+        except KeyError:
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        return record
+
+    def parse(self, data: bytes | memoryview) -> LnkRecord | None:
+        """Return the record of a LNK file, parsing it only if identical contents weren't parsed before.
+
+        Args:
+            data: The contents of the LNK file.
+
+        Returns:
+            The record, or ``None`` if the file doesn't have a valid LNK header.
+        """
+        key = content_key(data)
+        if (record := self.lookup(key)) is not MISSING:
+            return record
+
+        lnk = Lnk.from_buffer(data, fields=RECORD_PROJECTION)
+        record = lnk.to_record() if lnk.link_header else None
+        self[key] = record
+        return record
+
+    def flush(self) -> None:
+        """Commit the new records to the database."""
+        if self._db is not None:
+            self._db.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit the new records and close the database."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
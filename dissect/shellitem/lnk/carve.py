@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+from itertools import repeat
+from pathlib import Path
+from struct import pack
+from typing import TYPE_CHECKING, BinaryIO
+
+from dissect.shellitem.lnk.c_lnk import LINK_HEADER_SIZE
+from dissect.shellitem.lnk.header import LINK_CLSID_BYTES
+from dissect.shellitem.lnk.limits import DEFAULT_LIMITS
+from dissect.shellitem.lnk.lnk import Lnk
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+    from mmap import mmap
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+# Every LNK file starts with its header size followed by the LNK CLSID
+LNK_SIGNATURE = pack("<I", LINK_HEADER_SIZE) + LINK_CLSID_BYTES
+
+CARVE_CHUNK_SIZE = 16 * 1024 * 1024
+CARVE_SHARD_SIZE = 256 * 1024 * 1024
+
+
+def find_signatures(
+    source: BinaryIO | bytes | bytearray | mmap,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = CARVE_CHUNK_SIZE,
+) -> Iterator[int]:
+    """Find the offsets of all LNK header signatures in a buffer or file-like object.
+
+    Buffers that support ``find()``, such as ``bytes`` and ``mmap``, are searched in place. File-like objects are
+    read in large chunks that overlap by the length of the signature, so signatures spanning two chunks are found.
+
+    Args:
+        source: The buffer or file-like object to search.
+        start: Offset to start searching at.
+        end: Offset to stop searching at. Signatures must start before this offset, but may extend beyond it.
+        chunk_size: Size of the chunks to read from file-like objects.
+
+    Returns:
+        An iterator of the offsets of the signatures, in ascending order.
+    """
+    if hasattr(source, "find"):
+        limit = len(source) if end is None else min(end + len(LNK_SIGNATURE) - 1, len(source))
+        offset = source.find(LNK_SIGNATURE, start, limit)
+        while offset != -1:
+            yield offset
+            offset = source.find(LNK_SIGNATURE, offset + 1, limit)
+        return
+
+    overlap = len(LNK_SIGNATURE) - 1
+    position = start
+
+    while end is None or position < end:
+        read_size = chunk_size if end is None else min(chunk_size, end - position + overlap)
+        source.seek(position)
+        data = source.read(read_size)
+
+        offset = data.find(LNK_SIGNATURE)
+        while offset != -1 and (end is None or position + offset < end):
+            yield position + offset
+            offset = data.find(LNK_SIGNATURE, offset + 1)
+
+        if len(data) < read_size or len(data) <= overlap:
+            break
+
+        # A complete signature can never start in the overlap, so no signature is found twice
+        position += len(data) - overlap
+
+
+def carve(
+    source: BinaryIO | bytes | bytearray | mmap,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = CARVE_CHUNK_SIZE,
+    lazy: bool = False,
+) -> Iterator[tuple[int, Lnk]]:
+    """Carve LNK files from a raw image, pagefile or memory dump.
+
+    Every signature hit is validated by parsing the LNK header at that offset. Unless ``lazy`` is set, the remainder
+    of the LNK file is parsed as well and hits that fail to parse are skipped.
+
+    Args:
+        source: The buffer or file-like object to carve from.
+        start: Offset to start carving at.
+        end: Offset to stop carving at.
+        chunk_size: Size of the chunks to read from file-like objects.
+        lazy: Whether to only validate the header and decode the remaining sections on access.
+
+    Returns:
+        An iterator of ``(offset, Lnk)`` tuples.
+    """
+    is_buffer = not hasattr(source, "read")
+
+    for offset in find_signatures(source, start, end, chunk_size):
+        try:
+            if is_buffer:
+                lnk = Lnk.from_buffer(source, offset, lazy=lazy)
+            else:
+                source.seek(offset)
+                lnk = Lnk(source, lazy=lazy)
+        except Exception as e:
+            log.debug("Discarding LNK candidate at offset 0x%x: %s", offset, e)
+            continue
+
+        if lnk.link_header:
+            yield offset, lnk
+
+
+def carve_parallel(
+    path: str | os.PathLike,
+    workers: int | None = None,
+    shard_size: int = CARVE_SHARD_SIZE,
+    chunk_size: int = CARVE_CHUNK_SIZE,
+) -> Iterator[tuple[int, Lnk]]:
+    """Carve LNK files from a large image file, spreading the work over a pool of worker processes.
+
+    The image is split in shards that are searched and validated by the workers, which send back the offset and the
+    bytes of every valid hit. Every returned :class:`Lnk` owns its bytes, so it stays usable after the iteration ends.
+    The workers already parsed the files in full, so only the header is decoded again in this process, the remaining
+    sections are decoded from the owned bytes on access.
+
+    Args:
+        path: Path to the image file.
+        workers: Number of worker processes, defaults to the number of CPUs.
+        shard_size: Size of the part of the image searched by a worker at once.
+        chunk_size: Size of the chunks read by the workers.
+
+    Returns:
+        An iterator of ``(offset, Lnk)`` tuples, in ascending order of offset.
+    """
+    # concurrent.futures is only needed here, importing it up front would slow down importing the package
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = Path(path)
+    size = path.stat().st_size
+    starts = range(0, size, shard_size)
+    ends = [min(start + shard_size, size) for start in starts]
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        shards = executor.map(_carve_shard, repeat(str(path)), starts, ends, repeat(chunk_size))
+        for hits in shards:
+            for offset, data in hits:
+                yield offset, Lnk.from_buffer(data, lazy=True)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _carve_shard(path: str, start: int, end: int, chunk_size: int) -> list[tuple[int, bytes]]:
+    hits = []
+    with Path(path).open("rb") as fh:
+        for offset, lnk in carve(fh, start, end, chunk_size):
+            # The size is unknown if the limits cut the file short, send as much as the parser would look at
+            size = lnk.size if lnk.size is not None else DEFAULT_LIMITS.max_file_size
+            fh.seek(offset)
+            hits.append((offset, fh.read(size)))
+    return hits
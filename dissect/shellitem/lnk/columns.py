@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from struct import unpack
+from typing import TYPE_CHECKING
+
+from dissect.shellitem.lnk.c_lnk import LINK_HEADER_SIZE
+from dissect.shellitem.lnk.carve import find_signatures
+from dissect.shellitem.lnk.header import LINK_CLSID_BYTES
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from mmap import mmap
+
+# Fixed-width fields of the SHELL_LINK_HEADER that are returned as columns, in output order
+HEADER_COLUMNS = (
+    "creation_time",
+    "access_time",
+    "write_time",
+    "filesize",
+    "link_flags",
+    "file_flags",
+    "show_command",
+    "icon_index",
+)
+
+# Fields that hold a FILETIME, which are returned as datetime64 columns
+TIMESTAMP_COLUMNS = ("creation_time", "access_time", "write_time")
+
+# Number of 100 nanosecond intervals between the FILETIME epoch (1601-01-01) and the Unix epoch (1970-01-01)
+FILETIME_UNIX_OFFSET = 116444736000000000
+
+# The LNK CLSID as two little endian 64-bit integers, so it can be compared on whole columns at once
+_LINK_CLSID_QWORDS = unpack("<QQ", LINK_CLSID_BYTES)
+
+if HAS_NUMPY:
+    # Layout of the SHELL_LINK_HEADER structure, see c_lnk.SHELL_LINK_HEADER
+    HEADER_DTYPE = np.dtype(
+        {
+            "names": [
+                "header_size",
+                "clsid_low",
+                "clsid_high",
+                "link_flags",
+                "file_flags",
+                "creation_time",
+                "access_time",
+                "write_time",
+                "filesize",
+                "icon_index",
+                "show_command",
+            ],
+            "formats": ["<u4", "<u8", "<u8", "<u4", "<u4", "<u8", "<u8", "<u8", "<u4", "<u4", "<u4"],
+            "offsets": [0, 4, 12, 20, 24, 28, 36, 44, 52, 56, 60],
+            "itemsize": LINK_HEADER_SIZE,
+        }
+    )
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for columnar header scans, install dissect.shellitem[full]")
+
+
+def filetime_to_datetime64(values: np.ndarray) -> np.ndarray:
+    """Convert an array of FILETIME values to ``datetime64[us]`` values in UTC.
+
+    Zero values, which mean that a timestamp isn't set, and values that can't be represented are converted to
+    ``NaT``.
+    """
+    _require_numpy()
+
+    values = np.asarray(values, dtype=np.uint64)
+    unset = (values == 0) | (values > np.iinfo(np.int64).max)
+
+    result = ((values.astype(np.int64) - FILETIME_UNIX_OFFSET) // 10).astype("datetime64[us]")
+    result[unset] = np.datetime64("NaT")
+    return result
+
+
+def read_header_columns(buffers: Iterable[bytes | bytearray | memoryview | mmap]) -> dict[str, np.ndarray]:
+    """Decode the SHELL_LINK_HEADER of many LNK files into column arrays.
+
+    Only the header of every buffer is copied, after which all headers are validated and decoded at once. Buffers
+    that don't start with a valid header are left out, use the ``index`` column to find the buffer of a row.
+
+    Args:
+        buffers: The contents, or at least the first 76 bytes, of the LNK files.
+
+    Returns:
+        A dictionary of equally long arrays: ``index``, the position of the buffer in ``buffers``, followed by the
+        :data:`HEADER_COLUMNS`. Timestamps are ``datetime64[us]`` values in UTC, with ``NaT`` for unset timestamps.
+    """
+    _require_numpy()
+
+    data = bytearray()
+    truncated = []
+    for index, buf in enumerate(buffers):
+        header = bytes(buf[:LINK_HEADER_SIZE])
+        if len(header) < LINK_HEADER_SIZE:
+            truncated.append(index)
+            header = header.ljust(LINK_HEADER_SIZE, b"\x00")
+        data += header
+
+    headers = np.frombuffer(data, dtype=HEADER_DTYPE)
+    complete = np.ones(len(headers), dtype=bool)
+    complete[truncated] = False
+    return _columns("index", np.arange(len(headers), dtype=np.int64), headers, complete)
+
+
+def carve_header_columns(
+    source: bytes | bytearray | mmap,
+    offsets: Iterable[int] | None = None,
+    start: int = 0,
+    end: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Decode the SHELL_LINK_HEADER of all LNK files in a raw image, pagefile or memory dump into column arrays.
+
+    The headers are gathered from the image and decoded at once, without parsing the remainder of the LNK files.
+    See :func:`read_header_columns` for the columns.
+
+    Args:
+        source: The buffer to carve from.
+        offsets: Offsets of the headers, defaults to the offsets of all LNK signatures in the buffer.
+        start: Offset to start searching for signatures at, if no offsets are given.
+        end: Offset to stop searching for signatures at, if no offsets are given.
+
+    Returns:
+        A dictionary of equally long arrays: ``offset``, the offset of the header in ``source``, followed by the
+        :data:`HEADER_COLUMNS`.
+    """
+    _require_numpy()
+
+    if offsets is None:
+        offsets = find_signatures(source, start, end)
+
+    offsets = np.fromiter(offsets, dtype=np.int64)
+    offsets = offsets[(offsets >= 0) & (offsets <= len(source) - LINK_HEADER_SIZE)]
+
+    image = np.frombuffer(source, dtype=np.uint8)
+    # Fancy indexing copies the headers into a single contiguous array
+    rows = image[offsets[:, None] + np.arange(LINK_HEADER_SIZE)]
+    del image
+
+    headers = rows.view(HEADER_DTYPE).reshape(-1)
+    return _columns("offset", offsets, headers)
+
+
+def _columns(
+    key: str, positions: np.ndarray, headers: np.ndarray, complete: np.ndarray | None = None
+) -> dict[str, np.ndarray]:
+    valid = (
+        (headers["header_size"] == LINK_HEADER_SIZE)
+        & (headers["clsid_low"] == _LINK_CLSID_QWORDS[0])
+        & (headers["clsid_high"] == _LINK_CLSID_QWORDS[1])
+    )
+    if complete is not None:
+        valid &= complete
+    headers = headers[valid]
+
+    columns = {key: positions[valid]}
+    for name in HEADER_COLUMNS:
+        if name in TIMESTAMP_COLUMNS:
+            columns[name] = filetime_to_datetime64(headers[name])
+        else:
+            columns[name] = headers[name].astype(np.uint32)
+    return columns
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from struct import Struct
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import UUID
+
+from dissect.shellitem.guid import registry
+from dissect.shellitem.lnk.c_lnk import LINK_HEADER_SIZE, c_lnk
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+LINK_CLSID = UUID("00021401-0000-0000-c000-000000000046")
+LINK_CLSID_BYTES = LINK_CLSID.bytes_le
+
+# Fixed layout of the SHELL_LINK_HEADER structure, see c_lnk.SHELL_LINK_HEADER
+_SHELL_LINK_HEADER = Struct("<I16sIIQQQIIIBBHII")
+
+
+class HotkeyFlags(NamedTuple):
+    keycode: int
+    modifier: int
+
+
+class LinkHeader:
+    """A decoded SHELL_LINK_HEADER structure, with the same field names as ``c_lnk.SHELL_LINK_HEADER``.
+
+    The flags are stored as integers and returned as ``c_lnk.LINK_FLAGS`` and ``c_lnk.FILE_ATTRIBUTE`` flags, like
+    the fields of the ``cstruct`` structure. Use :meth:`structure` to get the header as a ``cstruct`` structure.
+    """
+
+    __slots__ = (
+        "_file_flags",
+        "_link_flags",
+        "access_time",
+        "creation_time",
+        "filesize",
+        "header_size",
+        "hotkey_flags",
+        "icon_index",
+        "link_clsid",
+        "reserved1",
+        "reserved2",
+        "reserved3",
+        "show_command",
+        "write_time",
+    )
+
+    # The names of the fields of the header
+    FIELDS = (
+        "header_size",
+        "link_clsid",
+        "link_flags",
+        "file_flags",
+        "creation_time",
+        "access_time",
+        "write_time",
+        "filesize",
+        "icon_index",
+        "show_command",
+        "hotkey_flags",
+        "reserved1",
+        "reserved2",
+        "reserved3",
+    )
+
+    def __init__(
+        self,
+        header_size: int,
+        link_clsid: bytes,
+        link_flags: int,
+        file_flags: int,
+        creation_time: int,
+        access_time: int,
+        write_time: int,
+        filesize: int,
+        icon_index: int,
+        show_command: int,
+        keycode: int,
+        modifier: int,
+        reserved1: int,
+        reserved2: int,
+        reserved3: int,
+    ):
+        self.header_size = header_size
+        self.link_clsid = link_clsid
+        self._link_flags = int(link_flags)
+        self._file_flags = int(file_flags)
+        self.creation_time = creation_time
+        self.access_time = access_time
+        self.write_time = write_time
+        self.filesize = filesize
+        self.icon_index = icon_index
+        self.show_command = show_command
+        self.hotkey_flags = HotkeyFlags(keycode, modifier)
+        self.reserved1 = reserved1
+        self.reserved2 = reserved2
+        self.reserved3 = reserved3
+
+    def __repr__(self) -> str:
+        return (
+            f"<LinkHeader link_flags={self._link_flags:#x} file_flags={self._file_flags:#x} "
+            f"creation_time={self.creation_time:#x} access_time={self.access_time:#x} "
+            f"write_time={self.write_time:#x} filesize={self.filesize:#x}>"
+        )
+
+    @property
+    def link_flags(self) -> c_lnk.LINK_FLAGS:
+        return c_lnk.LINK_FLAGS(self._link_flags)
+
+    @link_flags.setter
+    def link_flags(self, value: int) -> None:
+        self._link_flags = int(value)
+
+    @property
+    def file_flags(self) -> c_lnk.FILE_ATTRIBUTE:
+        return c_lnk.FILE_ATTRIBUTE(self._file_flags)
+
+    @file_flags.setter
+    def file_flags(self, value: int) -> None:
+        self._file_flags = int(value)
+
+    @property
+    def clsid(self) -> UUID:
+        return registry.guid(self.link_clsid)
+
+    def dumps(self) -> bytes:
+        """Returns the header serialized as a SHELL_LINK_HEADER structure."""
+        return _SHELL_LINK_HEADER.pack(
+            self.header_size,
+            self.link_clsid,
+            self._link_flags,
+            self._file_flags,
+            self.creation_time,
+            self.access_time,
+            self.write_time,
+            self.filesize,
+            self.icon_index,
+            self.show_command,
+            *self.hotkey_flags,
+            self.reserved1,
+            self.reserved2,
+            self.reserved3,
+        )
+
+    def structure(self) -> c_lnk.SHELL_LINK_HEADER:
+        """Returns the header as a ``c_lnk.SHELL_LINK_HEADER`` structure, with the flags as flag types."""
+        return c_lnk.SHELL_LINK_HEADER(self.dumps())
+
+
+def read_header(buf: bytes | bytearray | memoryview | mmap, offset: int = 0) -> LinkHeader | None:
+    """Decode the SHELL_LINK_HEADER at the given offset in a buffer.
+
+    The header size and CLSID are checked on the raw bytes before anything is decoded.
+
+    Args:
+        buf: A bytes-like object, ``memoryview`` or ``mmap`` containing the header.
+        offset: Offset of the header within the buffer.
+
+    Returns:
+        The decoded header, or ``None`` if the buffer doesn't contain a valid header at the given offset.
+    """
+    if len(buf) - offset < LINK_HEADER_SIZE or buf[offset + 4 : offset + 20] != LINK_CLSID_BYTES:
+        return None
+
+    values = _SHELL_LINK_HEADER.unpack_from(buf, offset)
+    if values[0] != LINK_HEADER_SIZE:
+        return None
+
+    return LinkHeader(*values)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+
+class LimitExceeded(ValueError):
+    """Raised when a size or count field of a LNK file exceeds a :class:`Limits` value in strict mode."""
+
+
+class Limits(NamedTuple):
+    """Bounds on the size and count fields of a LNK file, which are enforced before anything is read or allocated.
+
+    The size fields of a LNK file are attacker controlled, so without bounds a crafted file of a few bytes can make
+    the parser allocate gigabytes. In strict mode a field that exceeds a limit raises :class:`LimitExceeded`. In
+    lenient mode, the default, the section is truncated at the limit and the violation is recorded as an anomaly,
+    see :attr:`Lnk.anomalies <dissect.shellitem.lnk.lnk.Lnk.anomalies>`.
+
+    The defaults are far above the sizes seen in legitimate LNK files.
+    """
+
+    max_file_size: int = 16 * 1024 * 1024
+    """Maximum number of bytes of a LNK file, sections beyond it are not parsed."""
+    max_block_size: int = 1024 * 1024
+    """Maximum size of the LINK_INFO structure and of a single extra data block."""
+    max_block_count: int = 65536
+    """Maximum number of extra data blocks."""
+    max_idlist_items: int = 4096
+    """Maximum number of ITEMID structures in an IDList."""
+    max_string_length: int = 32768
+    """Maximum number of characters of a STRING_DATA string."""
+    strict: bool = False
+    """Whether to raise :class:`LimitExceeded` instead of truncating and recording an anomaly."""
+
+    def check(self, name: str, value: int, what: str, anomalies: list[str]) -> bool:
+        """Check a value against one of the limits.
+
+        Args:
+            name: Name of the limit, for example ``max_block_size``.
+            value: The size or count read from the file.
+            what: Description of the value, used in the anomaly or exception.
+            anomalies: The list to record the anomaly in, in lenient mode.
+
+        Returns:
+            Whether the value is within the limit. If not, the caller should truncate.
+
+        Raises:
+            LimitExceeded: If the value exceeds the limit in strict mode.
+        """
+        limit = getattr(self, name)
+        if value <= limit:
+            return True
+
+        message = f"{what} of {value:#x} exceeds {name} of {limit:#x}"
+        if self.strict:
+            raise LimitExceeded(message)
+
+        log.warning("%s, truncating", message)
+        anomalies.append(message)
+        return False
+
+
+DEFAULT_LIMITS = Limits()
@@ -1,38 +1,133 @@
 from __future__ import annotations
 
+import io
 import logging
 import typing
-from io import BytesIO
-from struct import unpack
-from typing import Any, BinaryIO
+from functools import cached_property
+from struct import unpack, unpack_from
+from typing import Any, BinaryIO, NamedTuple
 from uuid import UUID
 
-from dissect.util.stream import RangeStream
+from dissect.util import ts
 
+from dissect.shellitem.guid import guid_name, registry
+from dissect.shellitem.item import ShellItemList
 from dissect.shellitem.lnk.c_lnk import (
+    COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE,
     EXTRA_DATA_BLOCK_SIGNATURES,
     LINK_EXTRA_DATA_HEADER_SIZE,
     LINK_HEADER_SIZE,
     LINK_INFO_BODY_SIZE,
     LINK_INFO_HEADER_SIZE,
+    LINK_INFO_UNICODE_HEADER_SIZE,
     c_lnk,
 )
+from dissect.shellitem.lnk.header import read_header
+from dissect.shellitem.lnk.limits import DEFAULT_LIMITS
+from dissect.shellitem.lnk.propstore import PropertyStore
+from dissect.shellitem.lnk.record import RECORD_FIELDS, LnkRecord
+from dissect.shellitem.util import ViewStream
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
     from io import BufferedReader
+    from mmap import mmap
+
+    from dissect.shellitem.lnk.aio import AsyncReader
+    from dissect.shellitem.lnk.header import LinkHeader
+    from dissect.shellitem.lnk.limits import Limits
 
 log = logging.getLogger(__name__)
 logging.lastResort = None
 logging.raiseExceptions = False
 
+# Section names used in field paths and the Lnk attributes they are stored in
+LNK_SECTIONS = {
+    "header": "link_header",
+    "link_header": "link_header",
+    "target_idlist": "target_idlist",
+    "linkinfo": "linkinfo",
+    "stringdata": "stringdata",
+    "extradata": "extradata",
+}
+
+# The sections and extra data blocks needed to build the dictionary returned by Lnk.to_dict()
+RECORD_PROJECTION = ("header", "linkinfo", "stringdata", "extradata.TRACKER_PROPS", "extradata.KNOWN_FOLDER_PROPS")
+
+
+def _decode(value: Any, codepage: str = "utf-8") -> str | None:
+    if isinstance(value, bytes):
+        return value.decode(codepage, errors="backslashreplace")
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def _wintimestamp(value: int) -> datetime | None:
+    if not value:
+        return None
+
+    try:
+        return ts.wintimestamp(value)
+    except (OverflowError, ValueError):
+        return None
+
+
+def _read_cstring(buf: bytes | memoryview, offset: int) -> bytes:
+    """Read a NULL-terminated string at the given offset, bounded by the end of the buffer."""
+    if isinstance(buf, memoryview):
+        # memoryview has no find(), so only copy the part that has to be searched
+        buf = buf[offset:].tobytes()
+        offset = 0
+
+    end = buf.find(b"\x00", offset)
+    return bytes(buf[offset:]) if end == -1 else bytes(buf[offset:end])
+
+
+def _read_wstring(buf: bytes | memoryview, offset: int) -> str:
+    """Read a NULL-terminated UTF-16 string at the given offset, bounded by the end of the buffer."""
+    data = bytes(buf[offset:])
+
+    # the terminator must be aligned to a character boundary
+    end = data.find(b"\x00\x00")
+    while end != -1 and end & 1:
+        end = data.find(b"\x00\x00", end + 1)
+    if end == -1:
+        end = len(data) & ~1
+
+    return data[:end].decode("utf-16-le", errors="surrogatepass")
+
+
+class ExtraDataBlock(NamedTuple):
+    """Location of an EXTRA_DATA_BLOCK, as found by walking the block headers of an EXTRA_DATA structure."""
+
+    offset: int
+    size: int
+    signature: int
+
+    @property
+    def name(self) -> str | None:
+        return EXTRA_DATA_BLOCK_SIGNATURES.get_name(self.signature)
+
 
 class LnkExtraData:
     """Class that represents the a LNK file's EXTRA_DATA structure.
 
     This optional structure hold additional optional structures that convey additional information about a link target
 
+    The block headers are walked first into an index of :class:`ExtraDataBlock` entries, after which only the blocks
+    with the requested signatures are decoded. Blocks that are not decoded up front are decoded on first attribute
+    access, for which the file-like object must remain open.
+
+    Blocks larger than ``limits.max_block_size`` are left out of the index, and the walk stops after
+    ``limits.max_block_count`` blocks or at ``limits.max_file_size``, see :class:`~dissect.shellitem.lnk.limits.Limits`.
+
     Args:
         fh: A file-like object to an EXTRA_DATA structure
+        signatures: Names or signatures of the blocks to decode up front, or ``None`` to decode all blocks.
+        limits: The limits to enforce, defaults to :data:`~dissect.shellitem.lnk.limits.DEFAULT_LIMITS`.
+        file_offset: Offset of the EXTRA_DATA structure within the LNK file, to enforce ``limits.max_file_size``.
     """
 
     # EXTRA_DATA = *EXTRA_DATA_BLOCK TERMINAL_BLOCK
@@ -43,87 +138,175 @@ class LnkExtraData:
     #                    SHIM_PROPS / SPECIAL_FOLDER_PROPS /
     #                    TRACKER_PROPS / VISTA_AND_ABOVE_IDLIST_PROPS
     # This is kinda the same as LnkStringData only that the defined extra structures can wildly vary
-    def __init__(self, fh: BinaryIO | None = None):
+    def __init__(
+        self,
+        fh: BinaryIO | None = None,
+        signatures: Iterable[str | int] | None = None,
+        limits: Limits | None = None,
+        file_offset: int = 0,
+    ):
+        self.fh = fh
+        self.limits = limits or DEFAULT_LIMITS
+        self.size = None
         self.extradata = {}
+        self.blocks = []
+        self.terminal_block = None
+        self.anomalies = []
+        self._decoded = set()
 
         if fh:
-            self._parse(fh)
-
-    def _parse(self, fh: BinaryIO) -> None:
-        self.size = c_lnk.uint32(fh)
-
-        if self.size == 0x00000000:
-            # terminal block encountered. end of lnk file
-            self.extradata.update({"TERMINAL_BLOCK": c_lnk.EXTRA_DATA(extra_data_block=None, terminal_block=self.size)})
-            return
-
-        signature = c_lnk.uint32(fh)
-        block_name = EXTRA_DATA_BLOCK_SIGNATURES.get_name(signature)
-
-        if block_name:
-            read_size = self.size - LINK_EXTRA_DATA_HEADER_SIZE
-            block_data = memoryview(fh.read(read_size))
-
-            if len(block_data) != read_size:
-                # Some malicious lnk files have a mismatch in the size indicated in the data block and actual bytes red.
-                # This causes cstruct to have an EOFError when trying to parse the actual size. Which is not reflected.
-                log.warning(
-                    "Mismatch in read size (%i) and actual EXTRA_DATA_BLOCK length (%i) for data block (%s)",
-                    read_size,
-                    len(block_data),
-                    block_name,
-                )
-                return
+            self._parse(fh, file_offset)
+            self.decode(signatures)
 
-            if block_name == "VISTA_AND_ABOVE_IDLIST_PROPS":
-                struct = LnkTargetIdList(BytesIO(block_data), read_size)
-            else:
-                struct = c_lnk.typedefs[block_name](block_data)
-
-            if block_name == "PROPERTY_STORE_PROPS":
-                # TODO implement actual serialized property parsing
-                guid = self._parse_guid(struct.format_id)
-                struct.format_id = guid
-
-            elif block_name == "TRACKER_PROPS":
-                for name in struct.fields:
-                    if "droid" in name:
-                        guid = self._parse_guid(getattr(struct, name))
-                        setattr(struct, name, guid)
-
-            elif block_name == "KNOWN_FOLDER_PROPS":
-                guid = self._parse_guid(struct.known_folder_id)
-                struct.known_folder_id = guid
-
-            elif (
-                block_name == "ENVIRONMENT_PROPS"
-                or block_name == "ICON_ENVIRONMENT_PROPS"
-                or block_name == "DARWIN_PROPS"
-            ):
-                if block_name == "DARWIN_PROPS":
-                    struct.darwin_data_ansi = struct.darwin_data_ansi
-                    struct.darwin_data_unicode = struct.darwin_data_unicode.decode().rstrip("\x00")
-                else:
-                    struct.target_ansi = struct.target_ansi
-                    struct.target_unicode = struct.target_unicode.decode("utf-16").rstrip("\x00")
+    def _parse(self, fh: BinaryIO, file_offset: int = 0) -> None:
+        """Walk the EXTRA_DATA_BLOCK headers into an index of block locations, without decoding the blocks."""
+        start = offset = fh.tell()
+        count = 0
+
+        # Walk the blocks iteratively until the TERMINAL_BLOCK is hit, a block can never contain another block.
+        while len(header := fh.read(LINK_EXTRA_DATA_HEADER_SIZE)) >= 4:
+            size = unpack_from("<I", header)[0]
+
+            if size < LINK_EXTRA_DATA_HEADER_SIZE:
+                # terminal block encountered. end of lnk file
+                if size != 0x00000000:
+                    log.warning("Invalid terminal block encountered with size %x", size)
+                self.terminal_block = c_lnk.EXTRA_DATA(extra_data_block=None, terminal_block=size)
+                offset += 4
+                break
+
+            if len(header) != LINK_EXTRA_DATA_HEADER_SIZE:
+                break
+
+            count += 1
+            if not self.limits.check("max_block_count", count, "Number of extra data blocks", self.anomalies):
+                break
+            end = file_offset + offset + size - start
+            if not self.limits.check("max_file_size", end, f"End of extra data block at {offset:#x}", self.anomalies):
+                break
+
+            signature = unpack_from("<I", header, 4)[0]
+            if not EXTRA_DATA_BLOCK_SIGNATURES.get_name(signature):
+                log.warning("Unknown extra data block encountered with signature %x", signature)
+
+            # Oversized blocks are skipped, walking past them doesn't require reading them
+            if self.limits.check("max_block_size", size, f"Size of extra data block at {offset:#x}", self.anomalies):
+                self.blocks.append(ExtraDataBlock(offset, size, signature))
+
+            offset += size
+            fh.seek(offset)
+
+        self.size = offset - start
+
+    def decode(self, signatures: Iterable[str | int] | None = None) -> dict[str, Any]:
+        """Decode the blocks with the given names or signatures, or all blocks if none are given.
 
-            self.extradata.update({block_name: struct})
+        Args:
+            signatures: Names or signatures of the blocks to decode.
+
+        Returns:
+            The decoded blocks by name.
+        """
+        if signatures is not None:
+            signatures = {
+                EXTRA_DATA_BLOCK_SIGNATURES[signature] if isinstance(signature, str) else signature
+                for signature in signatures
+            }
+
+        for block in self.blocks:
+            if block.offset in self._decoded or (signatures is not None and block.signature not in signatures):
+                continue
+
+            self._decoded.add(block.offset)
+            if (block_name := block.name) and (struct := self._decode_block(block)) is not None:
+                self.extradata[block_name] = struct
+
+        if self.terminal_block is not None:
+            # keep the TERMINAL_BLOCK as the last entry
+            self.extradata.pop("TERMINAL_BLOCK", None)
+            self.extradata["TERMINAL_BLOCK"] = self.terminal_block
+
+        return self.extradata
+
+    def _decode_block(self, block: ExtraDataBlock) -> Any:
+        block_name = block.name
+        read_size = block.size - LINK_EXTRA_DATA_HEADER_SIZE
+
+        self.fh.seek(block.offset + LINK_EXTRA_DATA_HEADER_SIZE)
+        block_data = self.fh.read(read_size)
+
+        if len(block_data) != read_size:
+            # Some malicious lnk files have a mismatch in the size indicated in the data block and actual bytes red.
+            # This causes cstruct to have an EOFError when trying to parse the actual size. Which is not reflected.
+            log.warning(
+                "Mismatch in read size (%i) and actual EXTRA_DATA_BLOCK length (%i) for data block (%s)",
+                read_size,
+                len(block_data),
+                block_name,
+            )
+            return None
 
+        if block_name == "VISTA_AND_ABOVE_IDLIST_PROPS":
+            struct = LnkTargetIdList.from_buffer(block_data, read_size, limits=self.limits)
+            self.anomalies.extend(struct.anomalies)
         else:
-            log.warning("Unknown extra data block encountered with signature %x", signature)
+            struct = c_lnk.typedefs[block_name](block_data)
+
+        if block_name == "PROPERTY_STORE_PROPS":
+            # Only the first storage is parsed here, use property_store to read the properties
+            guid = self._parse_guid(struct.format_id)
+            struct.format_id = guid
+
+        elif block_name == "TRACKER_PROPS":
+            for name in struct.fields:
+                if "droid" in name:
+                    guid = self._parse_guid(getattr(struct, name))
+                    setattr(struct, name, guid)
+
+        elif block_name == "KNOWN_FOLDER_PROPS":
+            guid = self._parse_guid(struct.known_folder_id)
+            struct.known_folder_id = guid
+
+        elif (
+            block_name == "ENVIRONMENT_PROPS" or block_name == "ICON_ENVIRONMENT_PROPS" or block_name == "DARWIN_PROPS"
+        ):
+            if block_name == "DARWIN_PROPS":
+                struct.darwin_data_ansi = struct.darwin_data_ansi
+                struct.darwin_data_unicode = struct.darwin_data_unicode.decode().rstrip("\x00")
+            else:
+                struct.target_ansi = struct.target_ansi
+                struct.target_unicode = struct.target_unicode.decode("utf-16").rstrip("\x00")
+
+        return struct
 
-        # keep calling parse until the TERMINAL_BLOCK is hit.
-        self._parse(fh)
+    @property
+    def property_store(self) -> PropertyStore | None:
+        """The serialized property store of the PROPERTY_STORE_PROPS block, of which the properties are decoded when
+        they are iterated over.
+        """
+        if not self.fh:
+            return None
+
+        for block in self.blocks:
+            if block.signature == EXTRA_DATA_BLOCK_SIGNATURES.PROPERTY_STORE_PROPS:
+                self.fh.seek(block.offset + LINK_EXTRA_DATA_HEADER_SIZE)
+                return PropertyStore(self.fh.read(block.size - LINK_EXTRA_DATA_HEADER_SIZE))
+        return None
 
     def _parse_guid(self, guid: bytes, endianness: str = "<") -> UUID:
         if endianness == "<":
-            return UUID(bytes_le=guid)
+            return registry.guid(guid)
 
         return UUID(bytes=guid)
 
     def __getattr__(self, attr: str) -> Any:
+        extradata = self.__dict__.get("extradata", {})
+        if attr not in extradata and self.__dict__.get("fh") and attr in EXTRA_DATA_BLOCK_SIGNATURES.__members__:
+            # decode blocks that were skipped up front on first access
+            self.decode([attr])
+
         try:
-            return self.extradata[attr]
+            return extradata[attr]
         except KeyError:
             return object.__getattribute__(self, attr)
 
@@ -140,45 +323,110 @@ class LnkStringData:
     Args:
         fh: A file-lke object to a STRING_DATA structure
         lnk_flags: Parsed LINK_HEADER flags
+        names: Names of the strings to decode up front, or ``None`` to decode all strings. Other strings are skipped
+            and decoded on first attribute access, for which the file-like object must remain open.
+        limits: The limits to enforce, strings longer than ``limits.max_string_length`` characters are truncated.
     """
 
-    def __init__(self, fh: BinaryIO | None = None, lnk_flags: c_lnk.LINK_FLAGS | None = None):
+    # The STRING_DATA structures are present in this order, each one indicated by its LINK_FLAGS flag
+    FLAG_NAMES = (
+        ("has_name", "name_string"),
+        ("has_relative_path", "relative_path"),
+        ("has_working_dir", "working_dir"),
+        ("has_arguments", "command_line_arguments"),
+        ("has_icon_location", "icon_location"),
+    )
+
+    def __init__(
+        self,
+        fh: BinaryIO | None = None,
+        lnk_flags: c_lnk.LINK_FLAGS | None = None,
+        names: Iterable[str] | None = None,
+        limits: Limits | None = None,
+    ):
+        self.fh = fh
         self.flags = None
         self.string_data = None
+        self.offsets = {}
+        self.limits = limits or DEFAULT_LIMITS
+        self.anomalies = []
         if fh:
             self.flags = lnk_flags
             self.string_data = {}
-            self._parse(fh)
-
-    def _parse(self, fh: BinaryIO) -> None:
-        flag_names = (
-            ("has_name", "name_string"),
-            ("has_relative_path", "relative_path"),
-            ("has_working_dir", "working_dir"),
-            ("has_arguments", "command_line_arguments"),
-            ("has_icon_location", "icon_location"),
-        )
+            self._parse(fh, names)
 
-        for flag, string_data_name in flag_names:
+    def _parse(self, fh: BinaryIO, names: Iterable[str] | None = None) -> None:
+        for flag, string_data_name in self.FLAG_NAMES:
             if self.flags & c_lnk.LINK_FLAGS[flag]:
-                string_data = self._get_stringdata(fh)
+                self.offsets[string_data_name] = fh.tell()
+                if names is not None and string_data_name not in names:
+                    self._skip_stringdata(fh)
+                    continue
+
+                string_data = self._get_stringdata(fh, string_data_name)
                 self.string_data.update({string_data_name: string_data})
 
-    def _get_stringdata(self, fh: BinaryIO) -> c_lnk.STRING_DATA:
-        # STRING_DATA structs have a size called character_count
-        # this size (character_count) should be doubled when unicode is used
+    def _skip_stringdata(self, fh: BinaryIO) -> None:
         size = unpack("H", fh.read(2))[0]
         if self.flags & c_lnk.LINK_FLAGS.is_unicode:
             size = size * 2
-            data = fh.read(size).decode("utf-16")
+        fh.seek(size, io.SEEK_CUR)
+
+    def decode(self, names: Iterable[str] | None = None) -> dict[str, c_lnk.STRING_DATA]:
+        """Decode the strings with the given names that were skipped up front, or all of them if none are given.
+
+        Args:
+            names: Names of the strings to decode.
+
+        Returns:
+            The decoded strings by name, in file order.
+        """
+        skipped = [name for name in self.offsets if name not in self.string_data and (names is None or name in names)]
+        for name in skipped:
+            self.fh.seek(self.offsets[name])
+            self.string_data[name] = self._get_stringdata(self.fh, name)
+
+        if skipped:
+            # keep the strings in file order
+            ordered = {name: self.string_data[name] for name in self.offsets if name in self.string_data}
+            self.string_data.clear()
+            self.string_data.update(ordered)
+
+        return self.string_data
+
+    def _get_stringdata(self, fh: BinaryIO, name: str = "string") -> c_lnk.STRING_DATA:
+        # STRING_DATA structs have a size called character_count
+        # this size (character_count) should be doubled when unicode is used
+        count = unpack("H", fh.read(2))[0]
+        char_size = 2 if self.flags & c_lnk.LINK_FLAGS.is_unicode else 1
+        size = count * char_size
+
+        if not self.limits.check("max_string_length", count, f"Length of {name}", self.anomalies):
+            size = self.limits.max_string_length * char_size
+            remainder = (count - self.limits.max_string_length) * char_size
         else:
-            data = fh.read(size)
+            remainder = 0
+
+        data = bytes(fh.read(size))
+        if char_size == 2:
+            if remainder and len(data) >= 2 and 0xD800 <= unpack("<H", data[-2:])[0] <= 0xDBFF:
+                # don't cut a surrogate pair in half when truncating
+                data = data[:-2]
+            data = str(data, "utf-16", "surrogatepass")
+
+        if remainder:
+            fh.seek(remainder, io.SEEK_CUR)
 
         return c_lnk.STRING_DATA(character_count=size, string=data)
 
     def __getattr__(self, attr: str) -> Any:
+        string_data = self.__dict__.get("string_data") or {}
+        if attr not in string_data and self.__dict__.get("fh") and attr in self.__dict__.get("offsets", {}):
+            # decode strings that were skipped up front on first access
+            self.decode([attr])
+
         try:
-            return self.string_data[attr]
+            return string_data[attr]
         except KeyError:
             return object.__getattribute__(self, attr)
 
@@ -194,105 +442,137 @@ class LnkInfo:
 
     Args:
         fh: A file-like objet to a LINK_INFO structure
+        limits: The limits to enforce, a LINK_INFO larger than ``limits.max_block_size`` is not decoded.
     """
 
-    def __init__(self, fh: BinaryIO | None = None):
+    def __init__(self, fh: BinaryIO | None = None, limits: Limits | None = None):
         self.fh = fh
         self.flags = None
         self.size = None
+        self.unicode = False
+        self.limits = limits or DEFAULT_LIMITS
+        self.anomalies = []
 
         self.link_info = None
         self.linkinfo_header = None
         self.linkinfo_body = None
 
         if fh:
-            self.linkinfo_header = c_lnk.LINK_INFO_HEADER(fh.read(LINK_INFO_HEADER_SIZE))
-            self.flags = self.linkinfo_header.link_info_flags
-
-            # values higher than 0x24 indicate the presence of optional fields in the link info structure
-            # if so the LocalBasePathOffsetUnicode and CommonPathSuffixOffsetUnicode fields are present
-            if self.linkinfo_header.link_info_header_size >= 0x00000024:
-                log.error(
-                    "Unicode link_info_header encountered. Size bigger than 0x00000024. Size encountered: %x",
-                    self.linkinfo_header.link_info_header_size,
-                )
-                # TODO parse unicode headers. none encountered yet.
+            offset = fh.tell()
+            self.size = unpack("<I", fh.read(4))[0]
+            # The offsets within an oversized LINK_INFO can't be trusted, so it isn't decoded at all
+            if self.limits.check("max_block_size", self.size, "Size of the LINK_INFO", self.anomalies):
+                fh.seek(offset)
+                self._parse(fh.read(self.size))
 
-            self.linkinfo_body = c_lnk.LINK_INFO_BODY(fh.read(LINK_INFO_BODY_SIZE))
+    def _parse(self, buf: bytes | memoryview) -> None:
+        # All offsets within the LINK_INFO structure are relative to its start, so every field is sliced from buf
+        self.linkinfo_header = c_lnk.LINK_INFO_HEADER(buf[:LINK_INFO_HEADER_SIZE])
+        self.flags = self.linkinfo_header.link_info_flags
 
-            offset = fh.seek(fh.tell() - LINK_INFO_HEADER_SIZE - LINK_INFO_BODY_SIZE)
-            buff = RangeStream(fh, offset, self.linkinfo_header.link_info_size)
-            self._parse(buff)
+        # values of 0x24 and higher indicate the presence of the LocalBasePathOffsetUnicode and
+        # CommonPathSuffixOffsetUnicode fields, and of the Unicode versions of the paths
+        self.unicode = self.linkinfo_header.link_info_header_size >= LINK_INFO_UNICODE_HEADER_SIZE
 
-    def _parse(self, buff: BinaryIO) -> None:
-        buff.seek(LINK_INFO_HEADER_SIZE + LINK_INFO_BODY_SIZE)
-        offset = buff.tell()
+        body_offset = LINK_INFO_HEADER_SIZE
+        self.linkinfo_body = c_lnk.LINK_INFO_BODY(buf[body_offset : body_offset + LINK_INFO_BODY_SIZE])
 
         common_network_relative_link = None
         local_base_path = None
-        net_name = None
-        device_name = None
         volumeid = None
+        local_basepath_offset_unicode = common_pathsuffix_offset_unicode = 0
+        local_base_path_unicode = common_path_suffix_unicode = None
 
-        if self.flag("volumeid_and_local_basepath"):
-            volumeid_size = unpack("I", buff.read(4))[0]
-            buff.seek(offset)
-            volumeid = c_lnk.VOLUME_ID(buff.read(volumeid_size))
+        if self.unicode:
+            local_basepath_offset_unicode, common_pathsuffix_offset_unicode = unpack_from(
+                "<II", buf, body_offset + LINK_INFO_BODY_SIZE
+            )
 
-            offset = buff.tell()
-            local_base_path = c_lnk.LOCAL_BASE_PATH(buff.read())
+        if self.flag("volumeid_and_local_basepath"):
+            offset = self.linkinfo_body.volumeid_offset
+            volumeid_size, _, _, volume_label_offset = unpack_from("<IIII", buf, offset)
+            # a VolumeLabelOffset of 0x14 indicates the presence of the VolumeLabelOffsetUnicode field
+            volumeid_type = c_lnk.VOLUME_ID_UNICODE if volume_label_offset == 0x14 else c_lnk.VOLUME_ID
+            volumeid = volumeid_type(buf[offset : offset + volumeid_size])
+            local_base_path = _read_cstring(buf, self.linkinfo_body.local_basepath_offset)
 
-            local_base_path = local_base_path.local_base_path
-            # put pointer back before common_path_suffix
-            buff.seek(self.linkinfo_body.common_network_relative_link_offset)
+            if local_basepath_offset_unicode:
+                local_base_path_unicode = _read_wstring(buf, local_basepath_offset_unicode)
 
         if self.flag("common_network_relative_link_and_pathsuffix"):
-            start_common_network_relative_link = buff.tell()
-            # read the size of the common_network_relative_link_size. This is 20 bytes
-            header = c_lnk.COMMON_NETWORK_RELATIVE_LINK_HEADER(buff.read(20))
-            flags = header.common_network_relative_link_flags
-
-            if flags & c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_device:
-                offset = buff.seek(start_common_network_relative_link + header.device_name_offset)
-                device_name = c_lnk.DEVICE_NAME(buff.read())
-                read_size = len(device_name.dumps())
-                device_name = device_name.device_name
-                buff.seek(offset + read_size)
-
-            if flags & c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_net_type:
-                offset = buff.seek(start_common_network_relative_link + header.net_name_offset)
-                net_name = c_lnk.NET_NAME(buff.read())
-                read_size = len(net_name.dumps())
-                net_name = net_name.net_name
-                buff.seek(offset + read_size)
-
-            common_network_relative_link = c_lnk.COMMON_NETWORK_RELATIVE_LINK(
-                common_network_relative_link_size=header.common_network_relative_link_size,
-                common_network_relative_link_flags=header.common_network_relative_link_flags,
-                net_name_offset=header.net_name_offset,
-                device_name_offset=header.device_name_offset,
-                net_provider_type=header.net_provider_type,
-                net_name=net_name,
-                device_name=device_name,
+            common_network_relative_link = self._parse_common_network_relative_link(
+                buf, self.linkinfo_body.common_network_relative_link_offset
             )
 
         # common_path_suffix is always present, even when its value is just 0x00
         # or when the flag common_network_relative_link_and_pathsuffix indicates otherwise
-        buff.seek(self.linkinfo_body.common_pathsuffix_offset)
-        common_path_suffix = c_lnk.COMMON_PATH_SUFFIX(buff.read()).common_path_suffix
-
-        self.link_info = c_lnk.LINK_INFO(
-            link_info_size=self.linkinfo_header.link_info_size,
-            link_info_header_size=self.linkinfo_header.link_info_header_size,
-            link_info_flags=self.flags,
-            volumeid_offset=self.linkinfo_body.volumeid_offset,
-            local_basepath_offset=self.linkinfo_body.local_basepath_offset,
-            common_network_relative_link_offset=self.linkinfo_body.common_network_relative_link_offset,
-            common_pathsuffix_offset=self.linkinfo_body.common_pathsuffix_offset,
-            volumeid=volumeid,
-            local_base_path=local_base_path,
-            common_network_relative_link=common_network_relative_link,
-            common_path_suffix=common_path_suffix,
+        common_path_suffix = _read_cstring(buf, self.linkinfo_body.common_pathsuffix_offset)
+        if common_pathsuffix_offset_unicode:
+            common_path_suffix_unicode = _read_wstring(buf, common_pathsuffix_offset_unicode)
+
+        fields = {
+            "link_info_size": self.linkinfo_header.link_info_size,
+            "link_info_header_size": self.linkinfo_header.link_info_header_size,
+            "link_info_flags": self.flags,
+            "volumeid_offset": self.linkinfo_body.volumeid_offset,
+            "local_basepath_offset": self.linkinfo_body.local_basepath_offset,
+            "common_network_relative_link_offset": self.linkinfo_body.common_network_relative_link_offset,
+            "common_pathsuffix_offset": self.linkinfo_body.common_pathsuffix_offset,
+            "volumeid": volumeid,
+            "local_base_path": local_base_path,
+            "common_network_relative_link": common_network_relative_link,
+            "common_path_suffix": common_path_suffix,
+        }
+
+        if self.unicode:
+            self.link_info = c_lnk.LINK_INFO_UNICODE(
+                **fields,
+                local_basepath_offset_unicode=local_basepath_offset_unicode,
+                common_pathsuffix_offset_unicode=common_pathsuffix_offset_unicode,
+                local_base_path_unicode=local_base_path_unicode,
+                common_path_suffix_unicode=common_path_suffix_unicode,
+            )
+        else:
+            self.link_info = c_lnk.LINK_INFO(**fields)
+
+    def _parse_common_network_relative_link(self, buf: bytes | memoryview, start: int) -> Any:
+        header = c_lnk.COMMON_NETWORK_RELATIVE_LINK_HEADER(
+            buf[start : start + COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE]
+        )
+        flags = header.common_network_relative_link_flags
+
+        net_name = device_name = None
+        if flags & c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_device:
+            device_name = _read_cstring(buf, start + header.device_name_offset)
+
+        if flags & c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_net_type:
+            net_name = _read_cstring(buf, start + header.net_name_offset)
+
+        fields = {
+            "common_network_relative_link_size": header.common_network_relative_link_size,
+            "common_network_relative_link_flags": flags,
+            "net_name_offset": header.net_name_offset,
+            "device_name_offset": header.device_name_offset,
+            "net_provider_type": header.net_provider_type,
+            "net_name": net_name,
+            "device_name": device_name,
+        }
+
+        # a NetNameOffset larger than 0x14 indicates the presence of the Unicode offsets and names
+        if header.net_name_offset <= COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE:
+            return c_lnk.COMMON_NETWORK_RELATIVE_LINK(**fields)
+
+        net_name_offset_unicode, device_name_offset_unicode = unpack_from(
+            "<II", buf, start + COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE
+        )
+        return c_lnk.COMMON_NETWORK_RELATIVE_LINK_UNICODE(
+            **fields,
+            net_name_offset_unicode=net_name_offset_unicode,
+            device_name_offset_unicode=device_name_offset_unicode,
+            net_name_unicode=_read_wstring(buf, start + net_name_offset_unicode) if net_name_offset_unicode else None,
+            device_name_unicode=(
+                _read_wstring(buf, start + device_name_offset_unicode) if device_name_offset_unicode else None
+            ),
         )
 
     def flag(self, name: str) -> int:
@@ -325,31 +605,64 @@ class LnkTargetIdList:
     Args:
         fh: A file-like object to a TARGET_IDLIST structure.
         size: Size of the TARGET_IDLIST structure
+        limits: The limits to enforce, ITEMID structures beyond ``limits.max_idlist_items`` are left out.
     """
 
-    def __init__(self, fh: BinaryIO | None = None, size: int | None = None):
+    def __init__(self, fh: BinaryIO | None = None, size: int | None = None, limits: Limits | None = None):
         self.target_idlist = None
         self.idlist = None
         self.size = None
+        self.limits = limits or DEFAULT_LIMITS
+        self.anomalies = []
 
         if fh:
             self.size = unpack("H", fh.read(2))[0] if size is None else size
             self._parse(fh.read(self.size))
 
-    def _parse(self, buff: BinaryIO) -> None:
+    @classmethod
+    def from_buffer(cls, buf: bytes | memoryview, size: int, limits: Limits | None = None) -> LnkTargetIdList:
+        """Parse a TARGET_IDLIST structure from a buffer without copying the ITEMID data.
+
+        Args:
+            buf: A bytes-like object containing the IDList, not including its size field.
+            size: Size of the TARGET_IDLIST structure
+            limits: The limits to enforce.
+        """
+        obj = cls(limits=limits)
+        obj.size = size
+        obj._parse(buf)
+        return obj
+
+    def _parse(self, buf: bytes | memoryview) -> None:
         idlists = []
-        buff = BytesIO(buff)
+        offset = 0
 
         # the size of the target_idlist struct includes itself. Thus we minus 2 here.
-        while buff.tell() < self.size - 2:
-            size = unpack("H", buff.read(2))[0]
-            data = buff.read(size - 2)  # size of the struct includes the 16-bit size value. Thus we minus 2 here again.
+        while offset < self.size - 2:
+            size = unpack_from("<H", buf, offset)[0]
+            if size < 2:
+                # premature terminal ITEMID
+                break
+
+            if not self.limits.check(
+                "max_idlist_items", len(idlists) + 1, "Number of ITEMID structures", self.anomalies
+            ):
+                break
+
+            # size of the struct includes the 16-bit size value. Thus we add 2 here.
+            data = buf[offset + 2 : offset + size]
             itemid = c_lnk.ITEMID(itemid_size=size, data=data)
             idlists.append(itemid)
+            offset += size
 
-        self.idlist = c_lnk.IDLIST(itemid_list=idlists, terminalid=buff.read())
+        self.idlist = c_lnk.IDLIST(itemid_list=idlists, terminalid=bytes(buf[offset:]))
         self.target_idlist = c_lnk.LINK_TARGET_IDLIST(idlist_size=self.size, idlist=self.idlist)
 
+    @cached_property
+    def items(self) -> ShellItemList:
+        """The decoded shell items of the ITEMID structures, which are decoded when they are accessed."""
+        return ShellItemList(self.idlist.itemid_list if self.idlist else [])
+
     def __repr__(self) -> str:
         return repr(self.target_idlist)
 
@@ -362,12 +675,29 @@ class Lnk:
     Parses a .lnk file (aka Microsoft Shell Item) according to the MS-SHLLINK specification
     reference: https://winprotocoldoc.blob.core.windows.net/productionwindowsarchives/MS-SHLLINK/%5bMS-SHLLINK%5d.pdf
 
+    When ``lazy`` is set, only the SHELL_LINK_HEADER is decoded up front. The offsets of the remaining sections are
+    remembered and each section is decoded the first time it is accessed, so the file-like object must remain open
+    for as long as sections may still be accessed.
+
+    When ``fields`` is given, only the parts of the sections needed for those fields are decoded up front. Fields are
+    dotted paths starting with a section name, for example ``header.write_time``,
+    ``stringdata.command_line_arguments`` or ``extradata.TRACKER_PROPS.machine_id``. Strings, sections and extra data
+    blocks that are not part of the projection are decoded lazily when accessed. The values of the requested fields
+    are returned by :meth:`projection`.
+
+    The size and count fields of every section are checked against ``limits`` before anything is read. In lenient
+    mode violations are truncated and recorded in :attr:`anomalies`, in strict mode they raise
+    :class:`~dissect.shellitem.lnk.limits.LimitExceeded`.
+
     Args:
         path: (string) Path to a link file.
         target_idlist: A LnkTargetIdList object.
         linkinfo: A LnkInfo object.
         stringdata: A LnkStringData object.
         extradata: A LnkExtraData object.
+        lazy: Whether to defer decoding of the sections following the header until they are accessed.
+        fields: Dotted paths of the fields to decode, or ``None`` to decode everything.
+        limits: The limits to enforce, defaults to :data:`~dissect.shellitem.lnk.limits.DEFAULT_LIMITS`.
     """
 
     def __init__(
@@ -377,35 +707,235 @@ class Lnk:
         linkinfo: LnkInfo | None = None,
         stringdata: LnkStringData | None = None,
         extradata: LnkExtraData | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+        limits: Limits | None = None,
     ):
         self.fh = fh
+        self.lazy = lazy
+        self.limits = limits or DEFAULT_LIMITS
+        self.fields = None
+        self._projection = None
+        self._anomalies = []
+
+        if fields is not None:
+            self.fields = tuple(dict.fromkeys(fields))
+            self._projection = self._parse_fields(self.fields)
 
         self.flags = None
+        self.offset = self.fh.tell()
+        self.offsets = {}
         self.link_header = self._parse_header(self.fh)
-        self.target_idlist = LnkTargetIdList()
-        self.linkinfo = LnkInfo()
-        self.stringdata = LnkStringData()
-        self.extradata = LnkExtraData()
 
         if self.link_header:
             self.flags = self.link_header.link_flags
+            self.offsets = self._parse_offsets(self.fh)
+
+            if self._projection is not None:
+                # Only decode the sections that are part of the projection
+                for section in self._projection:
+                    getattr(self, section)
+            elif not lazy:
+                # Decode every section right away, in file order
+                _ = self.target_idlist, self.linkinfo, self.stringdata, self.extradata
+
+    def _parse_fields(self, fields: Iterable[str]) -> dict[str, set[str] | None]:
+        """Returns the sections needed for the given fields, with the names of the strings or extra data blocks
+        needed from them, or ``None`` if the whole section is needed.
+        """
+        projection = {}
 
-            if self.flag("has_link_target_idlist"):
-                self.target_idlist = LnkTargetIdList(self.fh)
+        for field in fields:
+            section, _, path = field.partition(".")
+            if section not in LNK_SECTIONS:
+                raise ValueError(f"Unknown LNK section in field: {field!r}")
 
-            if self.flag("has_link_info"):
-                self.linkinfo = LnkInfo(self.fh)
+            section = LNK_SECTIONS[section]
+            name = path.partition(".")[0]
 
-            if (
-                self.flag("has_name")
-                or self.flag("has_relative_path")
-                or self.flag("has_working_dir")
-                or self.flag("has_arguments")
-                or self.flag("has_icon_location")
-            ):
-                self.stringdata = LnkStringData(self.fh, self.flags)
+            if section in ("stringdata", "extradata") and name:
+                names = (
+                    EXTRA_DATA_BLOCK_SIGNATURES.__members__
+                    if section == "extradata"
+                    else {string_data_name for _, string_data_name in LnkStringData.FLAG_NAMES}
+                )
+                if name not in names:
+                    raise ValueError(f"Unknown {section} name in field: {field!r}")
+
+                if section not in projection:
+                    projection[section] = set()
+                if projection[section] is not None:
+                    projection[section].add(name)
+            else:
+                projection[section] = None
+
+        # the header is always decoded
+        projection.pop("link_header", None)
+        return projection
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buf: bytes | bytearray | memoryview | mmap,
+        offset: int = 0,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+        limits: Limits | None = None,
+    ) -> Lnk:
+        """Parse a LNK file directly from a buffer, such as a memory-mapped disk image or memory dump.
+
+        The sections are sliced from the buffer instead of being copied, so parsed ITEMID data references the
+        underlying buffer. An ``mmap`` can't be closed while the returned object still references it.
+
+        Args:
+            buf: A bytes-like object, ``memoryview`` or ``mmap`` containing the LNK file.
+            offset: Offset of the LNK file within the buffer.
+            lazy: Whether to defer decoding of the sections following the header until they are accessed.
+            fields: Dotted paths of the fields to decode, or ``None`` to decode everything.
+            limits: The limits to enforce, defaults to :data:`~dissect.shellitem.lnk.limits.DEFAULT_LIMITS`.
+        """
+        fh = ViewStream(buf)
+        fh.seek(offset)
+        return cls(fh, lazy=lazy, fields=fields, limits=limits)
+
+    @classmethod
+    async def aparse(
+        cls,
+        reader: AsyncReader,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+        limits: Limits | None = None,
+    ) -> Lnk:
+        """Parse a LNK file from an asynchronous reader, such as an ``asyncio.StreamReader``.
+
+        The whole file is fetched with a single awaited ``read()``, after which it is parsed in a worker thread so the
+        event loop isn't blocked. Use :func:`~dissect.shellitem.lnk.aio.aparse_many` to parse many files concurrently.
+
+        Args:
+            reader: An object with an asynchronous ``read()`` that returns the contents of the LNK file.
+            lazy: Whether to defer decoding of the sections following the header until they are accessed.
+            fields: Dotted paths of the fields to decode, or ``None`` to decode everything.
+            limits: The limits to enforce, defaults to :data:`~dissect.shellitem.lnk.limits.DEFAULT_LIMITS`.
+        """
+        # asyncio is only needed here, importing it up front would slow down importing this module
+        import asyncio
+
+        data = await reader.read()
+        return await asyncio.to_thread(cls.from_buffer, bytes(data), lazy=lazy, fields=fields, limits=limits)
+
+    def _parse_offsets(self, fh: BinaryIO) -> dict[str, int]:
+        """Returns the offsets of the sections following the LINK header.
+
+        Only the size fields of the sections are read to determine where the next section starts. Sections that end
+        beyond ``limits.max_file_size`` are left out, together with the sections following them.
+
+        Args:
+            fh: File object, positioned directly after the LINK header
+
+        Returns:
+            A dictionary mapping the names of the present sections to their offsets
+        """
+        offsets = {}
+        offset = fh.tell()
+
+        def within_limits(section: str, end: int) -> bool:
+            return self.limits.check("max_file_size", end - self.offset, f"End of the {section}", self._anomalies)
+
+        if self.flag("has_link_target_idlist"):
+            end = offset + 2 + unpack("<H", fh.read(2))[0]
+            if not within_limits("TARGET_IDLIST", end):
+                return offsets
+            offsets["target_idlist"] = offset
+            offset = end
+            fh.seek(offset)
+
+        if self.flag("has_link_info"):
+            end = offset + unpack("<I", fh.read(4))[0]
+            if not within_limits("LINK_INFO", end):
+                return offsets
+            offsets["linkinfo"] = offset
+            offset = end
+            fh.seek(offset)
+
+        if any(self.flag(name) for name, _ in LnkStringData.FLAG_NAMES):
+            end = offset
+            char_size = 2 if self.flag("is_unicode") else 1
+            for name, _ in LnkStringData.FLAG_NAMES:
+                if self.flag(name):
+                    end += 2 + unpack("<H", fh.read(2))[0] * char_size
+                    fh.seek(end)
+            if not within_limits("STRING_DATA", end):
+                return offsets
+            offsets["stringdata"] = offset
+            offset = end
+
+        offsets["extradata"] = offset
+        return offsets
+
+    @cached_property
+    def target_idlist(self) -> LnkTargetIdList:
+        """Returns the TARGET_IDLIST structure, decoding it on first access."""
+        if (offset := self.offsets.get("target_idlist")) is None:
+            return LnkTargetIdList()
+
+        self.fh.seek(offset)
+        return LnkTargetIdList(self.fh, limits=self.limits)
+
+    @cached_property
+    def linkinfo(self) -> LnkInfo:
+        """Returns the LINK_INFO structure, decoding it on first access."""
+        if (offset := self.offsets.get("linkinfo")) is None:
+            return LnkInfo()
+
+        self.fh.seek(offset)
+        return LnkInfo(self.fh, limits=self.limits)
+
+    @cached_property
+    def stringdata(self) -> LnkStringData:
+        """Returns the STRING_DATA structures, decoding them on first access."""
+        if (offset := self.offsets.get("stringdata")) is None:
+            return LnkStringData()
+
+        self.fh.seek(offset)
+        names = self._projection.get("stringdata") if self._projection is not None else None
+        return LnkStringData(self.fh, self.flags, names=names, limits=self.limits)
+
+    @cached_property
+    def extradata(self) -> LnkExtraData:
+        """Returns the EXTRA_DATA structures, decoding them on first access."""
+        if (offset := self.offsets.get("extradata")) is None:
+            return LnkExtraData()
+
+        self.fh.seek(offset)
+        if self._projection is not None:
+            signatures = self._projection.get("extradata", ())
+        else:
+            signatures = () if self.lazy else None
+        return LnkExtraData(self.fh, signatures=signatures, limits=self.limits, file_offset=offset - self.offset)
+
+    @cached_property
+    def size(self) -> int | None:
+        """Returns the total size of the LNK file, up to and including the TERMINAL_BLOCK.
+
+        Only the extra data block headers are walked to determine the size, the blocks themselves are not decoded.
+        """
+        if not self.link_header or "extradata" not in self.offsets:
+            return None
 
-            self.extradata = LnkExtraData(self.fh)
+        return self.offsets["extradata"] + self.extradata.size - self.offset
+
+    @property
+    def anomalies(self) -> list[str]:
+        """Returns the limits that were exceeded while parsing in lenient mode, see
+        :class:`~dissect.shellitem.lnk.limits.Limits`.
+
+        Sections that are decoded lazily only report their anomalies once they have been decoded.
+        """
+        anomalies = list(self._anomalies)
+        for section in ("target_idlist", "linkinfo", "stringdata", "extradata"):
+            if (obj := self.__dict__.get(section)) is not None:
+                anomalies.extend(obj.anomalies)
+        return anomalies
 
     def flag(self, name: str) -> int:
         """Returns whether supplied flag is set.
@@ -418,7 +948,7 @@ class Lnk:
         """
         return self.flags & c_lnk.LINK_FLAGS[name]
 
-    def _parse_header(self, fh: BinaryIO | None) -> c_lnk.SHELL_LINK_HEADER | None:
+    def _parse_header(self, fh: BinaryIO | None) -> LinkHeader | None:
         """Returns LINK header.
 
         Parse the header in a buffer that does not start at offset 0
@@ -427,34 +957,126 @@ class Lnk:
             fh: File object
 
         Returns:
-            LINK header if size is 0x4C, else none
+            LINK header if size is 0x4C and the CLSID is valid, else none
         """
-        offset = fh.tell()
-        header_size = unpack("I", fh.read(4))[0]
-        fh.seek(offset)
+        buf = fh.read(LINK_HEADER_SIZE)
+        if (link_header := read_header(buf)) is not None:
+            return link_header
+
+        if len(buf) >= 4 and (header_size := unpack_from("<I", buf)[0]) != LINK_HEADER_SIZE:
+            log.info(
+                "Encountered invalid link file with magic header size 0x%x. \
+                Magic header size should be 0x%x. Skipping.",
+                header_size,
+                LINK_HEADER_SIZE,
+            )
+        else:
+            log.info("Encountered invalid link file header: %s. Skipping.", bytes(buf).hex())
+        return None
 
-        if header_size == LINK_HEADER_SIZE:
-            link_header = c_lnk.SHELL_LINK_HEADER(fh.read(LINK_HEADER_SIZE))
-            link_clsid = str(UUID(bytes_le=link_header.link_clsid))
+    def get(self, field: str, default: Any = None) -> Any:
+        """Returns the value of a field, given as a dotted path starting with a section name.
 
-            if link_clsid == "00021401-0000-0000-c000-000000000046":
-                return link_header
+        Args:
+            field: Dotted path of the field, for example ``stringdata.command_line_arguments.string``.
+            default: Value to return if the field is not present.
 
-            log.info("Encountered invalid link file header: %s. Skipping.", link_header)
-            return None
+        Returns:
+            The value of the field, or ``default`` if it is not present.
+        """
+        section, _, path = field.partition(".")
+        if section not in LNK_SECTIONS:
+            raise ValueError(f"Unknown LNK section in field: {field!r}")
+
+        value = getattr(self, LNK_SECTIONS[section])
+        try:
+            for name in path.split(".") if path else ():
+                value = getattr(value, name)
+        except (AttributeError, KeyError, TypeError):
+            return default
+
+        return value
 
-        log.info(
-            "Encountered invalid link file with magic header size 0x%x. \
-            Magic header size should be 0x%x. Skipping.",
-            header_size,
-            LINK_HEADER_SIZE,
+    def projection(self) -> dict[str, Any]:
+        """Returns the values of the fields this LNK file was parsed with, by field."""
+        return {field: self.get(field) for field in self.fields or ()}
+
+    def to_dict(self, codepage: str = "utf-8") -> dict[str, Any]:
+        """Returns the commonly used fields of this LNK file as a flat dictionary of plain, picklable values.
+
+        Fields that are not present in the LNK file are ``None``. ANSI strings are decoded with ``codepage``, bytes
+        that can't be decoded are replaced by escape sequences.
+
+        Args:
+            codepage: The code page to decode ANSI strings with, for example ``cp1252``.
+        """
+        record = dict.fromkeys(RECORD_FIELDS)
+        if not self.link_header:
+            return record
+
+        header = self.link_header
+        record.update(
+            link_flags=int(header.link_flags),
+            file_flags=int(header.file_flags),
+            creation_time=_wintimestamp(header.creation_time),
+            access_time=_wintimestamp(header.access_time),
+            write_time=_wintimestamp(header.write_time),
+            filesize=int(header.filesize),
+            icon_index=int(header.icon_index),
+            show_command=int(header.show_command),
         )
-        return None
+
+        if self.flag("has_link_info") and (link_info := self.linkinfo.link_info):
+            # Unicode versions of the strings take precedence over the ANSI versions if present
+            if self.linkinfo.flag("volumeid_and_local_basepath"):
+                record["local_base_path"] = getattr(link_info, "local_base_path_unicode", None) or _decode(
+                    link_info.local_base_path, codepage
+                )
+                record["drive_type"] = int(link_info.volumeid.drive_type)
+                record["drive_serial_number"] = int(link_info.volumeid.drive_serial_number)
+
+            if self.linkinfo.flag("common_network_relative_link_and_pathsuffix"):
+                link = link_info.common_network_relative_link
+                record["net_name"] = getattr(link, "net_name_unicode", None) or _decode(link.net_name, codepage)
+                record["device_name"] = getattr(link, "device_name_unicode", None) or _decode(
+                    link.device_name, codepage
+                )
+
+            record["common_path_suffix"] = getattr(link_info, "common_path_suffix_unicode", None) or _decode(
+                link_info.common_path_suffix, codepage
+            )
+            if record["local_base_path"]:
+                record["target_path"] = record["local_base_path"] + (record["common_path_suffix"] or "")
+
+        for name, value in (self.stringdata.decode() if self.stringdata.fh else {}).items():
+            record[name] = _decode(value.string, codepage)
+
+        if tracker_props := self.get("extradata.TRACKER_PROPS"):
+            record["machine_id"] = _decode(tracker_props.machine_id.split(b"\x00", 1)[0], codepage)
+            for name in ("volume_droid", "file_droid", "volume_droid_birth", "file_droid_birth"):
+                record[name] = str(getattr(tracker_props, name))
+
+        if known_folder_props := self.get("extradata.KNOWN_FOLDER_PROPS"):
+            record["known_folder_id"] = str(known_folder_props.known_folder_id)
+            record["known_folder_name"] = guid_name(known_folder_props.known_folder_id)
+
+        return record
+
+    def to_record(self, codepage: str = "utf-8") -> LnkRecord:
+        """Returns the commonly used fields of this LNK file as a compact :class:`LnkRecord`.
+
+        The record has the same fields as the dictionary returned by :meth:`to_dict`, with every LINK_FLAGS flag as a
+        boolean attribute, and uses a fraction of the memory of the dictionary or of this object.
+
+        Args:
+            codepage: The code page to decode ANSI strings with.
+        """
+        return LnkRecord(**self.to_dict(codepage))
 
     @property
     def clsid(self) -> UUID:
         """Returns the class id (clsid) of the LNK file."""
-        return UUID(bytes_le=self.link_header.link_clsid)
+        return registry.guid(self.link_header.link_clsid)
 
     def __repr__(self) -> str:
         return f"{self.link_header} {self.target_idlist} {self.linkinfo.link_info} {self.stringdata} {self.extradata}"
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from dissect.shellitem.lnk.batch import run_chunks
+from dissect.shellitem.lnk.cache import content_key
+from dissect.shellitem.lnk.lnk import RECORD_PROJECTION, Lnk
+from dissect.shellitem.lnk.record import LnkRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+# Version of the layout of the manifest database
+MANIFEST_VERSION = 2
+
+# Statuses of the changes reported by an incremental scan
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+
+class ManifestEntry(NamedTuple):
+    """The state of a file at the time it was last scanned."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    key: bytes | None
+    """The content hash of the file, see :func:`~dissect.shellitem.lnk.cache.content_key`."""
+    parsed: bool
+    """Whether a result is stored for the file, instead of it being skipped or failing to parse."""
+
+
+class ScanResult(NamedTuple):
+    """The result of scanning a single file in a worker, see :func:`scan_changes`."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    key: bytes | None
+    result: Any
+    """The parsed result, or ``None`` if the file was skipped or failed to parse."""
+    error: str | None
+
+
+class Change(NamedTuple):
+    """A change found by an incremental scan."""
+
+    status: str
+    """One of ``added``, ``modified`` or ``deleted``."""
+    path: str
+    record: Any
+    """The parsed result of an added or modified file, ``None`` for deleted files and files that failed to parse."""
+    error: str | None
+    """Description of the error if the file could not be parsed."""
+
+
+class Manifest:
+    """A SQLite database of the files seen by previous scans, used to only parse the files that changed since.
+
+    For every file the size, modification time, inode, content hash and the serialized result of parsing it are
+    stored. A manifest is created for one kind of result, opening it for another kind raises a ``ValueError``.
+
+    Args:
+        path: Path of the database, which is created if it doesn't exist.
+        kind: The kind of results stored in the manifest.
+    """
+
+    def __init__(self, path: str | os.PathLike, kind: str = "record"):
+        self.path = path
+        self.kind = kind
+        self.db = sqlite3.connect(path)
+
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, "
+            "hash BLOB, result TEXT, error TEXT)"
+        )
+
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        if not meta:
+            self.db.executemany("INSERT INTO meta VALUES (?, ?)", [("version", str(MANIFEST_VERSION)), ("kind", kind)])
+            self.db.commit()
+        elif meta.get("version") != str(MANIFEST_VERSION) or meta.get("kind") != kind:
+            self.db.close()
+            raise ValueError(
+                f"Manifest {path} has version {meta.get('version')} and kind {meta.get('kind')!r}, "
+                f"expected version {MANIFEST_VERSION} and kind {kind!r}"
+            )
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __contains__(self, path: str) -> bool:
+        return self.db.execute("SELECT 1 FROM files WHERE path = ?", (path,)).fetchone() is not None
+
+    def entries(self) -> dict[str, ManifestEntry]:
+        """Return the state of all files in the manifest, by path."""
+        rows = self.db.execute("SELECT path, size, mtime_ns, inode, hash, result IS NOT NULL FROM files")
+        return {row[0]: ManifestEntry(*row[1:5], bool(row[5])) for row in rows}
+
+    def result(self, path: str) -> str | None:
+        """Return the serialized result of the file at the given path, or ``None`` if there is none."""
+        row = self.db.execute("SELECT result FROM files WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def update(self, results: Iterable[tuple[ScanResult, str | None]]) -> None:
+        """Store the scan results of files, with their serialized results."""
+        self.db.executemany(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (result.path, result.size, result.mtime_ns, result.inode, result.key, data, result.error)
+                for result, data in results
+            ),
+        )
+
+    def delete(self, paths: Iterable[str]) -> None:
+        """Remove files from the manifest."""
+        self.db.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in paths))
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def scan_changes(
+    tasks: Iterable[tuple[str, Any]],
+    manifest: Manifest,
+    func: Callable[[list[tuple[str, Any]]], list[ScanResult]],
+    dumps: Callable[[Any], str],
+    workers: int | None = None,
+    chunksize: int = 64,
+    batchsize: int = 1000,
+) -> Iterator[Change]:
+    """Scan files incrementally, only scanning the files whose size, modification time or inode changed.
+
+    Changed files are scanned by ``func`` in a pool of worker processes, see
+    :func:`~dissect.shellitem.lnk.batch.run_chunks`. Files of which the contents didn't change are not reported.
+    Files that are in the manifest but were not seen by this scan, or that no longer produce a result, are reported
+    as deleted. The manifest is updated as the scan goes, and committed when the scan is finished, so an
+    interrupted scan leaves the manifest unchanged.
+
+    Args:
+        tasks: Tuples of the path of a file and an additional argument for ``func``.
+        manifest: The manifest of the previous scan.
+        func: A picklable function that scans a chunk of tasks into :class:`ScanResult` tuples.
+        dumps: A function that serializes a result to store it in the manifest.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to scan in this process.
+        chunksize: Number of tasks to send to a worker at once.
+        batchsize: Number of files to write to the manifest at once.
+
+    Returns:
+        An iterator of the :class:`Change` tuples, in the order of the tasks followed by the deleted files.
+    """
+    entries = manifest.entries()
+    seen = set()
+
+    def changed() -> Iterator[tuple[str, Any]]:
+        for path, argument in tasks:
+            try:
+                st = Path(path).stat()
+            except OSError as e:
+                # Files that disappeared during the scan are reported as deleted
+                log.warning("Unable to stat %s: %s", path, e)
+                continue
+
+            seen.add(path)
+            entry = entries.get(path)
+            if entry is None or (entry.size, entry.mtime_ns, entry.inode) != (st.st_size, st.st_mtime_ns, st.st_ino):
+                yield path, argument
+
+    updates = []
+    for result in run_chunks(func, changed(), workers=workers, ordered=True, chunksize=chunksize):
+        entry = entries.get(result.path)
+        parsed = result.result is not None
+
+        if entry is not None and entry.key is not None and entry.key == result.key:
+            # Only the metadata changed
+            updates.append((result, manifest.result(result.path)))
+        else:
+            updates.append((result, dumps(result.result) if parsed else None))
+            if parsed or result.error:
+                status = ADDED if entry is None or not entry.parsed else MODIFIED
+                yield Change(status, result.path, result.result, result.error)
+            elif entry is not None and entry.parsed:
+                yield Change(DELETED, result.path, None, None)
+
+        if len(updates) >= batchsize:
+            manifest.update(updates)
+            updates = []
+
+    manifest.update(updates)
+
+    deleted = [path for path in entries if path not in seen]
+    manifest.delete(deleted)
+    manifest.commit()
+
+    for path in deleted:
+        if entries[path].parsed:
+            yield Change(DELETED, path, None, None)
+
+
+def scan(
+    paths: Iterable[str | os.PathLike],
+    manifest: Manifest,
+    workers: int | None = None,
+    chunksize: int = 64,
+    compact: bool = False,
+) -> Iterator[Change]:
+    """Parse LNK files incrementally, only parsing the files that changed since the previous scan with the manifest.
+
+    Only changes are reported: added and modified files with their record, and deleted files. Files that are not in
+    ``paths`` but are in the manifest are considered deleted, so a manifest should be used for scans of the same
+    set of files. The records of all files are kept in the manifest, see :meth:`Manifest.result`.
+
+    Args:
+        paths: Paths of the LNK files to parse.
+        manifest: The manifest of the previous scan, which is updated with the results of this scan.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to parse in this process.
+        chunksize: Number of files to send to a worker at once.
+        compact: Whether to return the records as :class:`LnkRecord` objects instead of dictionaries.
+
+    Returns:
+        An iterator of :class:`Change` tuples.
+    """
+    tasks = ((os.fspath(path), None) for path in paths)
+    for change in scan_changes(tasks, manifest, _scan_chunk, LnkRecord.to_json, workers=workers, chunksize=chunksize):
+        if not compact and change.record is not None:
+            change = change._replace(record=change.record.to_dict())
+        yield change
+
+
+def read_file(path: str | os.PathLike) -> tuple[bytes, os.stat_result]:
+    """Read a file and stat it through the same file descriptor, so the stat result belongs to the contents read.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The contents of the file and its stat result.
+    """
+    with Path(path).open("rb") as fh:
+        return fh.read(), os.fstat(fh.fileno())
+
+
+def _scan_chunk(chunk: list[tuple[str, Any]]) -> list[ScanResult]:
+    results = []
+    for path, _ in chunk:
+        size = mtime_ns = inode = 0
+        key = record = error = None
+        try:
+            data, st = read_file(path)
+            size, mtime_ns, inode = st.st_size, st.st_mtime_ns, st.st_ino
+            key = content_key(data)
+
+            lnk = Lnk.from_buffer(data, fields=RECORD_PROJECTION)
+            if lnk.link_header:
+                record = lnk.to_record()
+            else:
+                error = "Invalid LNK file header"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        results.append(ScanResult(path, size, mtime_ns, inode, key, record, error))
+    return results
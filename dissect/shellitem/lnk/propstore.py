@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from struct import Struct, unpack_from
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from dissect.util import ts
+
+from dissect.shellitem.guid import registry
+from dissect.shellitem.lnk.c_lnk import c_lnk
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+SERIALIZED_PROPERTY_STORAGE_VERSION = 0x53505331  # "1SPS"
+SERIALIZED_PROPERTY_STORAGE_HEADER_SIZE = 0x18
+SERIALIZED_PROPERTY_VALUE_HEADER_SIZE = 0x09
+
+# Storages with this format id contain string named values, all others integer named values
+STRING_NAMED_FORMAT_ID = UUID("d5cdd505-2e9c-101b-9397-08002b2cf9ae")
+
+# Property types as specified in [MS-OLEPS] section 2.15
+VT_EMPTY = 0x0000
+VT_NULL = 0x0001
+VT_DATE = 0x0007
+VT_BSTR = 0x0008
+VT_BOOL = 0x000B
+VT_LPSTR = 0x001E
+VT_LPWSTR = 0x001F
+VT_FILETIME = 0x0040
+VT_BLOB = 0x0041
+VT_CLSID = 0x0048
+VT_VECTOR = 0x1000
+
+_FIXED_SIZE_TYPES = {
+    0x0002: Struct("<h"),  # VT_I2
+    0x0003: Struct("<i"),  # VT_I4
+    0x0004: Struct("<f"),  # VT_R4
+    0x0005: Struct("<d"),  # VT_R8
+    0x0006: Struct("<q"),  # VT_CY
+    VT_DATE: Struct("<d"),
+    0x000A: Struct("<I"),  # VT_ERROR
+    VT_BOOL: Struct("<h"),
+    0x0010: Struct("<b"),  # VT_I1
+    0x0011: Struct("<B"),  # VT_UI1
+    0x0012: Struct("<H"),  # VT_UI2
+    0x0013: Struct("<I"),  # VT_UI4
+    0x0014: Struct("<q"),  # VT_I8
+    0x0015: Struct("<Q"),  # VT_UI8
+    0x0016: Struct("<i"),  # VT_INT
+    0x0017: Struct("<I"),  # VT_UINT
+    VT_FILETIME: Struct("<Q"),
+}
+
+OLE_DATE_EPOCH = datetime(1899, 12, 30, tzinfo=timezone.utc)
+
+# Names of commonly found properties in LNK files, by format id and property id
+PROPERTY_NAMES = {
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 4): "System.ItemTypeText",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 10): "System.ItemNameDisplay",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 12): "System.Size",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 13): "System.FileAttributes",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 14): "System.DateModified",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 15): "System.DateCreated",
+    (UUID("b725f130-47ef-101a-a5f1-02608c9eebac"), 16): "System.DateAccessed",
+    (UUID("28636aa6-953d-11d2-b5d6-00c04fd918d0"), 5): "System.ComputerName",
+    (UUID("28636aa6-953d-11d2-b5d6-00c04fd918d0"), 11): "System.ItemType",
+    (UUID("28636aa6-953d-11d2-b5d6-00c04fd918d0"), 30): "System.ParsingPath",
+    (UUID("e3e0584c-b788-4a5a-bb20-7f5a44c9acdd"), 6): "System.ItemFolderPathDisplay",
+    (UUID("f29f85e0-4ff9-1068-ab91-08002b27b3d9"), 2): "System.Title",
+    (UUID("f29f85e0-4ff9-1068-ab91-08002b27b3d9"), 4): "System.Author",
+    (UUID("9f4c2855-9f79-4b39-a8d0-e1d42de1d5f3"), 5): "System.AppUserModel.ID",
+    (UUID("b9b4b3fc-2b51-4a42-b5d8-324146afcf25"), 2): "System.Link.TargetParsingPath",
+    # Not documented, but commonly observed to contain the SID of the user that created the link
+    (UUID("46588ae2-4cbc-4338-bbfc-139326986dce"), 4): "SID",
+}
+
+
+def _read_string(buf: bytes, offset: int, unicode: bool) -> tuple[str, int]:
+    # Strings are prefixed with their size and padded to a multiple of 4 bytes
+    count = unpack_from("<I", buf, offset)[0]
+    size = count * 2 if unicode else count
+    data = buf[offset + 4 : offset + 4 + size]
+    value = data.decode("utf-16-le" if unicode else "latin-1", errors="surrogatepass" if unicode else "strict")
+    return value.split("\x00", 1)[0], offset + 4 + ((size + 3) & ~3)
+
+
+def _read_lpwstr(buf: bytes, offset: int) -> tuple[str, int]:
+    return _read_string(buf, offset, True)
+
+
+def _read_lpstr(buf: bytes, offset: int) -> tuple[str, int]:
+    return _read_string(buf, offset, False)
+
+
+def _read_bstr(buf: bytes, offset: int) -> tuple[str, int]:
+    # The size of a BSTR is in bytes, the string is UTF-16 in property stores
+    size = unpack_from("<I", buf, offset)[0]
+    data = buf[offset + 4 : offset + 4 + size]
+    value = data.decode("utf-16-le", errors="surrogatepass").split("\x00", 1)[0]
+    return value, offset + 4 + ((size + 3) & ~3)
+
+
+def _read_blob(buf: bytes, offset: int) -> tuple[bytes, int]:
+    size = unpack_from("<I", buf, offset)[0]
+    return buf[offset + 4 : offset + 4 + size], offset + 4 + ((size + 3) & ~3)
+
+
+def _read_clsid(buf: bytes, offset: int) -> tuple[UUID, int]:
+    if len(buf) < offset + 16:
+        raise EOFError("Truncated VT_CLSID value")
+    return registry.guid(buf[offset : offset + 16]), offset + 16
+
+
+_VARIABLE_SIZE_TYPES: dict[int, Callable[[bytes, int], tuple[Any, int]]] = {
+    VT_BSTR: _read_bstr,
+    VT_LPSTR: _read_lpstr,
+    VT_LPWSTR: _read_lpwstr,
+    VT_BLOB: _read_blob,
+    VT_CLSID: _read_clsid,
+}
+
+
+def _read_scalar(vtype: int, buf: bytes, offset: int) -> tuple[Any, int]:
+    if (struct := _FIXED_SIZE_TYPES.get(vtype)) is not None:
+        value = struct.unpack_from(buf, offset)[0]
+        if vtype == VT_BOOL:
+            value = value != 0
+        elif vtype == VT_FILETIME:
+            value = ts.wintimestamp(value)
+        elif vtype == VT_DATE:
+            value = OLE_DATE_EPOCH + timedelta(days=value)
+        return value, offset + struct.size
+
+    return _VARIABLE_SIZE_TYPES[vtype](buf, offset)
+
+
+def decode_typed_value(buf: bytes) -> Any:
+    """Decode a TypedPropertyValue structure, as specified in [MS-OLEPS] section 2.15.
+
+    Values of unsupported types are returned as the raw bytes of the value.
+
+    Args:
+        buf: The TypedPropertyValue structure, starting with its type and padding.
+    """
+    vtype = unpack_from("<H", buf, 0)[0]
+    base_type = vtype & ~VT_VECTOR
+
+    if base_type in (VT_EMPTY, VT_NULL):
+        return None
+
+    if base_type not in _FIXED_SIZE_TYPES and base_type not in _VARIABLE_SIZE_TYPES:
+        return buf[4:]
+
+    if vtype & VT_VECTOR:
+        count = unpack_from("<I", buf, 4)[0]
+        offset = 8
+        values = []
+        for _ in range(count):
+            value, offset = _read_scalar(base_type, buf, offset)
+            values.append(value)
+        return values
+
+    return _read_scalar(vtype, buf, 4)[0]
+
+
+class Property:
+    """A single property in a serialized property store. The value is decoded the first time it is read.
+
+    Args:
+        format_id: The format id of the storage the property is in.
+        id: The integer name of the property, for integer named properties.
+        name: The string name of the property, or the known name of an integer named property.
+        data: The TypedPropertyValue structure of the value.
+    """
+
+    __slots__ = ("_value", "data", "format_id", "id", "name")
+
+    _UNSET = object()
+
+    def __init__(self, format_id: UUID, id: int | None, name: str | None, data: bytes):
+        self.format_id = format_id
+        self.id = id
+        self.name = name
+        self.data = data
+        self._value = self._UNSET
+
+    def __repr__(self) -> str:
+        return f"<Property format_id={self.format_id} id={self.id} name={self.name!r} type={self.type:#x}>"
+
+    def __iter__(self) -> Iterator[Any]:
+        # Allows unpacking a property into a (format id, property id or name, value) tuple
+        yield self.format_id
+        yield self.name if self.id is None else self.id
+        yield self.value
+
+    @property
+    def type(self) -> int:
+        return unpack_from("<H", self.data, 0)[0] if len(self.data) >= 2 else VT_EMPTY
+
+    @property
+    def value(self) -> Any:
+        if self._value is self._UNSET:
+            try:
+                self._value = decode_typed_value(self.data)
+            except Exception as e:
+                log.debug("Failed to decode property %s/%s", self.format_id, self.id or self.name, exc_info=e)
+                self._value = self.data[4:]
+        return self._value
+
+
+class PropertyStore:
+    """A serialized property store, as stored in the PropertyStoreDataBlock of a LNK file.
+
+    The store is walked when it is iterated over and properties are decoded one at a time, so a single property can
+    be looked up without decoding the whole store.
+
+    Args:
+        buf: The serialized property store, a sequence of serialized property storages.
+    """
+
+    def __init__(self, buf: bytes | memoryview):
+        self.buf = bytes(buf)
+
+    def __iter__(self) -> Iterator[Property]:
+        buf = self.buf
+        offset = 0
+
+        while offset + SERIALIZED_PROPERTY_STORAGE_HEADER_SIZE <= len(buf):
+            storage_size, version = unpack_from("<II", buf, offset)
+            if storage_size < SERIALIZED_PROPERTY_STORAGE_HEADER_SIZE or version != SERIALIZED_PROPERTY_STORAGE_VERSION:
+                break
+
+            format_id = registry.guid(buf[offset + 8 : offset + 24])
+            end = min(offset + storage_size, len(buf))
+            yield from self._iter_values(format_id, buf[offset + SERIALIZED_PROPERTY_STORAGE_HEADER_SIZE : end])
+            offset += storage_size
+
+    def _iter_values(self, format_id: UUID, buf: bytes) -> Iterator[Property]:
+        string_named = format_id == STRING_NAMED_FORMAT_ID
+        offset = 0
+
+        while offset + SERIALIZED_PROPERTY_VALUE_HEADER_SIZE <= len(buf):
+            value_size = unpack_from("<I", buf, offset)[0]
+            if value_size < SERIALIZED_PROPERTY_VALUE_HEADER_SIZE or offset + value_size > len(buf):
+                # A value size of zero terminates the storage
+                break
+
+            data = buf[offset : offset + value_size]
+            if string_named:
+                value = c_lnk.SERIALIZED_PROPERTY_STRING_VALUE(data)
+                name = value.name.decode("utf-16-le", errors="surrogatepass").rstrip("\x00")
+                yield Property(format_id, None, name, value.value)
+            else:
+                value = c_lnk.SERIALIZED_PROPERTY_INTEGER_VALUE(data)
+                yield Property(format_id, value.id, PROPERTY_NAMES.get((format_id, value.id)), value.value)
+
+            offset += value_size
+
+    def get(self, key: str | tuple[UUID | str, int], default: Any = None) -> Any:
+        """Return the value of the first property with the given name or (format id, property id) key.
+
+        Args:
+            key: A property name, or a tuple of a format id and an integer property id.
+            default: The value to return if the property is not present.
+        """
+        if isinstance(key, tuple):
+            format_id, property_id = key
+            format_id = UUID(format_id) if isinstance(format_id, str) else format_id
+            for prop in self:
+                if prop.id == property_id and prop.format_id == format_id:
+                    return prop.value
+        else:
+            for prop in self:
+                if prop.name == key:
+                    return prop.value
+
+        return default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return all properties by name, or by ``{format_id}/id`` for properties without a known name."""
+        return {prop.name or f"{{{prop.format_id}}}/{prop.id}": prop.value for prop in self}
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from dissect.shellitem.lnk.c_lnk import c_lnk
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Keys of the flat dictionary returned by Lnk.to_dict()
+RECORD_FIELDS = (
+    "link_flags",
+    "file_flags",
+    "creation_time",
+    "access_time",
+    "write_time",
+    "filesize",
+    "icon_index",
+    "show_command",
+    "name_string",
+    "relative_path",
+    "working_dir",
+    "command_line_arguments",
+    "icon_location",
+    "local_base_path",
+    "common_path_suffix",
+    "target_path",
+    "net_name",
+    "device_name",
+    "drive_type",
+    "drive_serial_number",
+    "machine_id",
+    "volume_droid",
+    "file_droid",
+    "volume_droid_birth",
+    "file_droid_birth",
+    "known_folder_id",
+    "known_folder_name",
+)
+
+# Names and values of the LINK_FLAGS that are stored as boolean attributes of a LnkRecord
+RECORD_FLAGS = tuple(
+    (name, member.value)
+    for name, member in c_lnk.LINK_FLAGS.__members__.items()
+    if name not in ("default", "is_valid", "reserved")
+)
+
+# Fields that hold a datetime, which are written as ISO 8601 strings by LnkRecord.to_json()
+TIMESTAMP_FIELDS = ("creation_time", "access_time", "write_time")
+_TIMESTAMP_INDEXES = tuple(RECORD_FIELDS.index(name) for name in TIMESTAMP_FIELDS)
+
+# Fields that tend to have the same value in many records, of which a single copy is kept in memory
+_INTERNED_FIELDS = ("machine_id", "net_name", "device_name", "known_folder_id", "volume_droid")
+
+
+class LnkRecord:
+    """A compact, flat record of the commonly used fields of a LNK file, as returned by :meth:`Lnk.to_record`.
+
+    The record has the same fields as the dictionary returned by :meth:`Lnk.to_dict`, stored as attributes of a slotted
+    object. Fields that are not present in the LNK file are ``None``. Every LINK_FLAGS flag is available as a boolean
+    attribute, for example ``has_arguments`` or ``run_as_user``.
+
+    Records don't reference the file or any of the parsed structures, so many of them can be kept in memory. Strings
+    that tend to repeat between files, such as the machine id, are interned.
+    """
+
+    __slots__ = (
+        "access_time",
+        "command_line_arguments",
+        "common_path_suffix",
+        "creation_time",
+        "device_name",
+        "drive_serial_number",
+        "drive_type",
+        "file_droid",
+        "file_droid_birth",
+        "file_flags",
+        "filesize",
+        "icon_index",
+        "icon_location",
+        "known_folder_id",
+        "known_folder_name",
+        "link_flags",
+        "local_base_path",
+        "machine_id",
+        "name_string",
+        "net_name",
+        "relative_path",
+        "show_command",
+        "target_path",
+        "volume_droid",
+        "volume_droid_birth",
+        "working_dir",
+        "write_time",
+        *(name for name, _ in RECORD_FLAGS),
+    )
+
+    link_flags: int | None
+    file_flags: int | None
+    creation_time: datetime | None
+    access_time: datetime | None
+    write_time: datetime | None
+    filesize: int | None
+    icon_index: int | None
+    show_command: int | None
+    name_string: str | None
+    relative_path: str | None
+    working_dir: str | None
+    command_line_arguments: str | None
+    icon_location: str | None
+    local_base_path: str | None
+    common_path_suffix: str | None
+    target_path: str | None
+    net_name: str | None
+    device_name: str | None
+    drive_type: int | None
+    drive_serial_number: int | None
+    machine_id: str | None
+    volume_droid: str | None
+    file_droid: str | None
+    volume_droid_birth: str | None
+    file_droid_birth: str | None
+    known_folder_id: str | None
+    known_folder_name: str | None
+
+    def __init__(self, **fields: Any):
+        for name in RECORD_FIELDS:
+            value = fields.pop(name, None)
+            if isinstance(value, str) and name in _INTERNED_FIELDS:
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+        if fields:
+            raise TypeError(f"Unknown LnkRecord fields: {', '.join(fields)}")
+
+        link_flags = self.link_flags or 0
+        for name, value in RECORD_FLAGS:
+            setattr(self, name, bool(link_flags & value))
+
+    def __repr__(self) -> str:
+        return f"<LnkRecord target_path={self.target_path!r} write_time={self.write_time}>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LnkRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the flags are derived from link_flags, so only the fields have to be pickled
+        return (_restore, (tuple(self.to_dict().values()),))
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for name in RECORD_FIELDS:
+            yield name, getattr(self, name)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields of the record as a dictionary, equal to the one returned by :meth:`Lnk.to_dict`."""
+        return dict(self)
+
+    def to_json(self) -> str:
+        """Return the record as a compact JSON array of the values of its fields, see :meth:`from_json`."""
+        values = [getattr(self, name) for name in RECORD_FIELDS]
+        for idx in _TIMESTAMP_INDEXES:
+            if values[idx] is not None:
+                values[idx] = values[idx].isoformat()
+        return json.dumps(values, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> LnkRecord:
+        """Return the record of a JSON array returned by :meth:`to_json`."""
+        values = json.loads(data)
+        for idx in _TIMESTAMP_INDEXES:
+            if values[idx] is not None:
+                values[idx] = datetime.fromisoformat(values[idx])
+        return cls(**dict(zip(RECORD_FIELDS, values, strict=True)))
+
+
+def _restore(values: tuple[Any, ...]) -> LnkRecord:
+    return LnkRecord(**dict(zip(RECORD_FIELDS, values, strict=True)))
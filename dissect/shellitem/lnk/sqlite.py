@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from dissect.shellitem.lnk.batch import prepare_source, run_chunks
+from dissect.shellitem.lnk.carve import LNK_SIGNATURE
+from dissect.shellitem.lnk.lnk import Lnk
+from dissect.shellitem.lnk.record import TIMESTAMP_FIELDS
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+    from typing import BinaryIO
+
+    from typing_extensions import Self
+
+log = logging.getLogger(__name__)
+logging.lastResort = None
+logging.raiseExceptions = False
+
+# Columns of the links table, after its id
+LINK_COLUMNS = (
+    "path",
+    "link_flags",
+    "file_flags",
+    "creation_time",
+    "access_time",
+    "write_time",
+    "filesize",
+    "icon_index",
+    "show_command",
+    "local_base_path",
+    "common_path_suffix",
+    "target_path",
+    "net_name",
+    "device_name",
+    "drive_type",
+    "drive_serial_number",
+    "known_folder_id",
+    "known_folder_name",
+)
+
+# Fields of the STRING_DATA structures, stored as rows of the strings table
+STRING_FIELDS = ("name_string", "relative_path", "working_dir", "command_line_arguments", "icon_location")
+
+# Columns of the tracker table, after its link id
+TRACKER_COLUMNS = ("machine_id", "volume_droid", "file_droid", "volume_droid_birth", "file_droid_birth")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS links (id INTEGER PRIMARY KEY, {", ".join(LINK_COLUMNS)});
+CREATE TABLE IF NOT EXISTS strings (link_id INTEGER REFERENCES links (id), name TEXT, value TEXT);
+CREATE TABLE IF NOT EXISTS tracker (link_id INTEGER PRIMARY KEY REFERENCES links (id), {", ".join(TRACKER_COLUMNS)});
+CREATE TABLE IF NOT EXISTS extra_blocks (
+    link_id INTEGER REFERENCES links (id), position INTEGER, offset INTEGER, size INTEGER, signature INTEGER, name TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    link_id INTEGER REFERENCES links (id), position INTEGER, class_type INTEGER, type TEXT, name TEXT, size INTEGER
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS links_target_path ON links (target_path);
+CREATE INDEX IF NOT EXISTS strings_link_id ON strings (link_id);
+CREATE INDEX IF NOT EXISTS strings_value ON strings (name, value);
+CREATE INDEX IF NOT EXISTS tracker_machine_id ON tracker (machine_id);
+CREATE INDEX IF NOT EXISTS tracker_volume_droid ON tracker (volume_droid);
+CREATE INDEX IF NOT EXISTS extra_blocks_link_id ON extra_blocks (link_id);
+CREATE INDEX IF NOT EXISTS items_link_id ON items (link_id);
+"""
+
+_INSERTS = {
+    "links": f"INSERT INTO links VALUES ({', '.join('?' * (len(LINK_COLUMNS) + 1))})",
+    "strings": "INSERT INTO strings VALUES (?, ?, ?)",
+    "tracker": f"INSERT INTO tracker VALUES ({', '.join('?' * (len(TRACKER_COLUMNS) + 1))})",
+    "extra_blocks": "INSERT INTO extra_blocks VALUES (?, ?, ?, ?, ?, ?)",
+    "items": "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+
+class LinkRows(NamedTuple):
+    """The rows of a single LNK file, without the link id, see :func:`link_rows`."""
+
+    link: tuple[Any, ...]
+    """The values of the :data:`LINK_COLUMNS`."""
+    strings: list[tuple[str, str]]
+    """The name and value of every string of the STRING_DATA."""
+    tracker: tuple[Any, ...] | None
+    """The values of the :data:`TRACKER_COLUMNS`, if the file has a TRACKER_PROPS block."""
+    extra_blocks: list[tuple[int, int, int, str | None]]
+    """The offset, size, signature and name of every extra data block."""
+    items: list[tuple[int | None, str, str | None, int]]
+    """The class type, type name, name and size of every shell item of the TARGET_IDLIST."""
+
+
+def link_rows(lnk: Lnk, path: str | None = None, codepage: str = "utf-8") -> LinkRows:
+    """Return the rows to store a parsed LNK file with in a :class:`SqliteSink`.
+
+    Rows only contain plain values, so they can be produced in a worker process and written in another.
+
+    Args:
+        lnk: The parsed LNK file.
+        path: The path of the LNK file, if known.
+        codepage: The code page to decode ANSI strings with, see :meth:`Lnk.to_dict`.
+    """
+    record = lnk.to_dict(codepage)
+    record["path"] = path
+    for name in TIMESTAMP_FIELDS:
+        if record[name] is not None:
+            record[name] = record[name].isoformat()
+
+    return LinkRows(
+        tuple(record[name] for name in LINK_COLUMNS),
+        [(name, record[name]) for name in STRING_FIELDS if record[name] is not None],
+        tuple(record[name] for name in TRACKER_COLUMNS) if record["volume_droid"] is not None else None,
+        [(block.offset, block.size, block.signature, block.name) for block in lnk.extradata.blocks],
+        [(item.class_type, type(item).__name__, item.name, item.size) for item in lnk.target_idlist.items],
+    )
+
+
+class SqliteSink:
+    """Writes parsed LNK files into normalized tables of a SQLite database, for fast querying of many files.
+
+    Every LNK file is a row in the ``links`` table, which is referenced by its rows in the ``strings``, ``tracker``,
+    ``extra_blocks`` and ``items`` tables. Rows are inserted in batches of ``batchsize`` files, every batch in a
+    single transaction. The indexes on the machine id, volume droid, target path and strings (such as the
+    arguments) are created when the sink is closed, as creating them once is faster than updating them while
+    loading. Files can be added to an existing database.
+
+    Args:
+        path: Path of the database, which is created if it doesn't exist.
+        batchsize: Number of files to insert in a single transaction.
+    """
+
+    def __init__(self, path: str | os.PathLike, batchsize: int = 10000):
+        self.path = path
+        self.batchsize = batchsize
+        self.count = 0
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+        self._next_id = (self.db.execute("SELECT MAX(id) FROM links").fetchone()[0] or 0) + 1
+        self._rows = {table: [] for table in _INSERTS}
+        self._pending = 0
+
+    def write(self, lnk: Lnk, path: str | None = None) -> int:
+        """Add a parsed LNK file, and return its id in the ``links`` table."""
+        return self.write_rows(link_rows(lnk, path))
+
+    def write_rows(self, rows: LinkRows) -> int:
+        """Add the rows of a LNK file returned by :func:`link_rows`, and return its id in the ``links`` table."""
+        link_id = self._next_id
+        self._next_id += 1
+
+        self._rows["links"].append((link_id, *rows.link))
+        self._rows["strings"].extend((link_id, name, value) for name, value in rows.strings)
+        if rows.tracker is not None:
+            self._rows["tracker"].append((link_id, *rows.tracker))
+        self._rows["extra_blocks"].extend((link_id, idx, *block) for idx, block in enumerate(rows.extra_blocks))
+        self._rows["items"].extend((link_id, idx, *item) for idx, item in enumerate(rows.items))
+
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.batchsize:
+            self.flush()
+        return link_id
+
+    def flush(self) -> None:
+        """Insert the pending rows in a single transaction."""
+        with self.db:
+            for table, rows in self._rows.items():
+                if rows:
+                    self.db.executemany(_INSERTS[table], rows)
+                    rows.clear()
+        self._pending = 0
+
+    def close(self) -> None:
+        """Insert the pending rows, create the indexes and close the database."""
+        self.flush()
+        self.db.executescript(INDEXES)
+        self.db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def load(
+    tasks: Iterable[tuple[str | None, str | bytes, bool]],
+    sink: SqliteSink,
+    workers: int | None = None,
+    chunksize: int = 64,
+    codepage: str = "utf-8",
+) -> Iterator[tuple[str | None, int | None, str | None]]:
+    """Parse LNK files in a pool of worker processes and write them into a sink.
+
+    Args:
+        tasks: Tuples of the name of a file, its path or contents, and whether to skip it if it doesn't start with
+            the LNK signature.
+        sink: The sink to write the files into.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to parse in this process.
+        chunksize: Number of files to send to a worker at once.
+        codepage: The code page to decode ANSI strings with.
+
+    Returns:
+        An iterator of ``(name, link_id, error)`` tuples, in the order of the tasks. The link id is ``None`` for
+        files that were skipped or failed to parse.
+    """
+    for name, rows, error in run_chunks(
+        partial(_rows_chunk, codepage=codepage), tasks, workers=workers, ordered=True, chunksize=chunksize
+    ):
+        yield name, sink.write_rows(rows) if rows is not None else None, error
+
+
+def to_sqlite(
+    sources: Iterable[str | os.PathLike | BinaryIO | bytes],
+    path: str | os.PathLike,
+    workers: int | None = None,
+    chunksize: int = 64,
+    batchsize: int = 10000,
+) -> int:
+    """Parse many LNK files using a pool of worker processes and write them into a SQLite database.
+
+    Sources are handled like :func:`~dissect.shellitem.lnk.batch.parse_many` does. Files that fail to parse are
+    logged and skipped. See :class:`SqliteSink` for the layout of the database.
+
+    Args:
+        sources: Paths, file-like objects or bytes of the LNK files to parse.
+        path: Path of the database, which is created if it doesn't exist.
+        workers: Number of worker processes, defaults to the number of CPUs. Use ``0`` to parse in this process.
+        chunksize: Number of sources to send to a worker at once.
+        batchsize: Number of files to insert in a single transaction.
+
+    Returns:
+        The number of LNK files that were written.
+    """
+    tasks = ((*prepare_source(source), False) for source in sources)
+    with SqliteSink(path, batchsize=batchsize) as sink:
+        for name, _, error in load(tasks, sink, workers=workers, chunksize=chunksize):
+            if error:
+                log.error("Unable to parse %s: %s", name, error)
+        return sink.count
+
+
+def _rows_chunk(
+    chunk: list[tuple[str | None, str | bytes, bool]], codepage: str = "utf-8"
+) -> list[tuple[str | None, LinkRows | None, str | None]]:
+    results = []
+    for name, data, check_magic in chunk:
+        rows = error = None
+        try:
+            if isinstance(data, str):
+                data = Path(data).read_bytes()
+
+            if not check_magic or data.startswith(LNK_SIGNATURE):
+                lnk = Lnk.from_buffer(data)
+                if lnk.link_header:
+                    rows = link_rows(lnk, name, codepage)
+                elif not check_magic:
+                    error = "Invalid LNK file header"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        results.append((name, rows, error))
+    return results
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from struct import Struct
+from typing import TYPE_CHECKING, NamedTuple
+
+from dissect.shellitem.lnk.c_lnk import (
+    COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE,
+    EXTRA_DATA_BLOCK_SIGNATURES,
+    LINK_EXTRA_DATA_HEADER_SIZE,
+    LINK_HEADER_SIZE,
+    LINK_INFO_UNICODE_HEADER_SIZE,
+    c_lnk,
+)
+from dissect.shellitem.lnk.header import LINK_CLSID_BYTES
+from dissect.shellitem.lnk.lnk import LnkStringData
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+_UINT16 = Struct("<H")
+_UINT32 = Struct("<I")
+_UINT32_PAIR = Struct("<II")
+# header size, link flags
+_HEADER = Struct("<I16xI")
+# size, header size, flags, volume id offset, local base path offset, common network relative link offset,
+# common path suffix offset
+_LINK_INFO = Struct("<IIIIIII")
+# size, flags, net name offset, device name offset
+_NETWORK_LINK = Struct("<IIII")
+
+_HAS_LINK_TARGET_IDLIST = c_lnk.LINK_FLAGS.has_link_target_idlist.value
+_HAS_LINK_INFO = c_lnk.LINK_FLAGS.has_link_info.value
+_IS_UNICODE = c_lnk.LINK_FLAGS.is_unicode.value
+# Names and flags of the STRING_DATA structures, in the order they are stored
+_STRING_FLAGS = tuple((name, c_lnk.LINK_FLAGS[flag].value) for flag, name in LnkStringData.FLAG_NAMES)
+_VOLUMEID_AND_LOCAL_BASEPATH = c_lnk.LINK_INFO_FLAGS.volumeid_and_local_basepath.value
+_COMMON_NETWORK_RELATIVE_LINK = c_lnk.LINK_INFO_FLAGS.common_network_relative_link_and_pathsuffix.value
+_VALID_DEVICE = c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_device.value
+
+# Minimum size of a VolumeID structure, up to and including its VolumeLabelOffset field
+_VOLUME_ID_MIN_SIZE = 0x10
+# Minimum size of a LinkInfo structure, its header and body without the optional Unicode offsets
+_LINK_INFO_MIN_SIZE = 0x1C
+
+
+class ValidationReport(NamedTuple):
+    """The result of validating the structure of a candidate LNK file with :func:`validate`."""
+
+    valid: bool
+    """Whether no structural errors were found."""
+    size: int | None
+    """The total length of the LNK file up to and including the terminal block, if the end of the file was found."""
+    offsets: dict[str, int]
+    """The offsets of the sections that were found, relative to the start of the file."""
+    errors: tuple[str, ...]
+    """Descriptions of the structural errors."""
+    warnings: tuple[str, ...]
+    """Descriptions of the oddities that the parser tolerates, such as unknown extra data blocks."""
+
+
+def validate(
+    buf: bytes | bytearray | memoryview | mmap, offset: int = 0, max_size: int | None = None
+) -> ValidationReport:
+    """Check the structure of a candidate LNK file in a single pass, without decoding it.
+
+    Only the size and offset fields of the sections are read. The header size and CLSID are checked, the ITEMID sizes
+    must add up to the size of the TARGET_IDLIST, the offsets in the LINK_INFO must fall inside it, the strings must
+    fit in the buffer and the chain of extra data blocks must end with a terminal block. Every step advances through
+    the buffer, so the time spent on a candidate is bounded by the length of the buffer.
+
+    Args:
+        buf: A bytes-like object, ``memoryview`` or ``mmap`` containing the candidate.
+        offset: Offset of the candidate within the buffer.
+        max_size: Maximum length of the LNK file, candidates are validated as if the buffer ends there. Useful to
+            bound the work on a candidate in a large image.
+
+    Returns:
+        A :class:`ValidationReport`, of which the ``size`` can be used to slice the file from a larger buffer.
+    """
+    errors = []
+    warnings = []
+    offsets = {}
+    end = len(buf) if max_size is None else min(len(buf), offset + max_size)
+    start = offset
+
+    def report(size: int | None = None) -> ValidationReport:
+        return ValidationReport(not errors, size, offsets, tuple(errors), tuple(warnings))
+
+    if end - offset < LINK_HEADER_SIZE:
+        errors.append("Buffer is smaller than the SHELL_LINK_HEADER")
+        return report()
+
+    header_size, flags = _HEADER.unpack_from(buf, offset)
+    if header_size != LINK_HEADER_SIZE:
+        errors.append(f"Invalid header size: {header_size:#x}")
+    if buf[offset + 4 : offset + 20] != LINK_CLSID_BYTES:
+        errors.append("Invalid LNK CLSID")
+    if errors:
+        return report()
+
+    offset += LINK_HEADER_SIZE
+
+    if flags & _HAS_LINK_TARGET_IDLIST:
+        offsets["target_idlist"] = offset - start
+        if end - offset < 2:
+            errors.append("TARGET_IDLIST is truncated")
+            return report()
+
+        idlist_size = _UINT16.unpack_from(buf, offset)[0]
+        offset += 2
+        if end - offset < idlist_size:
+            errors.append(f"TARGET_IDLIST of {idlist_size:#x} bytes extends beyond the end of the buffer")
+            return report()
+
+        _validate_idlist(buf, offset, idlist_size, errors)
+        offset += idlist_size
+
+    if flags & _HAS_LINK_INFO:
+        offsets["linkinfo"] = offset - start
+        if end - offset < 4:
+            errors.append("LINK_INFO is truncated")
+            return report()
+
+        link_info_size = _UINT32.unpack_from(buf, offset)[0]
+        if link_info_size < _LINK_INFO_MIN_SIZE:
+            errors.append(f"Invalid LINK_INFO size: {link_info_size:#x}")
+            return report()
+        if end - offset < link_info_size:
+            errors.append(f"LINK_INFO of {link_info_size:#x} bytes extends beyond the end of the buffer")
+            return report()
+
+        _validate_link_info(buf, offset, link_info_size, errors)
+        offset += link_info_size
+
+    char_size = 2 if flags & _IS_UNICODE else 1
+    for name, flag in _STRING_FLAGS:
+        if not flags & flag:
+            continue
+
+        offsets.setdefault("stringdata", offset - start)
+        if end - offset < 2:
+            errors.append(f"STRING_DATA {name} is truncated")
+            return report()
+
+        size = _UINT16.unpack_from(buf, offset)[0] * char_size
+        offset += 2
+        if end - offset < size:
+            errors.append(f"STRING_DATA {name} of {size:#x} bytes extends beyond the end of the buffer")
+            return report()
+        offset += size
+
+    offsets["extradata"] = offset - start
+    while True:
+        if end - offset < 4:
+            errors.append("EXTRA_DATA does not end with a terminal block")
+            return report()
+
+        size = _UINT32.unpack_from(buf, offset)[0]
+        if size < LINK_EXTRA_DATA_HEADER_SIZE:
+            # The parser takes any size too small for a block header as the terminal block
+            if size != 0:
+                warnings.append(f"Invalid terminal block: {size:#x}")
+            return report(offset + 4 - start)
+
+        if end - offset < size:
+            errors.append(f"Extra data block at {offset - start:#x} of {size:#x} bytes extends beyond the buffer")
+            return report()
+
+        signature = _UINT32.unpack_from(buf, offset + 4)[0]
+        if not EXTRA_DATA_BLOCK_SIGNATURES.get_name(signature):
+            warnings.append(f"Unknown extra data block signature at {offset - start:#x}: {signature:#x}")
+        offset += size
+
+
+def _validate_idlist(buf: bytes | memoryview | mmap, offset: int, idlist_size: int, errors: list[str]) -> None:
+    end = offset + idlist_size
+    while end - offset >= 2:
+        size = _UINT16.unpack_from(buf, offset)[0]
+        if size == 0:
+            if offset + 2 != end:
+                errors.append(f"Terminal ITEMID is followed by {end - offset - 2:#x} bytes in the TARGET_IDLIST")
+            return
+
+        if size < 2 or size > end - offset:
+            errors.append(f"ITEMID sizes don't add up to the TARGET_IDLIST size of {idlist_size:#x}")
+            return
+        offset += size
+
+    errors.append("TARGET_IDLIST does not end with a terminal ITEMID")
+
+
+def _validate_link_info(buf: bytes | memoryview | mmap, start: int, size: int, errors: list[str]) -> None:
+    (
+        _,
+        header_size,
+        flags,
+        volumeid_offset,
+        local_basepath_offset,
+        network_link_offset,
+        common_pathsuffix_offset,
+    ) = _LINK_INFO.unpack_from(buf, start)
+
+    if header_size != _LINK_INFO_MIN_SIZE and header_size < LINK_INFO_UNICODE_HEADER_SIZE:
+        errors.append(f"Invalid LINK_INFO header size: {header_size:#x}")
+        return
+    if header_size > size:
+        errors.append(f"LINK_INFO header size {header_size:#x} exceeds the LINK_INFO size of {size:#x}")
+        return
+
+    def check(name: str, offset: int, minimum: int = 1) -> bool:
+        if offset < header_size or offset + minimum > size:
+            errors.append(f"LINK_INFO {name} offset {offset:#x} is outside of the LINK_INFO size of {size:#x}")
+            return False
+        return True
+
+    local_basepath_offset_unicode = common_pathsuffix_offset_unicode = 0
+    if header_size >= LINK_INFO_UNICODE_HEADER_SIZE:
+        local_basepath_offset_unicode, common_pathsuffix_offset_unicode = _UINT32_PAIR.unpack_from(
+            buf, start + _LINK_INFO_MIN_SIZE
+        )
+
+    if flags & _VOLUMEID_AND_LOCAL_BASEPATH:
+        if check("VolumeID", volumeid_offset, _VOLUME_ID_MIN_SIZE):
+            volumeid_size = _UINT32.unpack_from(buf, start + volumeid_offset)[0]
+            if volumeid_size < _VOLUME_ID_MIN_SIZE or volumeid_offset + volumeid_size > size:
+                errors.append(f"LINK_INFO VolumeID size {volumeid_size:#x} is invalid")
+
+        check("LocalBasePath", local_basepath_offset)
+        if local_basepath_offset_unicode:
+            check("LocalBasePathUnicode", local_basepath_offset_unicode, 2)
+
+    if flags & _COMMON_NETWORK_RELATIVE_LINK and check(
+        "CommonNetworkRelativeLink", network_link_offset, COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE
+    ):
+        link_size, link_flags, net_name_offset, device_name_offset = _NETWORK_LINK.unpack_from(
+            buf, start + network_link_offset
+        )
+        if link_size < COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE or network_link_offset + link_size > size:
+            errors.append(f"LINK_INFO CommonNetworkRelativeLink size {link_size:#x} is invalid")
+        elif net_name_offset >= link_size or (link_flags & _VALID_DEVICE and device_name_offset >= link_size):
+            errors.append("CommonNetworkRelativeLink name offsets are outside of the CommonNetworkRelativeLink")
+
+    check("CommonPathSuffix", common_pathsuffix_offset)
+    if common_pathsuffix_offset_unicode:
+        check("CommonPathSuffixUnicode", common_pathsuffix_offset_unicode, 2)
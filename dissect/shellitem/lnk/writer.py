@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from struct import Struct, pack
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from dissect.shellitem.lnk.c_lnk import (
+    COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE,
+    EXTRA_DATA_BLOCK_SIGNATURES,
+    LINK_EXTRA_DATA_HEADER_SIZE,
+    LINK_HEADER_SIZE,
+    LINK_INFO_UNICODE_HEADER_SIZE,
+    c_lnk,
+)
+from dissect.shellitem.lnk.header import LINK_CLSID_BYTES, LinkHeader, read_header
+from dissect.shellitem.lnk.lnk import LnkStringData
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from dissect.shellitem.lnk.lnk import Lnk
+
+# LINK_FLAGS that are derived from the sections present in the builder
+SECTION_FLAGS = (
+    c_lnk.LINK_FLAGS.has_link_target_idlist
+    | c_lnk.LINK_FLAGS.has_link_info
+    | c_lnk.LINK_FLAGS.has_name
+    | c_lnk.LINK_FLAGS.has_relative_path
+    | c_lnk.LINK_FLAGS.has_working_dir
+    | c_lnk.LINK_FLAGS.has_arguments
+    | c_lnk.LINK_FLAGS.has_icon_location
+    | c_lnk.LINK_FLAGS.is_unicode
+).value
+
+# Flags and names of the STRING_DATA structures, in the order they are written
+STRING_FLAGS = tuple((c_lnk.LINK_FLAGS[flag].value, name) for flag, name in LnkStringData.FLAG_NAMES)
+
+# Drive type of a fixed drive and the WNNC_NET_LANMAN network provider type
+DRIVE_FIXED = 3
+WNNC_NET_LANMAN = 0x00020000
+# SW_SHOWNORMAL
+SHOW_NORMAL = 1
+
+FILETIME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+
+_UINT16 = Struct("<H")
+_BLOCK_HEADER = Struct("<II")
+
+
+def _filetime(value: int | datetime) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - FILETIME_EPOCH) // timedelta(microseconds=1) * 10
+    return value
+
+
+def _cstring(value: str | bytes, codepage: str) -> bytes:
+    if isinstance(value, str):
+        value = value.encode(codepage, errors="replace")
+    return value + b"\x00"
+
+
+def _wstring(value: str) -> bytes:
+    return value.encode("utf-16-le", errors="surrogatepass") + b"\x00\x00"
+
+
+def _signature(value: int | str) -> int:
+    return EXTRA_DATA_BLOCK_SIGNATURES[value] if isinstance(value, str) else value
+
+
+def new_header(**fields: Any) -> LinkHeader:
+    """Return a SHELL_LINK_HEADER with sensible defaults, overridden by the given fields.
+
+    Timestamps can be given as ``datetime`` objects or as FILETIME integers, the hotkey as a ``(keycode, modifier)``
+    tuple. The section flags of ``link_flags`` are set by :class:`LnkBuilder` when the file is written.
+
+    Args:
+        fields: Field names and values of ``c_lnk.SHELL_LINK_HEADER``.
+    """
+    header = LinkHeader(LINK_HEADER_SIZE, LINK_CLSID_BYTES, 0, 0, 0, 0, 0, 0, 0, SHOW_NORMAL, 0, 0, 0, 0, 0)
+    for name, value in fields.items():
+        if name not in LinkHeader.FIELDS:
+            raise ValueError(f"Unknown SHELL_LINK_HEADER field: {name!r}")
+
+        if name in ("creation_time", "access_time", "write_time"):
+            value = _filetime(value)
+        elif name == "hotkey_flags":
+            value = type(header.hotkey_flags)(*value)
+        setattr(header, name, value)
+    return header
+
+
+def build_idlist(items: Iterable[bytes], terminal: bytes = b"\x00\x00") -> bytes:
+    """Serialize a LINKTARGET_IDLIST structure.
+
+    Args:
+        items: The data of the ITEMID structures, without their size fields.
+        terminal: The TerminalID following the items.
+    """
+    data = b"".join(_UINT16.pack(len(item) + 2) + item for item in items) + terminal
+    return _UINT16.pack(len(data)) + data
+
+
+def build_linkinfo(
+    local_base_path: str | None = None,
+    common_path_suffix: str = "",
+    volume_label: str = "",
+    drive_type: int = DRIVE_FIXED,
+    drive_serial_number: int = 0,
+    net_name: str | None = None,
+    device_name: str | None = None,
+    net_provider_type: int = WNNC_NET_LANMAN,
+    unicode: bool = True,
+    codepage: str = "cp1252",
+) -> bytes:
+    """Serialize a LINK_INFO structure.
+
+    A VolumeID and LocalBasePath are written if ``local_base_path`` is given, a CommonNetworkRelativeLink if
+    ``net_name`` is given. With ``unicode`` set, the LINK_INFO has a Unicode header and contains both the ANSI and the
+    Unicode versions of the paths.
+
+    Args:
+        local_base_path: The path to the link target on the local volume.
+        common_path_suffix: The path appended to the local base path or network name to get the full target path.
+        volume_label: The label of the local volume.
+        drive_type: The type of drive of the local volume.
+        drive_serial_number: The serial number of the local volume.
+        net_name: The server share path of the network location, for example ``\\\\server\\share``.
+        device_name: The device name of the network location, for example ``Z:``.
+        net_provider_type: The network provider type of the network location.
+        unicode: Whether to write the Unicode versions of the paths.
+        codepage: The code page to encode the ANSI versions of the paths with.
+    """
+    header_size = LINK_INFO_UNICODE_HEADER_SIZE if unicode else 0x1C
+    flags = 0
+    parts = []
+    offset = header_size
+
+    def add(data: bytes) -> int:
+        nonlocal offset
+        parts.append(data)
+        offset += len(data)
+        return offset - len(data)
+
+    volumeid_offset = local_basepath_offset = cnrl_offset = local_basepath_offset_unicode = 0
+    if local_base_path is not None:
+        flags |= c_lnk.LINK_INFO_FLAGS.volumeid_and_local_basepath.value
+        label = _cstring(volume_label, codepage)
+        volumeid_offset = add(pack("<IIII", 0x10 + len(label), drive_type, drive_serial_number, 0x10) + label)
+        local_basepath_offset = add(_cstring(local_base_path, codepage))
+
+    if net_name is not None:
+        flags |= c_lnk.LINK_INFO_FLAGS.common_network_relative_link_and_pathsuffix.value
+        cnrl_offset = add(_build_network_link(net_name, device_name, net_provider_type, unicode, codepage))
+
+    suffix_offset = add(_cstring(common_path_suffix, codepage))
+    suffix_offset_unicode = 0
+    if unicode:
+        if local_base_path is not None:
+            local_basepath_offset_unicode = add(_wstring(local_base_path))
+        suffix_offset_unicode = add(_wstring(common_path_suffix))
+
+    header = pack(
+        "<IIIIIII",
+        offset,
+        header_size,
+        flags,
+        volumeid_offset,
+        local_basepath_offset,
+        cnrl_offset,
+        suffix_offset,
+    )
+    if unicode:
+        header += pack("<II", local_basepath_offset_unicode, suffix_offset_unicode)
+
+    return header + b"".join(parts)
+
+
+def _build_network_link(
+    net_name: str, device_name: str | None, net_provider_type: int, unicode: bool, codepage: str
+) -> bytes:
+    flags = c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_net_type.value
+    header_size = COMMON_NETWORK_RELATIVE_LINK_HEADER_SIZE + (8 if unicode else 0)
+
+    strings = [_cstring(net_name, codepage)]
+    if device_name is not None:
+        flags |= c_lnk.COMMON_NETWORK_RELATIVE_LINK_FLAGS.valid_device.value
+        strings.append(_cstring(device_name, codepage))
+    if unicode:
+        strings.append(_wstring(net_name))
+        if device_name is not None:
+            strings.append(_wstring(device_name))
+
+    offsets = []
+    offset = header_size
+    for data in strings:
+        offsets.append(offset)
+        offset += len(data)
+
+    net_name_offset, *offsets = offsets
+    device_name_offset = offsets.pop(0) if device_name is not None else 0
+    header = pack("<IIIII", offset, flags, net_name_offset, device_name_offset, net_provider_type)
+    if unicode:
+        header += pack("<II", offsets[0], offsets[1] if device_name is not None else 0)
+
+    return header + b"".join(strings)
+
+
+class LnkBuilder:
+    """Builder of LNK files, from a SHELL_LINK_HEADER, an IDList, a LINK_INFO, STRING_DATA and extra data blocks.
+
+    The section flags of the header are derived from the sections that are set: a section is written if it is not
+    ``None``, a string if it is present in ``strings``. Every call of :meth:`dumps` serializes the current state of the
+    builder, so a single builder can be modified and written many times, for example to generate a large corpus.
+
+    Use :meth:`from_lnk` to get the builder of a parsed LNK file, which writes a file identical to the parsed file.
+
+    Args:
+        header: The SHELL_LINK_HEADER, see :func:`new_header`.
+        idlist: The data of the ITEMID structures of the LINKTARGET_IDLIST.
+        linkinfo: The serialized LINK_INFO structure, see :func:`build_linkinfo`.
+        strings: The STRING_DATA by name, for example ``name_string`` or ``command_line_arguments``.
+        extradata: The extra data blocks, as tuples of a signature or block name and the data following the header.
+        unicode: Whether the STRING_DATA is written as Unicode strings.
+        codepage: The code page to encode ANSI strings with.
+    """
+
+    def __init__(
+        self,
+        header: LinkHeader | None = None,
+        idlist: Iterable[bytes] | None = None,
+        linkinfo: bytes | None = None,
+        strings: Mapping[str, str | bytes] | None = None,
+        extradata: Iterable[tuple[int | str, bytes]] | None = None,
+        unicode: bool = True,
+        codepage: str = "cp1252",
+    ):
+        self.header = header if header is not None else new_header()
+        self.idlist = list(idlist) if idlist is not None else None
+        self.idlist_terminal = b"\x00\x00"
+        self.linkinfo = linkinfo
+        self.strings = dict(strings or {})
+        self.extradata = [(_signature(signature), data) for signature, data in extradata or ()]
+        self.terminal_block = 0
+        self.unicode = unicode
+        self.codepage = codepage
+
+    @classmethod
+    def from_lnk(cls, lnk: Lnk) -> LnkBuilder:
+        """Return the builder of a parsed LNK file, which writes a file identical to the parsed file.
+
+        The LINK_INFO, strings and extra data blocks are copied as they are stored in the file, the IDList from its
+        parsed ITEMID structures. The LNK file must be parsed without a field projection and its file-like object must
+        still be open.
+
+        Args:
+            lnk: The parsed LNK file.
+
+        Raises:
+            ValueError: If the LNK file was parsed with a field projection, or exceeded the limits it was parsed with,
+                in which case parts of it were left out.
+        """
+        if not lnk.link_header:
+            raise ValueError("Can't build a LNK file without a valid SHELL_LINK_HEADER")
+        if lnk.fields is not None:
+            raise ValueError("Can't build a LNK file that was parsed with a field projection")
+
+        # Decode every section, so all exceeded limits are known
+        _ = lnk.target_idlist, lnk.linkinfo, lnk.extradata
+        if lnk.stringdata.fh:
+            lnk.stringdata.decode()
+        if anomalies := lnk.anomalies:
+            raise ValueError(f"Can't build a LNK file that exceeded the limits: {'; '.join(anomalies)}")
+
+        header = lnk.link_header
+        builder = cls(
+            header=read_header(header.dumps()),
+            unicode=bool(header.link_flags & c_lnk.LINK_FLAGS.is_unicode),
+        )
+
+        if lnk.flag("has_link_target_idlist"):
+            idlist = lnk.target_idlist.idlist
+            builder.idlist = [bytes(item.data) for item in idlist.itemid_list]
+            builder.idlist_terminal = bytes(idlist.terminalid)
+
+        fh = lnk.fh
+        if lnk.flag("has_link_info"):
+            fh.seek(lnk.offsets["linkinfo"])
+            builder.linkinfo = bytes(fh.read(lnk.linkinfo.size))
+
+        char_size = 2 if builder.unicode else 1
+        for name, offset in lnk.stringdata.offsets.items():
+            fh.seek(offset)
+            data = bytes(fh.read(_UINT16.unpack(fh.read(2))[0] * char_size))
+            # utf-16-le keeps a leading BOM and surrogatepass unpaired surrogates, so the stored bytes are written
+            builder.strings[name] = data.decode("utf-16-le", errors="surrogatepass") if builder.unicode else data
+
+        extradata = lnk.extradata
+        for block in extradata.blocks:
+            extradata.fh.seek(block.offset + LINK_EXTRA_DATA_HEADER_SIZE)
+            builder.extradata.append((block.signature, extradata.fh.read(block.size - LINK_EXTRA_DATA_HEADER_SIZE)))
+        builder.terminal_block = (
+            extradata.terminal_block.terminal_block if extradata.terminal_block is not None else None
+        )
+
+        return builder
+
+    def link_flags(self) -> int:
+        """Return the LINK_FLAGS of the header, with the section flags set to the sections of the builder."""
+        flags = self.header.link_flags & ~SECTION_FLAGS
+        if self.idlist is not None:
+            flags |= c_lnk.LINK_FLAGS.has_link_target_idlist.value
+        if self.linkinfo is not None:
+            flags |= c_lnk.LINK_FLAGS.has_link_info.value
+        for flag, name in STRING_FLAGS:
+            if name in self.strings:
+                flags |= flag
+        if self.unicode:
+            flags |= c_lnk.LINK_FLAGS.is_unicode.value
+        return flags
+
+    def _stringdata(self) -> list[bytes]:
+        parts = []
+        for _, name in STRING_FLAGS:
+            if (value := self.strings.get(name)) is None:
+                continue
+
+            if self.unicode:
+                data = value.encode("utf-16-le", errors="surrogatepass") if isinstance(value, str) else value
+                count = len(data) // 2
+            else:
+                data = value.encode(self.codepage, errors="replace") if isinstance(value, str) else value
+                count = len(data)
+            parts.append(_UINT16.pack(count))
+            parts.append(data)
+        return parts
+
+    def dumps(self) -> bytes:
+        """Return the serialized LNK file."""
+        header = self.header
+        flags = header.link_flags
+        header.link_flags = self.link_flags()
+        try:
+            parts = [header.dumps()]
+        finally:
+            header.link_flags = flags
+
+        if self.idlist is not None:
+            parts.append(build_idlist(self.idlist, self.idlist_terminal))
+        if self.linkinfo is not None:
+            parts.append(self.linkinfo)
+        parts.extend(self._stringdata())
+
+        for signature, data in self.extradata:
+            parts.append(_BLOCK_HEADER.pack(len(data) + LINK_EXTRA_DATA_HEADER_SIZE, signature))
+            parts.append(data)
+        if self.terminal_block is not None:
+            parts.append(pack("<I", self.terminal_block))
+
+        return b"".join(parts)
+
+    def write(self, fh: BinaryIO) -> int:
+        """Write the LNK file to a file-like object.
+
+        Args:
+            fh: The file-like object to write to.
+
+        Returns:
+            The number of bytes written.
+        """
+        return fh.write(self.dumps())
@@ -1,103 +1,375 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import csv
+import json
 import logging
+import os
+import sys
+import time
+from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from dissect.util import ts
 
-from dissect.shellitem.lnk import Lnk
+from dissect.shellitem.lnk.batch import run_chunks
+from dissect.shellitem.lnk.cache import content_key
+from dissect.shellitem.lnk.carve import LNK_SIGNATURE
+from dissect.shellitem.lnk.lnk import RECORD_PROJECTION, Lnk
+from dissect.shellitem.lnk.manifest import Manifest, ScanResult, read_file, scan_changes
+from dissect.shellitem.lnk.sqlite import SqliteSink, load
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from dissect.shellitem.lnk.manifest import Change
 
 log = logging.getLogger(__name__)
 logging.lastResort = None
 logging.raiseExceptions = False
 
+# Only decode the parts of the LNK file that are needed for Lnk.to_dict(), which the records are built from
+PARSE_FIELDS = RECORD_PROJECTION
 
-def parse(path: Path) -> None:
-    lnk_file = Lnk(path.open("rb"))
-    lnk_net_name = lnk_device_name = None
+# Fixed schema of the records written by the structured output modes, in output order
+OUTPUT_FIELDS = (
+    "path",
+    "name",
+    "mtime",
+    "atime",
+    "ctime",
+    "relative_path",
+    "working_dir",
+    "icon_location",
+    "arguments",
+    "local_base_path",
+    "common_path_suffix",
+    "full_path",
+    "net_name",
+    "device_name",
+    "machine_id",
+    "target_mtime",
+    "target_atime",
+    "target_ctime",
+)
 
-    if lnk_file.link_header:
-        lnk_path = path
-        lnk_name = lnk_file.stringdata.name_string.string if lnk_file.flag("has_name") else None
+TEXT_LABELS = {
+    "status": "Change status\t\t\t",
+    "path": "Link Path\t\t\t",
+    "name": "Link Name / description\t\t",
+    "mtime": "Link modification time\t\t",
+    "atime": "Link access time\t\t",
+    "ctime": "Link changed time\t\t",
+    "relative_path": "Link relative path\t\t",
+    "working_dir": "Link working directory\t\t",
+    "icon_location": "Link icon location\t\t",
+    "arguments": "Link arguments\t\t\t",
+    "local_base_path": "Link local base path\t\t",
+    "common_path_suffix": "Link common path suffix\t\t",
+    "full_path": "Link full path\t\t\t",
+    "net_name": "Net name link\t\t\t",
+    "device_name": "Device name link\t\t",
+    "machine_id": "Machine id link\t\t\t",
+    "target_mtime": "Target file modification time\t",
+    "target_atime": "Target file access time\t\t",
+    "target_ctime": "Target file changed time\t",
+}
 
-        lnk_mtime = ts.from_unix(path.stat().st_mtime)
-        lnk_atime = ts.from_unix(path.stat().st_atime)
-        lnk_ctime = ts.from_unix(path.stat().st_ctime)
+OUTPUT_FORMATS = ("text", "json", "jsonl", "csv")
+MATCH_MODES = ("extension", "magic", "both")
 
-        lnk_relativepath = lnk_file.stringdata.relative_path.string if lnk_file.flag("has_relative_path") else None
-        lnk_workdir = lnk_file.stringdata.working_dir.string if lnk_file.flag("has_working_dir") else None
-        lnk_iconlocation = lnk_file.stringdata.icon_location.string if lnk_file.flag("has_icon_location") else None
-        lnk_arguments = lnk_file.stringdata.command_line_arguments.string if lnk_file.flag("has_arguments") else None
-        local_base_path = (
-            lnk_file.linkinfo.local_base_path.decode(errors="backslashreplace")
-            if lnk_file.flag("has_link_info") and lnk_file.linkinfo.flag("volumeid_and_local_basepath")
-            else None
-        )
-        common_path_suffix = (
-            lnk_file.linkinfo.common_path_suffix.decode(errors="backslashreplace")
-            if lnk_file.flag("has_link_info")
-            else None
-        )
 
-        if local_base_path and common_path_suffix:
-            lnk_full_path = local_base_path + common_path_suffix
-        elif local_base_path and not common_path_suffix:
-            lnk_full_path = local_base_path
-        else:
-            lnk_full_path = None
-
-        if lnk_file.flag("has_link_info") and lnk_file.linkinfo.flag("common_network_relative_link_and_pathsuffix"):
-            lnk_net_name = (
-                # TODO add codepage CLI flag to decode for supplied codepage
-                lnk_file.linkinfo.common_network_relative_link.net_name.decode(errors="backslashreplace")
-                if lnk_file.linkinfo.common_network_relative_link.net_name
-                else None
-            )
-            lnk_device_name = (
-                # TODO add codepage CLI flag to decode for supplied codepage
-                lnk_file.linkinfo.common_network_relative_link.device_name.decode(errors="backslashreplace")
-                if lnk_file.linkinfo.common_network_relative_link.device_name
-                else None
-            )
+def record(path: Path, check_magic: bool = False, codepage: str = "utf-8") -> dict[str, Any] | None:
+    """Parse the LNK file at the given path into a flat record with the fields in :data:`OUTPUT_FIELDS`.
+
+    The file is opened and stat'ed once, and closed before returning.
+
+    Args:
+        path: Path to the LNK file.
+        check_magic: Whether to check the LNK header size and CLSID before parsing the file.
+        codepage: The code page to decode ANSI strings with, see :meth:`Lnk.to_dict`.
+
+    Returns:
+        The record, or ``None`` if the file doesn't have a valid LNK header.
+    """
+    with path.open("rb") as fh:
+        if check_magic:
+            if fh.read(len(LNK_SIGNATURE)) != LNK_SIGNATURE:
+                return None
+            fh.seek(0)
 
+        st = os.fstat(fh.fileno())
+        lnk_file = Lnk(fh, fields=PARSE_FIELDS)
+        if not lnk_file.link_header:
+            return None
+
+        return _record(path, st, lnk_file, codepage)
+
+
+def _scan_chunk(chunk: list[tuple[str, bool]], codepage: str = "utf-8") -> list[ScanResult]:
+    """Parse the files of an incremental scan into records, see :func:`scan_changes`."""
+    results = []
+    for path, check_magic in chunk:
+        size = mtime_ns = inode = 0
+        key = lnk_record = error = None
         try:
-            machine_id = lnk_file.extradata.TRACKER_PROPS.machine_id.decode()
-        except AttributeError:
-            machine_id = None
-
-        target_mtime = ts.wintimestamp(lnk_file.link_header.write_time)
-        target_atime = ts.wintimestamp(lnk_file.link_header.access_time)
-        target_ctime = ts.wintimestamp(lnk_file.link_header.creation_time)
-
-        print(
-            f"Link Path\t\t\t: {lnk_path}\n"
-            f"Link Name / description\t\t: {lnk_name}\n"
-            f"Link modification time\t\t: {lnk_mtime}\n"
-            f"Link access time\t\t: {lnk_atime}\n"
-            f"Link changed time\t\t: {lnk_ctime}\n"
-            f"Link relative path\t\t: {lnk_relativepath}\n"
-            f"Link working directory\t\t: {lnk_workdir}\n"
-            f"Link icon location\t\t: {lnk_iconlocation}\n"
-            f"Link arguments\t\t\t: {lnk_arguments}\n"
-            f"Link local base path\t\t: {local_base_path}\n"
-            f"Link common path suffix\t\t: {common_path_suffix}\n"
-            f"Link full path\t\t\t: {lnk_full_path}\n"
-            f"Net name link\t\t\t: {lnk_net_name}\n"
-            f"Device name link\t\t: {lnk_device_name}\n"
-            f"Machine id link\t\t\t: {machine_id}\n"
-            f"Target file modification time\t: {target_mtime}\n"
-            f"Target file access time\t\t: {target_atime}\n"
-            f"Target file changed time\t: {target_ctime}\n"
+            data, st = read_file(path)
+            size, mtime_ns, inode = st.st_size, st.st_mtime_ns, st.st_ino
+            key = content_key(data)
+
+            if not check_magic or data.startswith(LNK_SIGNATURE):
+                lnk_file = Lnk.from_buffer(data, fields=PARSE_FIELDS)
+                if lnk_file.link_header:
+                    lnk_record = _record(Path(path), st, lnk_file, codepage)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        results.append(ScanResult(path, size, mtime_ns, inode, key, lnk_record, error))
+    return results
+
+
+def _record(path: Path, st: os.stat_result, lnk_file: Lnk, codepage: str = "utf-8") -> dict[str, Any]:
+    values = lnk_file.to_dict(codepage)
+
+    return {
+        "path": str(path),
+        "name": values["name_string"],
+        "mtime": ts.from_unix(st.st_mtime),
+        "atime": ts.from_unix(st.st_atime),
+        "ctime": ts.from_unix(st.st_ctime),
+        "relative_path": values["relative_path"],
+        "working_dir": values["working_dir"],
+        "icon_location": values["icon_location"],
+        "arguments": values["command_line_arguments"],
+        "local_base_path": values["local_base_path"],
+        "common_path_suffix": values["common_path_suffix"],
+        "full_path": values["target_path"],
+        "net_name": values["net_name"],
+        "device_name": values["device_name"],
+        "machine_id": values["machine_id"],
+        "target_mtime": values["write_time"],
+        "target_atime": values["access_time"],
+        "target_ctime": values["creation_time"],
+    }
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _dumps(lnk_record: dict[str, Any]) -> str:
+    return json.dumps({field: _serialize(value) for field, value in lnk_record.items()})
+
+
+class RecordWriter:
+    """Writes records to a text stream in one of the :data:`OUTPUT_FORMATS`.
+
+    Every record is written as soon as it is passed in, so output can be streamed into other tools. Timestamps are
+    written in ISO 8601 format by the structured output modes.
+
+    Args:
+        fh: The text stream to write to.
+        fmt: The output format.
+        fields: The fields to write, in output order.
+    """
+
+    def __init__(self, fh: TextIO, fmt: str = "text", fields: tuple[str, ...] = OUTPUT_FIELDS):
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+
+        self.fh = fh
+        self.fmt = fmt
+        self.fields = fields
+        self.count = 0
+        self._csv = csv.DictWriter(fh, fieldnames=fields, lineterminator="\n") if fmt == "csv" else None
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self.fmt == "text":
+            self.fh.write("".join(f"{TEXT_LABELS[field]}: {record[field]}\n" for field in self.fields))
+            self.fh.write("\n")
+        elif self.fmt == "csv":
+            if not self.count:
+                self._csv.writeheader()
+            self._csv.writerow({field: _serialize(record[field]) for field in self.fields})
+        elif self.fmt == "jsonl":
+            self.fh.write(json.dumps({field: _serialize(record[field]) for field in self.fields}) + "\n")
+        else:
+            self.fh.write("[\n" if not self.count else ",\n")
+            self.fh.write(json.dumps({field: _serialize(record[field]) for field in self.fields}))
+
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the output, which is required to produce a valid JSON array in the ``json`` format."""
+        if self.fmt == "json":
+            self.fh.write("\n]\n" if self.count else "[]\n")
+        self.fh.flush()
+
+
+def parse(path: Path, writer: RecordWriter | None = None, codepage: str = "utf-8") -> None:
+    if (lnk_record := record(path, codepage=codepage)) is None:
+        return
+
+    if writer is None:
+        writer = RecordWriter(sys.stdout)
+    writer.write(lnk_record)
+
+
+def walk(
+    paths: Iterable[str | os.PathLike],
+    recursive: bool = False,
+    extensions: tuple[str, ...] = (".lnk",),
+    match: str = "extension",
+) -> Iterator[tuple[str, bool]]:
+    """Yield the files to parse for the given paths, in a deterministic order.
+
+    Files that are given explicitly are always yielded. Directories are walked with ``os.scandir`` if ``recursive``
+    is set, in which case the files in them are filtered on their extension and/or the LNK magic, depending on
+    ``match``. The magic is checked when the file is parsed, so it's read only once.
+
+    Args:
+        paths: The files and directories to parse.
+        recursive: Whether to walk directories.
+        extensions: The lowercase file extensions to match in directories.
+        match: One of :data:`MATCH_MODES`.
+
+    Returns:
+        An iterator of ``(path, check_magic)`` tuples.
+    """
+    check_magic = match in ("magic", "both")
+    check_extension = match in ("extension", "both")
+
+    for path in paths:
+        path = os.fspath(path)
+
+        if not Path(path).is_dir():
+            yield path, False
+            continue
+
+        if not recursive:
+            log.warning("Skipping directory %s, use -r to parse directories recursively", path)
+            continue
+
+        # Items are pushed in reverse, so the files are yielded in the sorted order of their paths
+        stack = [(path, True)]
+        while stack:
+            path, is_dir = stack.pop()
+            if not is_dir:
+                yield path, check_magic
+                continue
+
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name, reverse=True)
+            except OSError as e:
+                log.warning("Unable to read directory %s: %s", path, e)
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, True))
+                elif entry.is_file() and (not check_extension or entry.name.lower().endswith(extensions)):
+                    stack.append((entry.path, False))
+
+
+class Progress:
+    """Keeps track of the number of parsed files and periodically writes a summary to a text stream.
+
+    Args:
+        fh: The text stream to write to.
+        interval: Minimum number of seconds between updates.
+    """
+
+    def __init__(self, fh: TextIO, interval: float = 1.0):
+        self.fh = fh
+        self.interval = interval
+        self.parsed = self.skipped = self.errors = 0
+        self.start = self.last = time.monotonic()
+
+    def update(self, parsed: bool, error: bool) -> None:
+        if error:
+            self.errors += 1
+        elif parsed:
+            self.parsed += 1
+        else:
+            self.skipped += 1
+
+        now = time.monotonic()
+        if now - self.last >= self.interval:
+            self.last = now
+            self.fh.write(self.summary(now) + "\n")
+
+    def summary(self, now: float | None = None) -> str:
+        elapsed = (now or time.monotonic()) - self.start
+        total = self.parsed + self.skipped + self.errors
+        rate = total / elapsed if elapsed else 0.0
+        return (
+            f"{total} files in {elapsed:.1f}s ({rate:.1f} files/s): "
+            f"{self.parsed} parsed, {self.skipped} skipped, {self.errors} errors"
         )
 
 
+def _parse_chunk(
+    chunk: list[tuple[str, bool]], codepage: str = "utf-8"
+) -> list[tuple[str, dict[str, Any] | None, str | None]]:
+    results = []
+    for path, check_magic in chunk:
+        try:
+            results.append((path, record(Path(path), check_magic=check_magic, codepage=codepage), None))
+        except Exception as e:  # noqa: PERF203
+            results.append((path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Parse a .lnk file from your local disk.",
     )
 
-    parser.add_argument("paths", metavar="paths", type=str, nargs="+", help="Path to .lnk file(s).")
+    parser.add_argument("paths", metavar="paths", type=str, nargs="+", help="Path to .lnk file(s) or directories.")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--json", dest="format", action="store_const", const="json", help="Write the records as a JSON array."
+    )
+    output.add_argument(
+        "--jsonl", dest="format", action="store_const", const="jsonl", help="Write one JSON record per line."
+    )
+    output.add_argument("--csv", dest="format", action="store_const", const="csv", help="Write the records as CSV.")
+    output.add_argument("--sqlite", type=Path, metavar="PATH", help="Write the parsed files into a SQLite database.")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Parse the files in directories recursively.")
+    parser.add_argument(
+        "-e",
+        "--extension",
+        dest="extensions",
+        action="append",
+        metavar="EXT",
+        help="File extension to parse in directories, can be given multiple times (default: .lnk).",
+    )
+    parser.add_argument(
+        "--match",
+        choices=MATCH_MODES,
+        default="extension",
+        help="Select files in directories on their extension, the LNK magic or both (default: extension).",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        metavar="PATH",
+        help="Only parse the files that changed since the previous run with this manifest, and only write the changes.",
+    )
+    parser.add_argument(
+        "--codepage",
+        default="utf-8",
+        help="Code page to decode the ANSI strings of LNK files without the is_unicode flag with (default: utf-8).",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes (default: 1).")
+    parser.add_argument("--progress", action="store_true", help="Write progress and a summary to stderr.")
     parser.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
 
     args = parser.parse_args()
@@ -106,13 +378,88 @@ def main() -> None:
     level = levels[min(len(levels) - 1, args.verbose)]
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(message)s")
 
-    for path in args.paths:
-        path = Path(path)
+    extensions = tuple(
+        ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in (args.extensions or [".lnk"])
+    )
+    tasks = walk(args.paths, recursive=args.recursive, extensions=extensions, match=args.match)
+    workers = args.jobs if args.jobs > 1 else 0
 
-        if path.is_dir():
-            continue
+    try:
+        codecs.lookup(args.codepage)
+    except LookupError:
+        parser.error(f"unknown codepage: {args.codepage}")
+
+    if args.sqlite:
+        if args.manifest:
+            parser.error("--sqlite can't be combined with --manifest")
+        _write_sqlite(tasks, args.sqlite, workers, args.progress, args.codepage)
+        return
+
+    if args.manifest:
+        with Manifest(args.manifest, kind="parse-lnk") as manifest:
+            changes = scan_changes(
+                tasks, manifest, partial(_scan_chunk, codepage=args.codepage), _dumps, workers=workers
+            )
+            _write_changes(changes, args.format or "text", args.progress)
+        return
+
+    results = run_chunks(partial(_parse_chunk, codepage=args.codepage), tasks, workers=workers, ordered=True)
+
+    writer = RecordWriter(sys.stdout, args.format or "text")
+    progress = Progress(sys.stderr) if args.progress else None
+    try:
+        for path, lnk_record, error in results:
+            if error:
+                log.error("Unable to parse %s: %s", path, error)
+            elif lnk_record is not None:
+                writer.write(lnk_record)
+
+            if progress:
+                progress.update(lnk_record is not None, error is not None)
+    finally:
+        writer.close()
+        if progress:
+            sys.stderr.write(progress.summary() + "\n")
+
+
+def _write_changes(changes: Iterable[Change], fmt: str, show_progress: bool) -> None:
+    """Write the changes of an incremental scan, as records with an additional ``status`` field."""
+    writer = RecordWriter(sys.stdout, fmt, fields=("status", *OUTPUT_FIELDS))
+    progress = Progress(sys.stderr) if show_progress else None
+    try:
+        for change in changes:
+            if change.error:
+                log.error("Unable to parse %s: %s", change.path, change.error)
+            elif change.record is not None:
+                writer.write({"status": change.status, **change.record})
+            else:
+                writer.write({**dict.fromkeys(OUTPUT_FIELDS), "status": change.status, "path": change.path})
+
+            if progress:
+                progress.update(change.record is not None, change.error is not None)
+    finally:
+        writer.close()
+        if progress:
+            sys.stderr.write(progress.summary() + "\n")
+
+
+def _write_sqlite(
+    tasks: Iterable[tuple[str, bool]], path: Path, workers: int, show_progress: bool, codepage: str = "utf-8"
+) -> None:
+    """Write the parsed files into a SQLite database, see :class:`SqliteSink`."""
+    progress = Progress(sys.stderr) if show_progress else None
+    with SqliteSink(path) as sink:
+        try:
+            sources = ((path, path, magic) for path, magic in tasks)
+            for name, link_id, error in load(sources, sink, workers=workers, codepage=codepage):
+                if error:
+                    log.error("Unable to parse %s: %s", name, error)
 
-        parse(Path(path))
+                if progress:
+                    progress.update(link_id is not None, error is not None)
+        finally:
+            if progress:
+                sys.stderr.write(progress.summary() + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+import typing
+
+if typing.TYPE_CHECKING:
+    from mmap import mmap
+
+
+class ViewStream:
+    """Minimal read-only file-like object over a buffer.
+
+    Reads return ``memoryview`` slices of the underlying buffer instead of copies, so structures parsed from it
+    reference the original ``bytes``, ``memoryview`` or ``mmap`` object. Note that an ``mmap`` can't be closed
+    while such slices are still referenced.
+
+    Args:
+        buf: A bytes-like object, ``memoryview`` or ``mmap``.
+    """
+
+    def __init__(self, buf: bytes | bytearray | memoryview | mmap):
+        view = memoryview(buf)
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+
+        self.view = view
+        self.size = len(view)
+        self.offset = 0
+
+    def read(self, n: int = -1) -> memoryview:
+        start = min(self.offset, self.size)
+        end = self.size if n is None or n < 0 else min(start + n, self.size)
+        self.offset = end
+        return self.view[start:end]
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.offset
+        elif whence == io.SEEK_END:
+            offset += self.size
+
+        if offset < 0:
+            raise ValueError(f"Invalid seek offset: {offset}")
+
+        self.offset = offset
+        return offset
+
+    def tell(self) -> int:
+        return self.offset
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
@@ -0,0 +1,236 @@
+"""Throughput benchmarks of the LNK parser on synthetic corpora.
+
+Measures files/s, MB/s and the peak memory allocated by Python of parsing complete LNK files with ``Lnk``, of each
+section parser separately, of validating the structure, of decoding the headers into columns, of writing LNK files
+with ``LnkBuilder`` and into a SQLite database, and of the ``parse-lnk`` CLI. Results are written as JSON, so runs of
+different releases can be compared.
+
+Run with ``python -m tests.benchmarks``, see ``--help`` for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dissect.shellitem.lnk import Lnk, LnkBuilder, SqliteSink, read_header, read_header_columns, validate
+from dissect.shellitem.lnk.columns import HAS_NUMPY
+from dissect.shellitem.lnk.lnk import LnkExtraData, LnkInfo, LnkStringData, LnkTargetIdList
+from dissect.shellitem.tools import lnk as lnk_tool
+from dissect.shellitem.util import ViewStream
+from tests.benchmarks.corpus import SHAPES, generate_corpus, write_corpus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tests.benchmarks.corpus import CorpusShape
+
+
+def _sections(corpus: list[bytes]) -> dict[str, list[tuple[ViewStream, int, Any]]]:
+    """Return the inputs of the section parsers: a stream, the offset of the section and the LINK_FLAGS."""
+    sections = {name: [] for name in ("target_idlist", "linkinfo", "stringdata", "extradata")}
+    for buf in corpus:
+        lnk = Lnk.from_buffer(buf, lazy=True)
+        for name, offset in lnk.offsets.items():
+            sections[name].append((ViewStream(buf), offset, lnk.flags))
+    return sections
+
+
+def _benchmarks(corpus: list[bytes], paths: list[Path], root: Path) -> dict[str, Callable[[], int]]:
+    """Return the benchmarks by name. Every benchmark parses the whole corpus once and returns the number of files."""
+    sections = _sections(corpus)
+    builders = [LnkBuilder.from_lnk(Lnk.from_buffer(buf)) for buf in corpus]
+
+    def section(name: str, parse: Callable[[ViewStream, Any], object]) -> Callable[[], int]:
+        def run() -> int:
+            for fh, offset, flags in sections[name]:
+                fh.seek(offset)
+                parse(fh, flags)
+            return len(sections[name])
+
+        return run
+
+    def lnk_buffer() -> int:
+        for buf in corpus:
+            Lnk.from_buffer(buf)
+        return len(corpus)
+
+    def lnk_file() -> int:
+        for path in paths:
+            with path.open("rb") as fh:
+                Lnk(fh)
+        return len(paths)
+
+    def lnk_to_dict() -> int:
+        for buf in corpus:
+            Lnk.from_buffer(buf, lazy=True).to_dict()
+        return len(corpus)
+
+    def lnk_to_record() -> int:
+        for buf in corpus:
+            Lnk.from_buffer(buf, lazy=True).to_record()
+        return len(corpus)
+
+    def header() -> int:
+        for buf in corpus:
+            read_header(buf)
+        return len(corpus)
+
+    def validate_all() -> int:
+        for buf in corpus:
+            validate(buf)
+        return len(corpus)
+
+    def header_columns() -> int:
+        return len(read_header_columns(corpus)["index"])
+
+    def sqlite() -> int:
+        with SqliteSink(":memory:") as sink:
+            for buf in corpus:
+                sink.write(Lnk.from_buffer(buf))
+        return len(corpus)
+
+    def write() -> int:
+        for builder in builders:
+            builder.dumps()
+        return len(builders)
+
+    def cli() -> int:
+        argv = sys.argv
+        sys.argv = ["parse-lnk", "--jsonl", "-r", str(root)]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                lnk_tool.main()
+        finally:
+            sys.argv = argv
+        return len(paths)
+
+    return {
+        "lnk.buffer": lnk_buffer,
+        "lnk.file": lnk_file,
+        "lnk.to_dict": lnk_to_dict,
+        "lnk.to_record": lnk_to_record,
+        "section.header": header,
+        "section.validate": validate_all,
+        **({"section.header_columns": header_columns} if HAS_NUMPY else {}),
+        "section.target_idlist": section("target_idlist", lambda fh, _: LnkTargetIdList(fh)),
+        "section.linkinfo": section("linkinfo", lambda fh, _: LnkInfo(fh)),
+        "section.stringdata": section("stringdata", lambda fh, flags: LnkStringData(fh, flags)),
+        "section.extradata": section("extradata", lambda fh, _: LnkExtraData(fh)),
+        "write.lnk": write,
+        "write.sqlite": sqlite,
+        "cli.jsonl": cli,
+    }
+
+
+def _measure(func: Callable[[], int], size: int, repeat: int) -> dict[str, Any]:
+    """Run a benchmark, reporting the fastest of ``repeat`` runs and the peak memory of a separate traced run."""
+    seconds = float("inf")
+    files = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        files = func()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Tracing slows down allocations, so the peak memory is measured separately
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "files": files,
+        "bytes": size,
+        "seconds": seconds,
+        "files_per_sec": files / seconds if seconds else None,
+        "mb_per_sec": size / seconds / 1e6 if seconds else None,
+        "peak_memory": peak_memory,
+    }
+
+
+def run(shape: CorpusShape, repeat: int = 3, names: list[str] | None = None) -> dict[str, Any]:
+    """Run the benchmarks on the corpus of the given shape.
+
+    Args:
+        shape: The shape of the corpus.
+        repeat: Number of runs of every benchmark, the fastest run is reported.
+        names: Names of the benchmarks to run, or ``None`` to run all benchmarks.
+    """
+    corpus = list(generate_corpus(shape))
+    size = sum(len(buf) for buf in corpus)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = write_corpus(root, shape)
+        benchmarks = _benchmarks(corpus, paths, root)
+
+        results = {}
+        for name, func in benchmarks.items():
+            if names and name not in names:
+                continue
+            results[name] = _measure(func, size, repeat)
+            print(f"{name:<24} {results[name]['files_per_sec']:>12,.0f} files/s", file=sys.stderr)
+
+    return {"shape": shape.to_dict(), "corpus_bytes": size, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LNK parsing on synthetic corpora.")
+    parser.add_argument(
+        "-s",
+        "--shape",
+        dest="shapes",
+        action="append",
+        choices=sorted(SHAPES),
+        help="Corpus shape to benchmark, can be given multiple times (default: all shapes).",
+    )
+    parser.add_argument("-n", "--count", type=int, default=1000, help="Number of files per corpus (default: 1000).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the corpus generator (default: 0).")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of runs per benchmark (default: 3).")
+    parser.add_argument(
+        "-b", "--benchmark", dest="benchmarks", action="append", help="Benchmark to run (default: all benchmarks)."
+    )
+    parser.add_argument("-o", "--output", type=Path, help="File to write the JSON results to (default: stdout).")
+    args = parser.parse_args()
+
+    try:
+        package_version = version("dissect.shellitem")
+    except PackageNotFoundError:
+        package_version = None
+
+    report = {
+        "version": package_version,
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpora": {},
+    }
+
+    for name in args.shapes or SHAPES:
+        print(f"Corpus {name}", file=sys.stderr)
+        shape = dataclasses.replace(SHAPES[name], count=args.count, seed=args.seed)
+        report["corpora"][name] = run(shape, repeat=args.repeat, names=args.benchmarks)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
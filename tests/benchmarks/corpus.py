@@ -0,0 +1,221 @@
+"""Deterministic generator for synthetic LNK corpora of a configurable shape."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from struct import pack
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+MY_COMPUTER = bytes.fromhex("e04fd020ea3a6910a2d808002b30309d")
+KNOWN_FOLDERS = [
+    bytes.fromhex("90e24d373f126545916439c4925e467b"),  # Downloads
+    bytes.fromhex("d0d7b1fdd2f6ea4ca3d4b0a6b8b3e6a6"),
+    bytes.fromhex("3accbfb42ff74b4fa18c0f6e3e4b1f3e"),
+]
+WORDS = ["Users", "Documents", "Projects", "report", "backup", "archive", "data", "notes", "setup", "tools", "2024"]
+
+# Flags of the SHELL_LINK_HEADER
+HAS_LINK_TARGET_IDLIST = 0x01
+HAS_LINK_INFO = 0x02
+HAS_NAME = 0x04
+HAS_RELATIVE_PATH = 0x08
+HAS_WORKING_DIR = 0x10
+HAS_ARGUMENTS = 0x20
+HAS_ICON_LOCATION = 0x40
+IS_UNICODE = 0x80
+
+
+@dataclass(frozen=True)
+class CorpusShape:
+    """The shape of a synthetic corpus. Every file in a corpus has the same structure, but different values."""
+
+    count: int = 1000
+    """Number of files."""
+    idlist_items: int = 4
+    """Number of file entry items in the IDList, following a root folder and a volume item."""
+    extra_blocks: int = 2
+    """Number of extra data blocks following the TRACKER_PROPS block."""
+    string_size: int = 32
+    """Number of characters of every string in the STRING_DATA."""
+    network: bool = False
+    """Whether the LinkInfo contains a CommonNetworkRelativeLink instead of a VolumeID and LocalBasePath."""
+    unicode: bool = True
+    """Whether the STRING_DATA is Unicode and the LinkInfo has a Unicode header, instead of ANSI only."""
+    seed: int = 0
+    """Seed of the generator, the same shape and seed always generate the same corpus."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# Shapes that stress the different section parsers
+SHAPES = {
+    "typical": CorpusShape(),
+    "ansi": CorpusShape(unicode=False),
+    "network": CorpusShape(network=True),
+    "deep_idlist": CorpusShape(idlist_items=64),
+    "many_blocks": CorpusShape(extra_blocks=64),
+    "large_strings": CorpusShape(string_size=4096),
+}
+
+
+def _string(rng: random.Random, size: int) -> str:
+    value = ""
+    while len(value) < size:
+        value += rng.choice(WORDS) + "\\"
+    return value[:size]
+
+
+def _cstring(value: str) -> bytes:
+    return value.encode("ascii", errors="replace") + b"\x00"
+
+
+def _wstring(value: str) -> bytes:
+    return (value + "\x00").encode("utf-16-le")
+
+
+def _idlist(rng: random.Random, shape: CorpusShape) -> bytes:
+    items = [b"\x1f\x50" + MY_COMPUTER, b"\x2fC:\\" + b"\x00" * 19]
+
+    for idx in range(shape.idlist_items):
+        name = f"{rng.choice(WORDS)}{idx}"
+        primary_name = _cstring(name)
+        if len(primary_name) % 2:
+            primary_name += b"\x00"
+
+        # BEEF0004 extension block, version 9
+        dostime = pack("<HH", rng.randrange(40 << 9, 44 << 9), rng.randrange(0, 0xBF7D))
+        extension = pack("<II", 0, 0xBEEF0004) + dostime + dostime + pack("<H", 0x2E)
+        extension += pack("<HQQ", 0, rng.getrandbits(48), 0) + pack("<HII", 0, 0, 0) + _wstring(name) + pack("<H", 0x14)
+        extension = pack("<HH", len(extension), 9) + extension[4:]
+
+        class_type = 0x31 if idx < shape.idlist_items - 1 else 0x32
+        item = pack("<BBIIH", class_type, 0, rng.randrange(1 << 24), 0, 0x10) + primary_name + extension
+        items.append(item)
+
+    idlist = b"".join(pack("<H", len(item) + 2) + item for item in items) + b"\x00\x00"
+    return pack("<H", len(idlist)) + idlist
+
+
+def _linkinfo(rng: random.Random, shape: CorpusShape) -> bytes:
+    header_size = 0x24 if shape.unicode else 0x1C
+    suffix = _string(rng, 16).rstrip("\\") + ".exe"
+
+    if shape.network:
+        flags = 0x2
+        net_name = _cstring(f"\\\\{rng.choice(WORDS).upper()}\\share")
+        parts = [pack("<IIIII", 0x14 + len(net_name), 0x2, 0x14, 0, 0x20000) + net_name, _cstring(suffix)]
+        volumeid_offset = local_basepath_offset = 0
+    else:
+        flags = 0x1
+        base_path = "C:\\" + _string(rng, 24)
+        volumeid = pack("<IIII", 0x15, 3, rng.getrandbits(32), 0x10) + b"DATA\x00"
+        parts = [volumeid, _cstring(base_path), _cstring(suffix)]
+
+    if shape.unicode:
+        if not shape.network:
+            parts.append(_wstring(base_path))
+        parts.append(_wstring(suffix))
+
+    offsets = [header_size]
+    for part in parts:
+        offsets.append(offsets[-1] + len(part))
+
+    if shape.network:
+        cnrl_offset, suffix_offset = offsets[0], offsets[1]
+        unicode_offsets = (0, offsets[2]) if shape.unicode else ()
+    else:
+        volumeid_offset, local_basepath_offset, suffix_offset = offsets[:3]
+        cnrl_offset = 0
+        unicode_offsets = (offsets[3], offsets[4]) if shape.unicode else ()
+
+    header = pack(
+        "<IIIIIII", offsets[-1], header_size, flags, volumeid_offset, local_basepath_offset, cnrl_offset, suffix_offset
+    )
+    if shape.unicode:
+        header += pack("<II", *unicode_offsets)
+
+    return header + b"".join(parts)
+
+
+def _stringdata(rng: random.Random, shape: CorpusShape) -> bytes:
+    data = b""
+    for _ in range(5):
+        value = _string(rng, shape.string_size)
+        encoded = value.encode("utf-16-le") if shape.unicode else value.encode("ascii")
+        data += pack("<H", len(value)) + encoded
+    return data
+
+
+def _extradata(rng: random.Random, shape: CorpusShape) -> bytes:
+    machine_id = f"{rng.choice(WORDS).lower()}-{rng.randrange(100)}".encode().ljust(16, b"\x00")[:16]
+    droids = b"".join(rng.getrandbits(128).to_bytes(16, "little") for _ in range(4))
+    blocks = [pack("<IIII", 0x60, 0xA0000003, 0x58, 0) + machine_id + droids]
+
+    for idx in range(shape.extra_blocks):
+        kind = idx % 4
+        if kind == 0:
+            blocks.append(pack("<II", 0x1C, 0xA000000B) + rng.choice(KNOWN_FOLDERS) + pack("<I", 0))
+        elif kind == 1:
+            blocks.append(pack("<IIII", 0x10, 0xA0000005, rng.randrange(0x40), 0))
+        elif kind == 2:
+            target = "%SystemRoot%\\" + _string(rng, 32)
+            blocks.append(
+                pack("<II", 0x314, 0xA0000001)
+                + target.encode("ascii").ljust(260, b"\x00")
+                + target.encode("utf-16-le").ljust(520, b"\x00")
+            )
+        else:
+            blocks.append(pack("<III", 0x0C, 0xA0000004, 1252))
+
+    return b"".join(blocks) + b"\x00\x00\x00\x00"
+
+
+def generate_lnk(shape: CorpusShape, index: int) -> bytes:
+    """Generate the LNK file at the given index in the corpus of the given shape.
+
+    Args:
+        shape: The shape of the corpus.
+        index: The index of the file in the corpus.
+    """
+    rng = random.Random(f"{shape.seed}:{index}")
+
+    flags = HAS_LINK_TARGET_IDLIST | HAS_LINK_INFO | HAS_NAME | HAS_RELATIVE_PATH | HAS_WORKING_DIR | HAS_ARGUMENTS
+    flags |= HAS_ICON_LOCATION | (IS_UNICODE if shape.unicode else 0)
+    timestamps = [0x01D0000000000000 + rng.getrandbits(52) for _ in range(3)]
+    header = pack(
+        "<I16sIIQQQIIIHHII", 0x4C, LINK_CLSID, flags, 0x20, *timestamps, rng.getrandbits(24), 0, 1, 0, 0, 0, 0
+    )
+
+    return header + _idlist(rng, shape) + _linkinfo(rng, shape) + _stringdata(rng, shape) + _extradata(rng, shape)
+
+
+def generate_corpus(shape: CorpusShape) -> Iterator[bytes]:
+    """Generate the LNK files of the corpus of the given shape."""
+    for index in range(shape.count):
+        yield generate_lnk(shape, index)
+
+
+def write_corpus(path: Path, shape: CorpusShape) -> list[Path]:
+    """Write the corpus of the given shape to a directory, spread over subdirectories of 256 files.
+
+    Args:
+        path: The directory to write the corpus to.
+        shape: The shape of the corpus.
+
+    Returns:
+        The paths of the written files, in corpus order.
+    """
+    paths = []
+    for index, data in enumerate(generate_corpus(shape)):
+        file_path = path.joinpath(f"{index // 256:04d}", f"{index:08d}.lnk")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+        paths.append(file_path)
+    return paths
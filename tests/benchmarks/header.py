@@ -0,0 +1,41 @@
+"""Compare the precompiled header reader with decoding the header through ``cstruct``.
+
+Run with ``python -m tests.benchmarks.header``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from uuid import UUID
+
+from dissect.shellitem.lnk import c_lnk, read_header
+from tests.conftest import _build_synthetic_lnk
+
+
+def _cstruct_header(buf: bytes) -> c_lnk.SHELL_LINK_HEADER | None:
+    # The header decoding as done by Lnk before read_header was introduced
+    link_header = c_lnk.SHELL_LINK_HEADER(buf[: c_lnk.SHELL_LINK_HEADER.size])
+    if str(UUID(bytes_le=link_header.link_clsid)) == "00021401-0000-0000-c000-000000000046":
+        return link_header
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SHELL_LINK_HEADER decoding.")
+    parser.add_argument("-n", "--number", type=int, default=100_000, help="Number of headers to decode per run.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of runs, the fastest run is reported.")
+    args = parser.parse_args()
+
+    buf = _build_synthetic_lnk()
+    results = {}
+    for name, func in (("cstruct", _cstruct_header), ("read_header", read_header)):
+        best = min(timeit.repeat(lambda func=func: func(buf), number=args.number, repeat=args.repeat))
+        results[name] = args.number / best
+        print(f"{name:<12} {results[name]:>12,.0f} headers/s")
+
+    print(f"speedup      {results['read_header'] / results['cstruct']:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from struct import pack
 
 import pytest
 
@@ -37,3 +38,82 @@ def win81_downloads_lnk_dir() -> Path:
 @pytest.fixture
 def vista_idlist_lnk_file() -> Path:
     return absolute_path("_data/vista.idlist.lnk")
+
+
+def _build_synthetic_lnk() -> bytes:
+    """Build a small but complete LNK file with every optional section present."""
+    clsid = bytes.fromhex("0114020000000000c000000000000046")
+
+    # LINK_TARGET_IDLIST: a root folder (My Computer) item and a volume item
+    items = [
+        b"\x1f\x50" + bytes.fromhex("e04fd020ea3a6910a2d808002b30309d"),
+        b"\x2fC:\\" + b"\x00" * 19,
+    ]
+    idlist = b"".join(pack("<H", len(item) + 2) + item for item in items) + b"\x00\x00"
+    idlist = pack("<H", len(idlist)) + idlist
+
+    # LINK_INFO with both a VolumeID / LocalBasePath and a CommonNetworkRelativeLink
+    volumeid = pack("<IIII", 0x15, 3, 0x1234ABCD, 0x10) + b"TEST\x00"
+    local_base_path = b"C:\\Windows\\\x00"
+    net_name = b"\\\\SERVER\\share\x00"
+    cnrl = pack("<IIIII", 0x14 + len(net_name), 0x2, 0x14, 0, 0x20000) + net_name
+    common_path_suffix = b"notepad.exe\x00"
+    volumeid_offset = 0x1C
+    local_basepath_offset = volumeid_offset + len(volumeid)
+    cnrl_offset = local_basepath_offset + len(local_base_path)
+    suffix_offset = cnrl_offset + len(cnrl)
+    link_info_size = suffix_offset + len(common_path_suffix)
+    linkinfo = (
+        pack("<III", link_info_size, 0x1C, 0x3)
+        + pack("<IIII", volumeid_offset, local_basepath_offset, cnrl_offset, suffix_offset)
+        + volumeid
+        + local_base_path
+        + cnrl
+        + common_path_suffix
+    )
+
+    # STRING_DATA (unicode): NAME_STRING, WORKING_DIR and COMMAND_LINE_ARGUMENTS
+    stringdata = b"".join(
+        pack("<H", len(value)) + value.encode("utf-16-le")
+        for value in ("Synthetic shortcut", "C:\\Windows", "/A C:\\test.txt")
+    )
+
+    # EXTRA_DATA: TRACKER_PROPS, KNOWN_FOLDER_PROPS and the TERMINAL_BLOCK
+    tracker = pack("<IIII", 0x60, 0xA0000003, 0x58, 0) + b"workstation\x00\x00\x00\x00\x00"
+    tracker += bytes.fromhex("00112233445566778899aabbccddeeff") * 2
+    tracker += bytes.fromhex("ffeeddccbbaa99887766554433221100") * 2
+    known_folder = pack("<II", 0x1C, 0xA000000B) + bytes.fromhex("90e24d373f126545916439c4925e467b") + pack("<I", 0)
+    extradata = tracker + known_folder + b"\x00\x00\x00\x00"
+
+    flags = 0x01 | 0x02 | 0x04 | 0x10 | 0x20 | 0x80
+    header = pack(
+        "<I16sIIQQQIIIHHII",
+        0x4C,
+        clsid,
+        flags,
+        0x20,
+        0x01D0000000000000,
+        0x01D1000000000000,
+        0x01D2000000000000,
+        0x1337,
+        0,
+        1,
+        0,
+        0,
+        0,
+        0,
+    )
+
+    return header + idlist + linkinfo + stringdata + extradata
+
+
+@pytest.fixture
+def synthetic_lnk() -> bytes:
+    return _build_synthetic_lnk()
+
+
+@pytest.fixture
+def synthetic_lnk_file(tmp_path: Path, synthetic_lnk: bytes) -> Path:
+    path = tmp_path.joinpath("synthetic.lnk")
+    path.write_bytes(synthetic_lnk)
+    return path
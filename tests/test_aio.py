@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkRecord, aparse_many
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+
+class SlowReader:
+    """An asynchronous reader that takes a while to return its data, like a read over the network."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, data: bytes, name: str | None = None, delay: float = 0.0):
+        self.data = data
+        self.name = name
+        self.delay = delay
+        self.reads = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        self.reads += 1
+        SlowReader.active += 1
+        SlowReader.peak = max(SlowReader.peak, SlowReader.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            SlowReader.active -= 1
+        return self.data
+
+
+def test_aparse(synthetic_lnk: bytes) -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(synthetic_lnk)
+    reader.feed_eof()
+
+    lnk = asyncio.run(Lnk.aparse(reader))
+    assert lnk.to_dict() == Lnk.from_buffer(synthetic_lnk).to_dict()
+
+    slow = SlowReader(synthetic_lnk)
+    lnk = asyncio.run(Lnk.aparse(slow, fields=["extradata.TRACKER_PROPS.machine_id"]))
+    assert slow.reads == 1
+    assert lnk.projection()["extradata.TRACKER_PROPS.machine_id"].rstrip(b"\x00") == b"workstation"
+
+
+async def _collect(iterator: AsyncIterator) -> list:
+    return [result async for result in iterator]
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_aparse_many(tmp_path: Path, synthetic_lnk: bytes, synthetic_lnk_file: Path, ordered: bool) -> None:
+    missing = tmp_path.joinpath("missing.lnk")
+    rng = random.Random(0)
+
+    async def fetch() -> bytes:
+        await asyncio.sleep(0.001)
+        return synthetic_lnk
+
+    def sources() -> Iterator:
+        for _ in range(10):
+            yield SlowReader(synthetic_lnk, name="remote.lnk", delay=rng.random() / 100)
+            yield from (synthetic_lnk_file, synthetic_lnk, fetch(), b"\x00" * 0x100, missing)
+
+    SlowReader.peak = 0
+    results = asyncio.run(_collect(aparse_many(sources(), concurrency=8, ordered=ordered)))
+
+    assert SlowReader.peak <= 8
+    assert sorted(result.index for result in results) == list(range(60))
+    if ordered:
+        assert [result.index for result in results] == list(range(60))
+
+    expected = Lnk.from_buffer(synthetic_lnk).to_dict()
+    for result in results:
+        if result.index % 6 == 0:
+            assert result.source == "remote.lnk"
+        if result.index % 6 < 4:
+            assert result.error is None
+            assert result.record == expected
+        elif result.index % 6 == 4:
+            assert result.error == "Invalid LNK file header"
+        else:
+            assert result.record is None
+            assert result.error.startswith("FileNotFoundError")
+
+
+def test_aparse_many_async_sources(synthetic_lnk: bytes) -> None:
+    async def sources() -> AsyncIterator[SlowReader]:
+        for _ in range(20):
+            yield SlowReader(synthetic_lnk, delay=0.001)
+
+    async def run() -> list:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await _collect(aparse_many(sources(), concurrency=4, compact=True, executor=executor))
+
+    results = asyncio.run(run())
+    assert len(results) == 20
+    assert all(isinstance(result.record, LnkRecord) for result in results)
+
+
+def test_aparse_many_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(_collect(aparse_many([], concurrency=0)))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkRecord, parse_many
+from dissect.shellitem.lnk.batch import prepare_source
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parse_many(tmp_path: Path, synthetic_lnk: bytes, synthetic_lnk_file: Path, workers: int) -> None:
+    invalid = tmp_path.joinpath("invalid.lnk")
+    invalid.write_bytes(b"\x00" * 0x100)
+    missing = tmp_path.joinpath("missing.lnk")
+
+    sources = []
+    for _ in range(10):
+        sources += [synthetic_lnk_file, str(synthetic_lnk_file), BytesIO(synthetic_lnk), synthetic_lnk]
+        sources += [invalid, missing]
+    results = list(parse_many(sources, workers=workers, ordered=True, chunksize=4))
+
+    assert [result.index for result in results] == list(range(60))
+
+    expected = Lnk(BytesIO(synthetic_lnk)).to_dict()
+    for result in results:
+        if result.index % 6 < 4:
+            assert result.error is None
+            assert result.record == expected
+        elif result.index % 6 == 4:
+            assert result.source == str(invalid)
+            assert result.record is None
+            assert result.error == "Invalid LNK file header"
+        else:
+            assert result.source == str(missing)
+            assert result.record is None
+            assert result.error.startswith("FileNotFoundError")
+
+
+def test_parse_many_unordered(synthetic_lnk: bytes) -> None:
+    results = list(parse_many([synthetic_lnk] * 100, workers=2, chunksize=8))
+
+    assert sorted(result.index for result in results) == list(range(100))
+    assert all(result.record["machine_id"] == "workstation" for result in results)
+    assert all(type(value) in (int, str, datetime) for value in results[0].record.values() if value is not None)
+
+
+def test_parse_many_compact(synthetic_lnk: bytes) -> None:
+    results = list(parse_many([synthetic_lnk] * 10, workers=2, chunksize=4, compact=True))
+
+    expected = Lnk(BytesIO(synthetic_lnk)).to_record()
+    assert all(isinstance(result.record, LnkRecord) for result in results)
+    assert all(result.record == expected for result in results)
+
+
+def test_prepare_source(synthetic_lnk: bytes, synthetic_lnk_file: Path) -> None:
+    assert prepare_source(synthetic_lnk_file) == (str(synthetic_lnk_file), str(synthetic_lnk_file))
+    assert prepare_source(memoryview(synthetic_lnk)) == (None, synthetic_lnk)
+
+    # File-like objects are read, as they can't be sent to a worker process
+    with synthetic_lnk_file.open("rb") as fh:
+        assert prepare_source(fh) == (str(synthetic_lnk_file), synthetic_lnk)
+    assert prepare_source(BytesIO(synthetic_lnk)) == (None, synthetic_lnk)
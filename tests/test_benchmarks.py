@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk
+from tests.benchmarks.__main__ import run
+from tests.benchmarks.corpus import SHAPES, generate_lnk
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_corpus_shapes(name: str) -> None:
+    shape = SHAPES[name]
+    buf = generate_lnk(shape, 7)
+
+    assert buf == generate_lnk(shape, 7)
+    assert buf != generate_lnk(shape, 8)
+
+    lnk = Lnk.from_buffer(buf)
+    assert lnk.size == len(buf)
+    assert len(lnk.target_idlist.items) == shape.idlist_items + 2
+    assert len(lnk.extradata.blocks) == shape.extra_blocks + 1
+    assert len(lnk.stringdata.command_line_arguments.string) == shape.string_size
+    assert lnk.linkinfo.unicode == shape.unicode
+
+    record = lnk.to_dict()
+    assert (record["net_name"] is not None) == shape.network
+    assert (record["local_base_path"] is None) == shape.network
+
+
+def test_benchmark_run() -> None:
+    shape = dataclasses.replace(SHAPES["typical"], count=4)
+    report = run(shape, repeat=1, names=["lnk.buffer", "cli.jsonl"])
+
+    assert report["shape"]["count"] == 4
+    assert set(report["results"]) == {"lnk.buffer", "cli.jsonl"}
+    assert report["results"]["lnk.buffer"]["files"] == 4
+    assert report["results"]["lnk.buffer"]["bytes"] == report["corpus_bytes"]
+    assert report["results"]["cli.jsonl"]["peak_memory"] > 0
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkBuilder, ParseCache, parse_many
+from dissect.shellitem.lnk.cache import MISSING, content_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _variant(synthetic_lnk: bytes, filesize: int) -> bytes:
+    builder = LnkBuilder.from_lnk(Lnk.from_buffer(synthetic_lnk))
+    builder.header.filesize = filesize
+    return builder.dumps()
+
+
+def test_cache_parse(synthetic_lnk: bytes) -> None:
+    cache = ParseCache()
+
+    record = cache.parse(synthetic_lnk)
+    assert record == Lnk.from_buffer(synthetic_lnk).to_record()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    assert cache.parse(bytearray(synthetic_lnk)) is record
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.parse(b"\x00" * 0x100) is None
+    assert cache.parse(b"\x00" * 0x100) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(cache) == 2
+
+
+def test_cache_lru(synthetic_lnk: bytes) -> None:
+    cache = ParseCache(maxsize=2)
+    files = [_variant(synthetic_lnk, filesize) for filesize in range(3)]
+    keys = [content_key(data) for data in files]
+
+    cache.parse(files[0])
+    cache.parse(files[1])
+    assert cache[keys[0]].filesize == 0
+
+    # the least recently used file is evicted
+    cache.parse(files[2])
+    assert len(cache) == 2
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert cache.lookup(keys[1]) is MISSING
+    with pytest.raises(KeyError):
+        cache[keys[1]]
+
+    with pytest.raises(ValueError, match="maxsize"):
+        ParseCache(maxsize=0)
+
+
+def test_cache_store(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("cache.sqlite")
+    expected = Lnk.from_buffer(synthetic_lnk).to_record()
+
+    with ParseCache(path=path) as cache:
+        cache.parse(synthetic_lnk)
+        cache.parse(b"\x00" * 0x100)
+
+    with ParseCache(maxsize=1, path=path) as cache:
+        assert len(cache) == 0
+        assert cache.parse(synthetic_lnk) == expected
+        assert cache.parse(b"\x00" * 0x100) is None
+        assert (cache.hits, cache.misses) == (2, 0)
+
+        # evicted from memory, but still found in the store
+        assert cache[content_key(synthetic_lnk)] == expected
+
+
+def test_cache_store_layout(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("cache.sqlite")
+    with ParseCache(path=path) as cache:
+        cache.parse(synthetic_lnk)
+        cache._db.execute("UPDATE meta SET value = '[]'")
+
+    with ParseCache(path=path) as cache:
+        assert content_key(synthetic_lnk) not in cache
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_parse_many_cache(tmp_path: Path, synthetic_lnk: bytes, compact: bool) -> None:
+    variant = _variant(synthetic_lnk, 1)
+    path = tmp_path.joinpath("variant.lnk")
+    path.write_bytes(variant)
+    missing = tmp_path.joinpath("missing.lnk")
+
+    sources = [synthetic_lnk, path, b"\x00" * 0x100, missing] * 5
+    cache = ParseCache()
+    results = list(parse_many(sources, workers=0, ordered=True, chunksize=3, compact=compact, cache=cache))
+
+    assert [result.index for result in results] == list(range(20))
+    assert (cache.hits, cache.misses) == (12, 3)
+    assert len(cache) == 3
+
+    first = Lnk.from_buffer(synthetic_lnk)
+    second = Lnk.from_buffer(variant)
+    for result in results:
+        kind = result.index % 4
+        if kind < 2:
+            expected = first if kind == 0 else second
+            assert result.record == (expected.to_record() if compact else expected.to_dict())
+            assert result.error is None
+        elif kind == 2:
+            assert result.record is None
+            assert result.error == "Invalid LNK file header"
+        else:
+            assert result.source == str(missing)
+            assert result.error.startswith("FileNotFoundError")
+
+    assert results[1].source == str(path)
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_parse_many_cache_in_flight(synthetic_lnk: bytes, ordered: bool) -> None:
+    # identical files are parsed once, even if the copies are read before the first one is parsed
+    cache = ParseCache()
+    results = list(parse_many([synthetic_lnk, b"\x00" * 0x100] * 50, workers=2, ordered=ordered, cache=cache))
+
+    assert sorted(result.index for result in results) == list(range(100))
+    assert (cache.hits, cache.misses) == (98, 2)
+    assert all(result.record is not None for result in results if result.index % 2 == 0)
+    assert all(result.error is not None for result in results if result.index % 2 == 1)
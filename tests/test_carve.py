@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import mmap
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import carve, carve_parallel
+from dissect.shellitem.lnk.carve import LNK_SIGNATURE, find_signatures
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def image(synthetic_lnk: bytes) -> tuple[bytes, list[int]]:
+    junk = bytes(range(256)) * 16
+    # A signature that is truncated by the end of the image is not a valid LNK file
+    parts = [junk, synthetic_lnk, junk[:1000], synthetic_lnk, synthetic_lnk, junk, LNK_SIGNATURE + b"\x00" * 8]
+    offsets = [len(junk), len(junk) + len(synthetic_lnk) + 1000, len(junk) + 2 * len(synthetic_lnk) + 1000]
+    return b"".join(parts), offsets
+
+
+def test_find_signatures(image: tuple[bytes, list[int]]) -> None:
+    data, offsets = image
+    truncated = len(data) - len(LNK_SIGNATURE) - 8
+
+    assert list(find_signatures(data)) == [*offsets, truncated]
+    # Small chunks make signatures span chunk boundaries
+    for chunk_size in (64, 100, 333):
+        assert list(find_signatures(BytesIO(data), chunk_size=chunk_size)) == [*offsets, truncated]
+
+    # Signatures must start within the range, but may extend beyond it
+    assert list(find_signatures(data, offsets[0], offsets[1] + 1)) == offsets[:2]
+    assert list(find_signatures(BytesIO(data), offsets[0] + 1, offsets[1] + 1, chunk_size=64)) == offsets[1:2]
+
+
+def test_carve(tmp_path: Path, image: tuple[bytes, list[int]], synthetic_lnk: bytes) -> None:
+    data, offsets = image
+    path = tmp_path.joinpath("image.bin")
+    path.write_bytes(data)
+
+    results = list(carve(data))
+    assert [offset for offset, _ in results] == offsets
+    assert all(lnk.stringdata.name_string.string == "Synthetic shortcut" for _, lnk in results)
+
+    with path.open("rb") as fh:
+        assert [offset for offset, _ in carve(fh, chunk_size=128)] == offsets
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            results = list(carve(buf, lazy=True))
+            assert [offset for offset, _ in results] == offsets
+            assert results[1][1].extradata.TRACKER_PROPS.version == 0
+            del results
+
+    results = list(carve_parallel(path, workers=2, shard_size=1000, chunk_size=128))
+    assert [offset for offset, _ in results] == offsets
+    assert results[2][1].linkinfo.local_base_path == b"C:\\Windows\\"
+    # The results own their bytes, so sections can be decoded after the iteration ended
+    assert all(lnk.size == len(synthetic_lnk) for _, lnk in results)
+    assert results[0][1].extradata.KNOWN_FOLDER_PROPS.known_folder_id is not None
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import mmap
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, carve_header_columns, new_header, read_header_columns
+from dissect.shellitem.lnk.columns import HEADER_COLUMNS, filetime_to_datetime64
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+np = pytest.importorskip("numpy")
+
+
+def _expected(buf: bytes) -> dict[str, object]:
+    record = Lnk.from_buffer(buf).to_dict()
+    expected = {name: record[name] for name in HEADER_COLUMNS}
+    for name in ("creation_time", "access_time", "write_time"):
+        value = expected[name]
+        expected[name] = np.datetime64(value.replace(tzinfo=None), "us") if value else np.datetime64("NaT")
+    return expected
+
+
+def test_read_header_columns(synthetic_lnk: bytes) -> None:
+    other = new_header(filesize=1234, show_command=7, icon_index=3, write_time=0).dumps() + b"\x00" * 4
+    buffers = [synthetic_lnk, b"not a lnk file", memoryview(other), synthetic_lnk[:40]]
+
+    columns = read_header_columns(buffers)
+    assert list(columns) == ["index", *HEADER_COLUMNS]
+    assert columns["index"].tolist() == [0, 2]
+    assert columns["write_time"].dtype == np.dtype("datetime64[us]")
+
+    for row, buf in enumerate([synthetic_lnk, other]):
+        for name, value in _expected(buf).items():
+            if isinstance(value, np.datetime64) and np.isnat(value):
+                assert np.isnat(columns[name][row])
+            elif isinstance(value, np.datetime64):
+                # The conversion is exact, datetime values may be rounded to a neighbouring microsecond
+                assert abs(columns[name][row] - value) <= np.timedelta64(1, "us"), name
+            else:
+                assert columns[name][row] == value, name
+
+    assert all(len(column) == 0 for column in read_header_columns([]).values())
+
+
+def test_carve_header_columns(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    junk = bytes(range(256)) * 4
+    data = junk + synthetic_lnk + junk + synthetic_lnk + synthetic_lnk[:20]
+    offsets = [len(junk), 2 * len(junk) + len(synthetic_lnk)]
+
+    columns = carve_header_columns(data)
+    assert columns["offset"].tolist() == offsets
+    assert columns["filesize"].tolist() == [0x1337, 0x1337]
+
+    # Offsets that don't point to a complete, valid header are left out
+    columns = carve_header_columns(data, [0, offsets[1], len(data) - 20, -5])
+    assert columns["offset"].tolist() == offsets[1:]
+
+    path = tmp_path.joinpath("image.bin")
+    path.write_bytes(data)
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert carve_header_columns(mm)["offset"].tolist() == offsets
+
+
+def test_filetime_to_datetime64() -> None:
+    values = np.array([0, 116444736000000000, 132000000001234567, 2**64 - 1], dtype=np.uint64)
+    result = filetime_to_datetime64(values)
+
+    assert np.isnat(result[0])
+    assert result[1] == np.datetime64("1970-01-01T00:00:00", "us")
+    assert result[2] == np.datetime64("2019-04-17T18:40:00.123456", "us")
+    assert np.isnat(result[3])
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from io import BytesIO
+from uuid import UUID, uuid4
+
+from dissect.shellitem.guid import GuidRegistry, guid, guid_name, registry
+from dissect.shellitem.item import RootFolderItem
+from dissect.shellitem.lnk import Lnk
+
+DOWNLOADS = UUID("374de290-123f-4565-9164-39c4925e467b")
+MY_COMPUTER = UUID("20d04fe0-3aea-1069-a2d8-08002b30309d")
+
+
+def test_guid_interned() -> None:
+    value = uuid4()
+    first = guid(value.bytes_le)
+    assert first == value
+    assert guid(bytearray(value.bytes_le)) is first
+    assert guid(memoryview(value.bytes_le)) is first
+
+    assert guid(DOWNLOADS.bytes_le) is guid(bytes(DOWNLOADS.bytes_le))
+
+
+def test_guid_name() -> None:
+    assert guid_name(DOWNLOADS) == "FOLDERID_Downloads"
+    assert guid_name(DOWNLOADS.bytes_le) == "FOLDERID_Downloads"
+    assert guid_name(MY_COMPUTER) == "CLSID_MyComputer"
+    assert guid_name(uuid4()) is None
+    assert guid_name(None) is None
+
+
+def test_guid_registry_maxsize() -> None:
+    registry = GuidRegistry({DOWNLOADS: "Downloads"}, maxsize=2)
+    values = [uuid4() for _ in range(3)]
+    guids = [registry.guid(value.bytes_le) for value in values]
+
+    assert len(registry) == 3
+    assert registry.guid(values[0].bytes_le) is guids[0]
+    assert registry.guid(values[2].bytes_le) is not guids[2]
+    assert registry.guid(values[2].bytes_le) == values[2]
+
+    # Named GUIDs are always interned
+    registry.register(values[0], "First")
+    assert registry.name(values[0]) == "First"
+    registry.clear()
+    assert len(registry) == 2
+    assert dict(registry.names()) == {DOWNLOADS: "Downloads", values[0]: "First"}
+
+
+def test_guid_shared_between_files(synthetic_lnk: bytes) -> None:
+    first = Lnk(BytesIO(synthetic_lnk))
+    second = Lnk(BytesIO(synthetic_lnk))
+
+    assert first.clsid is second.clsid
+    assert first.extradata.KNOWN_FOLDER_PROPS.known_folder_id is registry.guid(DOWNLOADS.bytes_le)
+    assert first.to_dict()["known_folder_name"] == "FOLDERID_Downloads"
+    assert first.to_record().known_folder_name == "FOLDERID_Downloads"
+
+    root = first.target_idlist.items[0]
+    assert isinstance(root, RootFolderItem)
+    assert root.folder_id is second.target_idlist.items[0].folder_id
+    assert root.name == "CLSID_MyComputer"
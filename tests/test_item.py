@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime
+from struct import pack
+from uuid import UUID
+
+from dissect.shellitem.item import (
+    ControlPanelItem,
+    DelegateItem,
+    FileEntryExtensionBlock,
+    FileEntryItem,
+    NetworkLocationItem,
+    RootFolderItem,
+    ShellItem,
+    ShellItemList,
+    UriItem,
+    VolumeItem,
+    shell_item,
+)
+from dissect.shellitem.item.item import SHELL_ITEM_CLASSES
+from dissect.shellitem.lnk import Lnk
+
+# 2020-01-02 10:20:30 as a FAT date followed by a FAT time
+DOS_TIMESTAMP = pack("<HH", (40 << 9) | (1 << 5) | 2, (10 << 11) | (20 << 5) | 15)
+FOLDERID = UUID("374de290-123f-4565-9164-39c4925e467b")
+
+
+def _file_entry(class_type: int = 0x32) -> bytes:
+    long_name = "notepad.exe\x00".encode("utf-16-le")
+    extension = pack("<II", 0, 0xBEEF0004) + DOS_TIMESTAMP + DOS_TIMESTAMP + pack("<H", 0x2E)
+    extension += pack("<HQQ", 0, (3 << 48) | 0x1234, 0) + pack("<HII", 0, 0, 0) + long_name + pack("<H", 0x14)
+    extension = pack("<HH", len(extension), 9) + extension[4:]
+
+    return (
+        bytes([class_type, 0])
+        + pack("<I", 1234)
+        + DOS_TIMESTAMP
+        + pack("<H", 0x20)
+        + b"NOTEPA~1.EXE\x00\x00"
+        + extension
+    )
+
+
+def test_file_entry_item() -> None:
+    item = shell_item(_file_entry())
+
+    assert isinstance(item, FileEntryItem)
+    assert item.is_file
+    assert not item.is_directory
+    assert item.file_size == 1234
+    assert item.file_attributes == 0x20
+    assert item.modification_time == datetime(2020, 1, 2, 10, 20, 30)  # noqa: DTZ001
+    assert item.primary_name == "NOTEPA~1.EXE"
+
+    extension = item.extension
+    assert isinstance(extension, FileEntryExtensionBlock)
+    assert extension.version == 9
+    assert extension.identifier == 0x2E
+    assert extension.creation_time == datetime(2020, 1, 2, 10, 20, 30)  # noqa: DTZ001
+    assert extension.mft_entry == 0x1234
+    assert extension.mft_sequence == 3
+    assert extension.long_name == "notepad.exe"
+    assert item.name == "notepad.exe"
+
+
+def test_shell_items() -> None:
+    root = shell_item(bytes([0x1F, 0x50]) + FOLDERID.bytes_le)
+    assert isinstance(root, RootFolderItem)
+    assert root.folder_id == FOLDERID
+    assert root.size == 20
+
+    volume = shell_item(b"/C:\\" + b"\x00" * 19)
+    assert isinstance(volume, VolumeItem)
+    assert volume.name == "C:\\"
+
+    network = shell_item(b"\x41\x00\xc0\\\\SERVER\\share\x00Share\x00Comment\x00\x00")
+    assert isinstance(network, NetworkLocationItem)
+    assert (network.location, network.description, network.comments) == ("\\\\SERVER\\share", "Share", "Comment")
+
+    uri = shell_item(b"\x61\x80\x00\x00" + "https://example.com\x00".encode("utf-16-le"))
+    assert isinstance(uri, UriItem)
+    assert uri.uri == "https://example.com"
+
+    control_panel = shell_item(b"\x71\x00" + b"\x00" * 10 + FOLDERID.bytes_le)
+    assert isinstance(control_panel, ControlPanelItem)
+    assert control_panel.item_id == FOLDERID
+
+    inner = _file_entry(0x31)
+    delegate_clsid = UUID("59031a47-3f72-44a7-89c5-5595fe6b30ee")
+    delegate = shell_item(
+        b"\x74\x00"
+        + pack("<H", len(inner) + 4)
+        + b"CFSF"
+        + pack("<H", len(inner) + 2)
+        + inner
+        + b"\x00\x00"
+        + UUID("5e591a74-df96-48d3-8d67-1733bcee28ba").bytes_le
+        + delegate_clsid.bytes_le
+    )
+    assert isinstance(delegate, DelegateItem)
+    assert isinstance(delegate.item, FileEntryItem)
+    assert delegate.item.is_directory
+    assert delegate.delegate_class_id == delegate_clsid
+    assert delegate.name == "notepad.exe"
+    assert SHELL_ITEM_CLASSES[0x74] is DelegateItem
+
+    unknown = shell_item(b"\x00\x01\x02")
+    assert type(unknown) is ShellItem
+    assert unknown.class_type == 0
+
+    # Truncated items are returned undecoded
+    assert type(shell_item(b"\x32\x00\x01")) is ShellItem
+
+
+def test_lnk_shell_items(synthetic_lnk: bytes) -> None:
+    lnk = Lnk.from_buffer(synthetic_lnk)
+    items = lnk.target_idlist.items
+
+    assert isinstance(items, ShellItemList)
+    assert len(items) == 2
+    assert items._items == {}
+
+    assert isinstance(items[1], VolumeItem)
+    assert list(items._items) == [1]
+
+    assert isinstance(items[0], RootFolderItem)
+    assert items[0].folder_id == UUID("20d04fe0-3aea-1069-a2d8-08002b30309d")
+    assert items.path() == "C:"
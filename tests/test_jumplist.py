@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from io import BytesIO
+from struct import pack
+
+import pytest
+
+from dissect.shellitem.jumplist import AutomaticDestinations, CustomDestinations
+
+LNK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+FOOTER = pack("<I", 0xBABFFBAB)
+
+
+@pytest.fixture
+def custom_destinations(synthetic_lnk: bytes) -> bytes:
+    title = "Pinned"
+    return b"".join(
+        [
+            pack("<III", 2, 3, 0),
+            pack("<IH", 0, len(title)) + title.encode("utf-16-le") + pack("<I", 2),
+            (LNK_CLSID + synthetic_lnk) * 2,
+            FOOTER,
+            pack("<Ii", 1, 2),
+            FOOTER,
+            pack("<II", 2, 1),
+            LNK_CLSID + synthetic_lnk,
+            FOOTER,
+        ]
+    )
+
+
+def test_custom_destinations(custom_destinations: bytes, synthetic_lnk: bytes) -> None:
+    jumplist = CustomDestinations(BytesIO(custom_destinations))
+
+    assert jumplist.version == 2
+    assert jumplist.category_count == 3
+
+    entries = list(jumplist)
+    first = 12 + 4 + 2 + 12 + 4 + 16
+    second = first + len(synthetic_lnk) + 16
+    third = second + len(synthetic_lnk) + 4 + 8 + 4 + 8 + 16
+
+    assert [(entry.offset, entry.category) for entry in entries] == [
+        (first, "Pinned"),
+        (second, "Pinned"),
+        (third, "Tasks"),
+    ]
+    assert jumplist.index == [(first, "Pinned"), (second, "Pinned"), (third, "Tasks")]
+    assert all(entry.lnk.stringdata.name_string.string == "Synthetic shortcut" for entry in entries)
+
+    # The index gives direct access to any entry
+    assert len(jumplist) == 3
+    assert jumplist[2].offset == third
+    assert jumplist[-1].lnk.extradata.TRACKER_PROPS.version == 0
+
+
+def test_custom_destinations_streaming(custom_destinations: bytes) -> None:
+    jumplist = CustomDestinations(BytesIO(custom_destinations))
+
+    entries = iter(jumplist)
+    assert next(entries).category == "Pinned"
+    assert jumplist._index is None
+
+    # Walking the index doesn't disturb an iteration in progress
+    assert len(jumplist) == 3
+    assert [entry.category for entry in entries] == ["Pinned", "Tasks"]
+
+
+def test_custom_destinations_truncated(custom_destinations: bytes, synthetic_lnk: bytes) -> None:
+    jumplist = CustomDestinations(BytesIO(custom_destinations[:-500]))
+
+    assert [entry.category for entry in jumplist] == ["Pinned", "Pinned"]
+    assert len(jumplist) == 2
+
+    # Truncated in the middle of the size field of the TARGET_IDLIST of the last entry
+    third = len(custom_destinations) - len(synthetic_lnk) - 4
+    jumplist = CustomDestinations(BytesIO(custom_destinations[: third + 0x4C + 1]))
+    assert [entry.category for entry in jumplist] == ["Pinned", "Pinned"]
+
+
+def test_custom_destinations_limits(custom_destinations: bytes) -> None:
+    # An entry of which the LINK_INFO exceeds the limits has no known size, the walk stops after it
+    first = 12 + 4 + 2 + 12 + 4 + 16
+    data = bytearray(custom_destinations)
+    linkinfo = first + 0x4C + 0x31
+    data[linkinfo : linkinfo + 4] = pack("<I", 0xFFFFFFFF)
+
+    entries = list(CustomDestinations(BytesIO(bytes(data))))
+    assert [entry.offset for entry in entries] == [first]
+    assert entries[0].lnk.size is None
+
+
+def _build_cfb(streams: dict[str, bytes]) -> bytes:
+    """Build a version 3 OLE compound file with the given streams in its root storage."""
+    sector_size = 512
+    mini_sector_size = 64
+
+    fat = {}
+    minifat = []
+    ministream = b""
+    big_streams = []
+
+    # sector 0 is the FAT, sectors 1 and 2 the directory, sector 3 the mini FAT
+    directory_entries = [("Root Entry", 5, 0, 0)]
+    next_sector = 4
+
+    for name, data in streams.items():
+        if len(data) < 0x1000:
+            start = len(ministream) // mini_sector_size
+            count = -(-len(data) // mini_sector_size)
+            minifat.extend([*range(start + 1, start + count), 0xFFFFFFFE])
+            ministream += data.ljust(count * mini_sector_size, b"\x00")
+        else:
+            big_streams.append(data)
+            start = None
+        directory_entries.append((name, 2, start, len(data)))
+
+    ministream_start = next_sector
+    ministream_count = -(-len(ministream) // sector_size)
+    next_sector += ministream_count
+    directory_entries[0] = ("Root Entry", 5, ministream_start, len(ministream))
+
+    for sector in range(ministream_start, ministream_start + ministream_count):
+        fat[sector] = sector + 1
+    fat[ministream_start + ministream_count - 1] = 0xFFFFFFFE
+
+    big_data = b""
+    for index, (name, kind, start, size) in enumerate(directory_entries):
+        if kind == 2 and start is None:
+            count = -(-size // sector_size)
+            directory_entries[index] = (name, kind, next_sector, size)
+            for sector in range(next_sector, next_sector + count):
+                fat[sector] = sector + 1
+            fat[next_sector + count - 1] = 0xFFFFFFFE
+            big_data += big_streams.pop(0).ljust(count * sector_size, b"\x00")
+            next_sector += count
+
+    fat.update({0: 0xFFFFFFFD, 1: 2, 2: 0xFFFFFFFE, 3: 0xFFFFFFFE})
+    fat_sector = pack("<128I", *(fat.get(sector, 0xFFFFFFFF) for sector in range(128)))
+
+    directory = b""
+    for index, (name, kind, start, size) in enumerate(directory_entries):
+        encoded = (name + "\x00").encode("utf-16-le")
+        child = 1 if index == 0 else 0xFFFFFFFF
+        right = index + 1 if 0 < index < len(directory_entries) - 1 else 0xFFFFFFFF
+        directory += (
+            encoded.ljust(64, b"\x00")
+            + pack("<HBBIII", len(encoded), kind, 1, 0xFFFFFFFF, right, child)
+            + b"\x00" * 16
+            + pack("<IQQIQ", 0, 0, 0, start, size)
+        )
+    directory = directory.ljust(2 * sector_size, b"\x00")
+
+    header = (
+        bytes.fromhex("d0cf11e0a1b11ae1")
+        + b"\x00" * 16
+        + pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6)
+        + b"\x00" * 6
+        + pack("<IIIIIIIII", 0, 1, 1, 0, 0x1000, 3, 1, 0xFFFFFFFE, 0)
+        + pack("<109I", 0, *([0xFFFFFFFF] * 108))
+    )
+    minifat_sector = pack(f"<{len(minifat)}I", *minifat).ljust(sector_size, b"\xff")
+
+    return (
+        header + fat_sector + directory + minifat_sector + ministream.ljust(ministream_count * sector_size) + big_data
+    )
+
+
+def _build_destlist(entries: list[tuple[int, str, int]], access_time: int = 0x01D2000000000000) -> bytes:
+    data = pack("<IIIfIIII", 4, len(entries), 0, 0, len(entries), 0, 1, 0)
+    for entry_number, path, access_count in entries:
+        data += pack("<Q", 0) + b"\x11" * 64 + b"workstation".ljust(16, b"\x00")
+        data += pack("<IIfQiIIQH", entry_number, 0, 0, access_time, -1, 0, access_count, 0, len(path))
+        data += path.encode("utf-16-le") + pack("<I", 0)
+    return data
+
+
+def test_automatic_destinations(synthetic_lnk: bytes) -> None:
+    destlist = _build_destlist([(2, "C:\\Windows\\notepad.exe", 5), (0x1A, "C:\\test.txt", 1)])
+    data = _build_cfb(
+        {
+            "DestList": destlist,
+            "1a": synthetic_lnk.ljust(0x1400, b"\x00"),
+            "2": synthetic_lnk,
+            "Unrelated": b"\x00" * 100,
+        }
+    )
+    jumplist = AutomaticDestinations(BytesIO(data))
+
+    assert len(jumplist) == 2
+    assert jumplist.ole.get("destlist").size == len(destlist)
+    assert "minifat" not in jumplist.ole.__dict__
+    assert "destlist" not in jumplist.__dict__
+
+    entries = list(jumplist)
+    assert [(entry.entry_id, entry.name) for entry in entries] == [(2, "2"), (0x1A, "1a")]
+    for entry in entries:
+        assert entry.lnk.link_header.filesize == 0x1337
+        assert entry.lnk.stringdata.command_line_arguments.string == "/A C:\\test.txt"
+        assert entry.lnk.extradata.TRACKER_PROPS.machine_id == b"workstation\x00\x00\x00\x00\x00"
+
+    assert jumplist.ole.open("2").read() == synthetic_lnk
+    assert jumplist.ole.open("1A").read() == synthetic_lnk.ljust(0x1400, b"\x00")
+
+    assert [(entry.entry_id, entry.mru_position, entry.hostname) for entry in jumplist.destlist] == [
+        (2, 0, "workstation"),
+        (0x1A, 1, "workstation"),
+    ]
+    assert jumplist.destlist[0].path == "C:\\Windows\\notepad.exe"
+    assert jumplist.destlist[0].access_count == 5
+    assert jumplist.destlist[0].pin_status == -1
+    assert jumplist.destlist[0].access_time.year == 2016
+
+
+def test_automatic_destinations_invalid_access_time() -> None:
+    destlist = _build_destlist([(2, "C:\\Windows\\notepad.exe", 5), (3, "C:\\test.txt", 1)], 0xFFFFFFFFFFFFFFFF)
+    jumplist = AutomaticDestinations(BytesIO(_build_cfb({"DestList": destlist})))
+
+    # A timestamp that is out of range doesn't cost the rest of the DestList
+    assert [(entry.entry_id, entry.access_time) for entry in jumplist.destlist] == [(2, None), (3, None)]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from io import BytesIO
+from struct import pack
+
+import pytest
+
+from dissect.shellitem.lnk import LimitExceeded, Limits, Lnk, LnkBuilder, build_linkinfo, new_header
+from dissect.shellitem.lnk.lnk import LnkExtraData, LnkInfo
+
+
+def test_limits_defaults(synthetic_lnk: bytes) -> None:
+    lnk_file = Lnk.from_buffer(synthetic_lnk)
+    assert lnk_file.anomalies == []
+    assert lnk_file.size == len(synthetic_lnk)
+
+    # The defaults raise nothing for a valid file in strict mode either
+    assert Lnk.from_buffer(synthetic_lnk, limits=Limits(strict=True)).to_dict() == lnk_file.to_dict()
+
+
+def test_limits_extradata_block_size() -> None:
+    # An extra data block claiming to be 4 GiB, followed by nothing
+    buf = new_header().dumps() + pack("<II", 0xFFFFFFF0, 0xA0000003) + b"\x00" * 8
+
+    lnk_file = Lnk.from_buffer(buf)
+    assert lnk_file.extradata.blocks == []
+    assert lnk_file.anomalies == ["End of extra data block at 0x4c of 0x10000003c exceeds max_file_size of 0x1000000"]
+
+    with pytest.raises(LimitExceeded):
+        Lnk.from_buffer(buf, limits=Limits(strict=True))
+
+
+def test_limits_extradata(synthetic_lnk: bytes) -> None:
+    limits = Limits(max_block_size=0x40)
+    lnk_file = Lnk.from_buffer(synthetic_lnk, limits=limits)
+
+    # The oversized blocks are skipped, the blocks following them are still found
+    assert all(block.size <= 0x40 for block in lnk_file.extradata.blocks)
+    assert lnk_file.anomalies
+    assert all("max_block_size" in anomaly for anomaly in lnk_file.anomalies)
+    assert lnk_file.size == len(synthetic_lnk)
+
+    special_folder = pack("<IIII", 0x10, 0xA0000005, 0x24, 0)
+    extradata = LnkExtraData(BytesIO(special_folder * 5 + b"\x00" * 4), limits=Limits(max_block_count=2))
+    assert len(extradata.blocks) == 2
+    assert extradata.terminal_block is None
+    assert extradata.anomalies == ["Number of extra data blocks of 0x3 exceeds max_block_count of 0x2"]
+
+    with pytest.raises(LimitExceeded, match="max_block_count"):
+        LnkExtraData(BytesIO(special_folder * 5 + b"\x00" * 4), limits=Limits(max_block_count=2, strict=True))
+
+
+def test_limits_linkinfo() -> None:
+    linkinfo = bytearray(build_linkinfo("C:\\Windows\\notepad.exe", unicode=False))
+    linkinfo[0:4] = pack("<I", 0xFFFFFFFF)
+    buf = LnkBuilder(new_header(), linkinfo=bytes(linkinfo)).dumps()
+
+    # The LINK_INFO and the sections following it are not parsed
+    lnk_file = Lnk.from_buffer(buf)
+    assert "linkinfo" not in lnk_file.offsets
+    assert lnk_file.linkinfo.link_info is None
+    assert lnk_file.size is None
+    assert lnk_file.anomalies == ["End of the LINK_INFO of 0x10000004b exceeds max_file_size of 0x1000000"]
+
+    with pytest.raises(LimitExceeded):
+        Lnk.from_buffer(buf, limits=Limits(strict=True))
+
+    with pytest.raises(LimitExceeded, match="Size of the LINK_INFO"):
+        LnkInfo(BytesIO(bytes(linkinfo)), limits=Limits(strict=True))
+
+
+def test_limits_stringdata() -> None:
+    strings = {"command_line_arguments": "A" * 100, "icon_location": "C:\\icon.ico"}
+    buf = LnkBuilder(new_header(), strings=strings).dumps()
+
+    lnk_file = Lnk.from_buffer(buf, limits=Limits(max_string_length=20))
+    record = lnk_file.to_dict()
+    assert record["command_line_arguments"] == "A" * 20
+    # The truncated string is skipped, so the strings following it are intact
+    assert record["icon_location"] == "C:\\icon.ico"
+    assert lnk_file.anomalies == ["Length of command_line_arguments of 0x64 exceeds max_string_length of 0x14"]
+
+    with pytest.raises(LimitExceeded):
+        Lnk.from_buffer(buf, limits=Limits(max_string_length=20, strict=True))
+
+
+def test_limits_stringdata_surrogate_pair() -> None:
+    buf = LnkBuilder(new_header(), strings={"name_string": "ab\U0001f600cd"}).dumps()
+
+    # The cut lands in the middle of the surrogate pair, which is dropped as a whole
+    lnk_file = Lnk.from_buffer(buf, limits=Limits(max_string_length=3))
+    assert lnk_file.to_dict()["name_string"] == "ab"
+    assert lnk_file.anomalies == ["Length of name_string of 0x6 exceeds max_string_length of 0x3"]
+
+    lnk_file = Lnk.from_buffer(buf, limits=Limits(max_string_length=4))
+    assert lnk_file.to_dict()["name_string"] == "ab\U0001f600"
+
+
+def test_limits_idlist() -> None:
+    item = pack("<H", 6) + b"\x2f\x00\x00\x00"
+    buf = LnkBuilder(new_header(), idlist=[item[2:]] * 10).dumps()
+
+    lnk_file = Lnk.from_buffer(buf, lazy=True, limits=Limits(max_idlist_items=3))
+    # Anomalies of lazily decoded sections are reported once they are decoded
+    assert lnk_file.anomalies == []
+    assert len(lnk_file.target_idlist.idlist.itemid_list) == 3
+    assert lnk_file.anomalies == ["Number of ITEMID structures of 0x4 exceeds max_idlist_items of 0x3"]
+
+    with pytest.raises(LimitExceeded):
+        Lnk.from_buffer(buf, limits=Limits(max_idlist_items=3, strict=True))
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import mmap
+import subprocess
+import sys
+from io import BytesIO
+from struct import pack
 from typing import TYPE_CHECKING
+from uuid import UUID
 
+import pytest
 from dissect.util.ts import uuid1timestamp
 
-from dissect.shellitem.lnk import Lnk, c_lnk
+from dissect.shellitem.lnk import LinkHeader, Lnk, LnkBuilder, build_linkinfo, c_lnk, read_header
+from dissect.shellitem.lnk.lnk import ExtraDataBlock, LnkExtraData, LnkInfo
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -207,3 +215,235 @@ def test_vista_and_above_idlist_lnk_props(vista_idlist_lnk_file: Path) -> None:
     assert vista_props.size == 0x62  # 98
     assert vista_props.idlist.itemid_list[0].itemid_size == 0x60  # 96
     assert len(vista_props.idlist.itemid_list[0].data) == 0x5E  # 94
+
+
+def test_lnk_lazy(synthetic_lnk: bytes) -> None:
+    lnk_file = Lnk(BytesIO(synthetic_lnk), lazy=True)
+
+    assert lnk_file.link_header.filesize == 0x1337
+    assert lnk_file.offsets == {
+        "target_idlist": 0x4C,
+        "linkinfo": 0x7D,
+        "stringdata": 0xE9,
+        "extradata": 0x143,
+    }
+    assert all(name not in lnk_file.__dict__ for name in ("target_idlist", "linkinfo", "stringdata", "extradata"))
+
+    # Sections can be accessed in any order
+    assert lnk_file.extradata.TRACKER_PROPS.machine_id == b"workstation\x00\x00\x00\x00\x00"
+    assert "stringdata" not in lnk_file.__dict__
+    assert lnk_file.stringdata.command_line_arguments.string == "/A C:\\test.txt"
+    assert lnk_file.linkinfo.local_base_path == b"C:\\Windows\\"
+    assert len(lnk_file.target_idlist.idlist.itemid_list) == 2
+
+    eager = Lnk(BytesIO(synthetic_lnk))
+    assert eager.offsets == lnk_file.offsets
+    assert eager.stringdata.string_data == lnk_file.stringdata.string_data
+    assert eager.linkinfo.link_info == lnk_file.linkinfo.link_info
+
+
+def test_lnk_from_buffer(synthetic_lnk: bytes, synthetic_lnk_file: Path) -> None:
+    with synthetic_lnk_file.open("rb") as fh:
+        expected = Lnk(fh)
+
+    for buf in (synthetic_lnk, bytearray(synthetic_lnk), memoryview(synthetic_lnk)):
+        lnk_file = Lnk.from_buffer(buf)
+
+        assert lnk_file.link_header.dumps() == expected.link_header.dumps()
+        assert lnk_file.offsets == expected.offsets
+        assert lnk_file.linkinfo.link_info == expected.linkinfo.link_info
+        assert lnk_file.stringdata.string_data == expected.stringdata.string_data
+        assert lnk_file.extradata.TRACKER_PROPS == expected.extradata.TRACKER_PROPS
+
+        # ITEMID data is sliced from the buffer instead of being copied
+        items = lnk_file.target_idlist.idlist.itemid_list
+        assert [item.data for item in items] == [item.data for item in expected.target_idlist.idlist.itemid_list]
+        obj = buf.obj if isinstance(buf, memoryview) else buf
+        assert all(isinstance(item.data, memoryview) and item.data.obj is obj for item in items)
+
+
+def test_lnk_from_buffer_mmap(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("image.bin")
+    path.write_bytes(b"\xff" * 0x1000 + synthetic_lnk + b"\xff" * 0x100)
+
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        lnk_file = Lnk.from_buffer(buf, 0x1000, lazy=True)
+
+        assert lnk_file.offsets["target_idlist"] == 0x104C
+        assert lnk_file.stringdata.name_string.string == "Synthetic shortcut"
+        assert lnk_file.linkinfo.common_network_relative_link.net_name == b"\\\\SERVER\\share"
+        assert bytes(lnk_file.target_idlist.idlist.itemid_list[1].data[:3]) == b"/C:"
+
+        del lnk_file
+
+
+def test_lnk_extradata_index(synthetic_lnk: bytes) -> None:
+    fh = BytesIO(synthetic_lnk)
+    fh.seek(0x143)
+    extradata = LnkExtraData(fh, signatures=["KNOWN_FOLDER_PROPS"])
+
+    assert extradata.size == 0x60 + 0x1C + 4
+    assert extradata.blocks == [
+        ExtraDataBlock(0x143, 0x60, 0xA0000003),
+        ExtraDataBlock(0x1A3, 0x1C, 0xA000000B),
+    ]
+    assert [block.name for block in extradata.blocks] == ["TRACKER_PROPS", "KNOWN_FOLDER_PROPS"]
+    assert list(extradata.extradata) == ["KNOWN_FOLDER_PROPS", "TERMINAL_BLOCK"]
+    assert str(extradata.KNOWN_FOLDER_PROPS.known_folder_id) == "374de290-123f-4565-9164-39c4925e467b"
+
+    # Skipped blocks are decoded on first access
+    assert extradata.TRACKER_PROPS.machine_id == b"workstation\x00\x00\x00\x00\x00"
+    assert list(extradata.decode()) == ["KNOWN_FOLDER_PROPS", "TRACKER_PROPS", "TERMINAL_BLOCK"]
+
+    # Lazy LNK files only decode the blocks that are accessed
+    lnk_file = Lnk(BytesIO(synthetic_lnk), lazy=True)
+    assert lnk_file.extradata.TRACKER_PROPS.version == 0
+    assert list(lnk_file.extradata.extradata) == ["TRACKER_PROPS", "TERMINAL_BLOCK"]
+
+
+def test_lnk_extradata_many_blocks() -> None:
+    special_folder = pack("<IIII", 0x10, 0xA0000005, 0x24, 0)
+    unknown = pack("<II", 0xC, 0xDEADBEEF) + b"\xff" * 4
+    fh = BytesIO((special_folder + unknown) * 5000 + b"\x00" * 4)
+
+    extradata = LnkExtraData(fh, signatures=())
+
+    assert len(extradata.blocks) == 10000
+    assert extradata.size == len(fh.getvalue())
+    assert extradata.extradata == {"TERMINAL_BLOCK": extradata.terminal_block}
+    assert extradata.SPECIAL_FOLDER_PROPS.special_folder_id == 0x24
+
+
+def test_lnk_fields(synthetic_lnk: bytes) -> None:
+    fields = [
+        "header.write_time",
+        "stringdata.command_line_arguments.string",
+        "extradata.TRACKER_PROPS.machine_id",
+        "linkinfo.volumeid.drive_serial_number",
+    ]
+    lnk_file = Lnk(BytesIO(synthetic_lnk), fields=fields)
+
+    assert lnk_file.projection() == {
+        "header.write_time": 0x01D2000000000000,
+        "stringdata.command_line_arguments.string": "/A C:\\test.txt",
+        "extradata.TRACKER_PROPS.machine_id": b"workstation\x00\x00\x00\x00\x00",
+        "linkinfo.volumeid.drive_serial_number": 0x1234ABCD,
+    }
+
+    # Only the projected strings and extra data blocks are decoded, other sections are left untouched
+    assert list(lnk_file.stringdata.string_data) == ["command_line_arguments"]
+    assert list(lnk_file.extradata.extradata) == ["TRACKER_PROPS", "TERMINAL_BLOCK"]
+    assert "target_idlist" not in lnk_file.__dict__
+
+    # Strings that were skipped up front are decoded on first access
+    assert lnk_file.get("stringdata.name_string.string") == "Synthetic shortcut"
+    assert list(lnk_file.stringdata.string_data) == ["name_string", "command_line_arguments"]
+    assert lnk_file.to_dict()["working_dir"] == "C:\\Windows"
+    assert list(lnk_file.stringdata.string_data) == ["name_string", "working_dir", "command_line_arguments"]
+    assert lnk_file.get("stringdata.relative_path") is None
+    assert lnk_file.get("extradata.PROPERTY_STORE_PROPS.format_id", "missing") == "missing"
+    assert lnk_file.get("target_idlist.size") == 0x2F
+
+    with pytest.raises(ValueError, match="Unknown LNK section"):
+        Lnk(BytesIO(synthetic_lnk), fields=["footer.size"])
+
+    # Typos in the names of strings or extra data blocks are rejected as well
+    with pytest.raises(ValueError, match="Unknown stringdata name"):
+        Lnk(BytesIO(synthetic_lnk), fields=["stringdata.nope"])
+
+    with pytest.raises(ValueError, match="Unknown extradata name"):
+        Lnk.from_buffer(synthetic_lnk, fields=("header", "extradata.NOPE"))
+
+
+def test_lnk_to_dict_codepage() -> None:
+    builder = LnkBuilder(
+        linkinfo=build_linkinfo(local_base_path="C:\\caf\xe9.txt", unicode=False),
+        strings={"command_line_arguments": "/caf\xe9"},
+        unicode=False,
+    )
+    lnk_file = Lnk.from_buffer(builder.dumps())
+
+    record = lnk_file.to_dict(codepage="cp1252")
+    assert record["local_base_path"] == "C:\\caf\xe9.txt"
+    assert record["command_line_arguments"] == "/caf\xe9"
+    assert lnk_file.to_record(codepage="cp1252").command_line_arguments == "/caf\xe9"
+
+    # Bytes that aren't valid in the code page are escaped
+    assert lnk_file.to_dict()["command_line_arguments"] == "/caf\\xe9"
+
+
+def test_lnk_info_unicode() -> None:
+    def wstring(value: str) -> bytes:
+        return (value + "\x00").encode("utf-16-le")
+
+    volumeid = pack("<IIIII", 0x1E, 3, 0x1234ABCD, 0x14, 0x14) + wstring("DATA")
+    net_name, device_name = b"\\\\SERVER\\share\x00", b"Z:\x00"
+    net_name_unicode, device_name_unicode = wstring("\\\\SERVER\\share\u00e9"), wstring("Z:")
+    names = net_name + device_name + net_name_unicode + device_name_unicode
+    name_offsets = [0x1C]
+    for name in (net_name, device_name, net_name_unicode):
+        name_offsets.append(name_offsets[-1] + len(name))
+    device_offset, net_unicode_offset, device_unicode_offset = name_offsets[1:]
+    link = pack(
+        "<IIIIIII", 0x1C + len(names), 3, 0x1C, device_offset, 0x00020000, net_unicode_offset, device_unicode_offset
+    )
+    link += names
+
+    local_base_path, local_base_path_unicode = b"C:\\Users\\J?rgen\\\x00", wstring("C:\\Users\\J\u00fcrgen\\")
+    suffix, suffix_unicode = b"r?sum?.txt\x00", wstring("r\u00e9sum\u00e9.txt")
+
+    offsets = [0x24]
+    for part in (volumeid, local_base_path, link, suffix, local_base_path_unicode):
+        offsets.append(offsets[-1] + len(part))
+    body = volumeid + local_base_path + link + suffix + local_base_path_unicode + suffix_unicode
+    header = pack("<IIII", 0x24 + len(body), 0x24, 3, offsets[0]) + pack("<IIIII", *offsets[1:])
+    linkinfo = LnkInfo(BytesIO(header + body))
+
+    assert linkinfo.unicode
+    link_info = linkinfo.link_info
+    assert link_info.volumeid.volume_label_offset_unicode == 0x14
+    assert link_info.volumeid.drive_serial_number == 0x1234ABCD
+    assert link_info.local_base_path == b"C:\\Users\\J?rgen\\"
+    assert link_info.local_base_path_unicode == "C:\\Users\\J\u00fcrgen\\"
+    assert link_info.common_path_suffix == b"r?sum?.txt"
+    assert link_info.common_path_suffix_unicode == "r\u00e9sum\u00e9.txt"
+    assert link_info.common_network_relative_link.net_name == b"\\\\SERVER\\share"
+    assert link_info.common_network_relative_link.net_name_unicode == "\\\\SERVER\\share\u00e9"
+    assert link_info.common_network_relative_link.device_name_unicode == "Z:"
+
+
+def test_read_header(synthetic_lnk: bytes) -> None:
+    header = read_header(synthetic_lnk)
+
+    assert isinstance(header, LinkHeader)
+    assert header.header_size == 0x4C
+    assert header.clsid == UUID("00021401-0000-0000-c000-000000000046")
+    assert header.link_flags & c_lnk.LINK_FLAGS.has_link_target_idlist
+    # The flags are returned as cstruct flags, like the fields of c_lnk.SHELL_LINK_HEADER
+    assert isinstance(header.link_flags, c_lnk.LINK_FLAGS)
+    assert isinstance(header.file_flags, c_lnk.FILE_ATTRIBUTE)
+    assert header.link_flags == header.structure().link_flags
+    assert header.file_flags.name == "ARCHIVE"
+    assert isinstance(Lnk.from_buffer(synthetic_lnk).flags, c_lnk.LINK_FLAGS)
+    assert header.filesize == 0x1337
+    assert header.write_time == 0x01D2000000000000
+    assert header.dumps() == synthetic_lnk[:0x4C]
+    assert header.structure().dumps() == synthetic_lnk[:0x4C]
+
+    assert read_header(memoryview(b"\x00" * 8 + synthetic_lnk), offset=8).filesize == 0x1337
+    assert read_header(synthetic_lnk[:0x4B]) is None
+    assert read_header(synthetic_lnk[:4] + b"\x00" * 16 + synthetic_lnk[20:]) is None
+    assert read_header(b"\x4d" + synthetic_lnk[1:]) is None
+
+    assert isinstance(Lnk.from_buffer(synthetic_lnk).link_header, LinkHeader)
+
+
+def test_lnk_package_import() -> None:
+    # Importing the package doesn't pull in the dependencies of the batch, async, SQLite and columnar APIs
+    code = (
+        "import sys; import dissect.shellitem.lnk as lnk; "
+        "print(sorted({'asyncio', 'concurrent.futures', 'numpy', 'sqlite3'} & set(sys.modules))); "
+        "print(lnk.parse_many.__module__, lnk.to_sqlite.__module__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.splitlines() == ["[]", "dissect.shellitem.lnk.batch dissect.shellitem.lnk.sqlite"]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkBuilder, LnkRecord, Manifest, scan
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _touch(path: Path, offset: int) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset))
+
+
+def test_scan(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    files = [tmp_path.joinpath(f"{name}.lnk") for name in "abcd"]
+    for path in files:
+        path.write_bytes(synthetic_lnk)
+    files[3].write_bytes(b"\x00" * 0x100)
+    expected = Lnk.from_buffer(synthetic_lnk).to_dict()
+
+    manifest_path = tmp_path.joinpath("manifest.sqlite")
+    with Manifest(manifest_path) as manifest:
+        changes = list(scan(files, manifest, workers=0))
+
+        assert [(change.status, change.path) for change in changes] == [("added", str(path)) for path in files]
+        assert all(change.record == expected for change in changes[:3])
+        assert changes[3].error == "Invalid LNK file header"
+        assert len(manifest) == 4
+        assert LnkRecord.from_json(manifest.result(str(files[0]))).to_dict() == expected
+
+        # nothing changed
+        assert list(scan(files, manifest, workers=0)) == []
+
+    # the second run reads the manifest of the first run
+    builder = LnkBuilder.from_lnk(Lnk.from_buffer(synthetic_lnk))
+    builder.header.filesize = 1
+    files[0].write_bytes(builder.dumps())
+    _touch(files[0], 1_000_000_000)
+    _touch(files[1], 1_000_000_000)
+    files[2].unlink()
+    new = tmp_path.joinpath("e.lnk")
+    new.write_bytes(synthetic_lnk)
+
+    with Manifest(manifest_path) as manifest:
+        changes = list(scan([files[0], files[1], files[3], new], manifest, workers=0, compact=True))
+
+        # the contents of b.lnk didn't change, so it isn't reported
+        assert [(change.status, change.path) for change in changes] == [
+            ("modified", str(files[0])),
+            ("added", str(new)),
+            ("deleted", str(files[2])),
+        ]
+        assert changes[0].record.filesize == 1
+        assert isinstance(changes[1].record, LnkRecord)
+        assert changes[2].record is None
+        assert str(files[2]) not in manifest
+        assert len(manifest) == 4
+
+        assert list(scan([files[0], files[1], files[3], new], manifest, workers=0)) == []
+
+
+def test_scan_interrupted(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("a.lnk")
+    path.write_bytes(synthetic_lnk)
+
+    manifest_path = tmp_path.joinpath("manifest.sqlite")
+    with Manifest(manifest_path) as manifest:
+        next(scan([path, path], manifest, workers=0))
+
+    # an interrupted scan leaves the manifest unchanged
+    with Manifest(manifest_path) as manifest:
+        assert len(manifest) == 0
+        assert [change.status for change in scan([path], manifest, workers=2)] == ["added"]
+
+
+def test_manifest_kind(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("manifest.sqlite")
+    Manifest(path, kind="parse-lnk").close()
+
+    with pytest.raises(ValueError, match="expected version 2 and kind 'record'"):
+        Manifest(path)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from struct import pack
+from uuid import UUID
+
+from dissect.shellitem.lnk import Lnk, PropertyStore
+from dissect.shellitem.lnk.propstore import decode_typed_value
+
+SID = "S-1-5-21-1234567890-1234567890-1234567890-1001"
+
+
+def _lpwstr(value: str) -> bytes:
+    data = (value + "\x00").encode("utf-16-le")
+    return pack("<I", len(data) // 2) + data.ljust((len(data) + 3) & ~3, b"\x00")
+
+
+def _integer_value(property_id: int, vtype: int, value: bytes) -> bytes:
+    return pack("<IIBHH", 13 + len(value), property_id, 0, vtype, 0) + value
+
+
+def _string_value(name: str, vtype: int, value: bytes) -> bytes:
+    encoded = (name + "\x00").encode("utf-16-le")
+    return pack("<IIB", 13 + len(encoded) + len(value), len(encoded), 0) + encoded + pack("<HH", vtype, 0) + value
+
+
+def _storage(format_id: str, values: list[bytes]) -> bytes:
+    data = b"".join(values) + pack("<I", 0)
+    return pack("<II", 24 + len(data), 0x53505331) + UUID(format_id).bytes_le + data
+
+
+def _build_property_store() -> bytes:
+    return (
+        _storage(
+            "b725f130-47ef-101a-a5f1-02608c9eebac",
+            [
+                _integer_value(4, 0x1F, _lpwstr("Text Document")),
+                _integer_value(14, 0x40, pack("<Q", 0x01D2000000000000)),
+                _integer_value(12, 0x15, pack("<Q", 0x1337)),
+            ],
+        )
+        + _storage("46588ae2-4cbc-4338-bbfc-139326986dce", [_integer_value(4, 0x1F, _lpwstr(SID))])
+        + _storage(
+            "d5cdd505-2e9c-101b-9397-08002b2cf9ae",
+            [
+                _string_value("Custom", 0x1013, pack("<III", 2, 1, 2)),
+                _string_value("Unknown", 0x0099, b"\x01\x02"),
+            ],
+        )
+        + pack("<I", 0)
+    )
+
+
+def test_property_store() -> None:
+    store = PropertyStore(_build_property_store())
+    properties = list(store)
+
+    assert len(properties) == 6
+    assert [prop.name for prop in properties] == [
+        "System.ItemTypeText",
+        "System.DateModified",
+        "System.Size",
+        "SID",
+        "Custom",
+        "Unknown",
+    ]
+
+    format_id, property_id, value = properties[0]
+    assert format_id == UUID("b725f130-47ef-101a-a5f1-02608c9eebac")
+    assert property_id == 4
+    assert value == "Text Document"
+
+    assert properties[1].value == datetime(2016, 8, 27, 1, 11, 54, 716570, tzinfo=timezone.utc)
+    assert properties[2].value == 0x1337
+    assert properties[4].id is None
+    assert properties[4].value == [1, 2]
+    assert properties[5].type == 0x99
+    assert properties[5].value == b"\x01\x02"
+
+    assert store.get("SID") == SID
+    assert store.get(("46588ae2-4cbc-4338-bbfc-139326986dce", 4)) == SID
+    assert store.get("Missing", "default") == "default"
+    assert store.to_dict()["System.Size"] == 0x1337
+
+
+def test_decode_typed_value_unsupported() -> None:
+    # Values of unsupported types, and vectors of them, are returned as raw bytes
+    assert decode_typed_value(pack("<HH", 0x99, 0) + b"\x01\x02") == b"\x01\x02"
+    assert decode_typed_value(pack("<HHI", 0x1099, 0, 1) + b"\x01\x02") == pack("<I", 1) + b"\x01\x02"
+    assert decode_typed_value(pack("<HHI", 0x1003, 0, 2) + pack("<ii", 1, -1)) == [1, -1]
+
+
+def test_property_store_lazy() -> None:
+    store = PropertyStore(_build_property_store())
+    prop = next(iter(store))
+
+    assert prop._value is prop._UNSET
+    assert prop.value == "Text Document"
+    assert prop._value == "Text Document"
+
+
+def test_lnk_property_store(synthetic_lnk: bytes) -> None:
+    store = _build_property_store()
+    block = pack("<II", 8 + len(store), 0xA0000009) + store
+    lnk = Lnk.from_buffer(synthetic_lnk[:-4] + block + synthetic_lnk[-4:])
+
+    assert lnk.extradata.PROPERTY_STORE_PROPS.format_id == UUID("b725f130-47ef-101a-a5f1-02608c9eebac")
+    assert lnk.extradata.property_store.get("SID") == SID
+    assert Lnk.from_buffer(synthetic_lnk).extradata.property_store is None
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pickle
+import sys
+from io import BytesIO
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkRecord
+from dissect.shellitem.lnk.lnk import RECORD_FIELDS, RECORD_PROJECTION
+
+
+def test_to_record(synthetic_lnk: bytes) -> None:
+    lnk = Lnk(BytesIO(synthetic_lnk))
+    record = lnk.to_record()
+
+    assert record.to_dict() == lnk.to_dict()
+    assert list(dict(record)) == list(RECORD_FIELDS)
+    assert record.machine_id == "workstation"
+    assert record.target_path == "C:\\Windows\\notepad.exe"
+    assert record.filesize == 0x1337
+    assert record.relative_path is None
+
+    assert record.has_link_target_idlist is True
+    assert record.has_link_info is True
+    assert record.has_arguments is True
+    assert record.has_relative_path is False
+    assert record.run_as_user is False
+
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof(lnk.to_dict())
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_to_record_projection(synthetic_lnk: bytes) -> None:
+    record = Lnk.from_buffer(synthetic_lnk, fields=RECORD_PROJECTION).to_record()
+    assert record == Lnk.from_buffer(synthetic_lnk).to_record()
+
+
+def test_to_record_invalid() -> None:
+    record = Lnk(BytesIO(b"\x00" * 0x100)).to_record()
+
+    assert all(value is None for _, value in record)
+    assert record.is_unicode is False
+
+
+def test_record_pickle(synthetic_lnk: bytes) -> None:
+    record = Lnk.from_buffer(synthetic_lnk).to_record()
+    restored = pickle.loads(pickle.dumps(record))
+
+    assert restored == record
+    assert restored.has_name is True
+
+
+def test_record_interned(synthetic_lnk: bytes) -> None:
+    first = Lnk.from_buffer(synthetic_lnk).to_record()
+    second = Lnk.from_buffer(synthetic_lnk).to_record()
+
+    assert first.machine_id is second.machine_id
+    assert first.net_name is second.net_name
+
+
+def test_record_unknown_field() -> None:
+    with pytest.raises(TypeError, match="Unknown LnkRecord fields: size"):
+        LnkRecord(size=1)
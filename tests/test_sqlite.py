@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import sqlite3
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from dissect.shellitem.lnk import Lnk, SqliteSink, to_sqlite
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_sqlite_sink(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("links.sqlite")
+    lnk = Lnk.from_buffer(synthetic_lnk)
+
+    with SqliteSink(path, batchsize=2) as sink:
+        assert [sink.write(lnk, f"{idx}.lnk") for idx in range(3)] == [1, 2, 3]
+
+    db = sqlite3.connect(path)
+    expected = lnk.to_dict()
+    assert db.execute("SELECT COUNT(*) FROM links").fetchone()[0] == 3
+    assert db.execute("SELECT path, target_path, write_time, filesize FROM links WHERE id = 2").fetchone() == (
+        "1.lnk",
+        "C:\\Windows\\notepad.exe",
+        expected["write_time"].isoformat(),
+        0x1337,
+    )
+    assert db.execute("SELECT name, value FROM strings WHERE link_id = 1 ORDER BY name").fetchall() == [
+        ("command_line_arguments", "/A C:\\test.txt"),
+        ("name_string", "Synthetic shortcut"),
+        ("working_dir", "C:\\Windows"),
+    ]
+    assert db.execute("SELECT machine_id, volume_droid FROM tracker WHERE link_id = 3").fetchone() == (
+        "workstation",
+        expected["volume_droid"],
+    )
+    assert db.execute("SELECT position, name FROM extra_blocks WHERE link_id = 1").fetchall() == [
+        (0, "TRACKER_PROPS"),
+        (1, "KNOWN_FOLDER_PROPS"),
+    ]
+    assert db.execute("SELECT position, type, name FROM items WHERE link_id = 1").fetchall() == [
+        (0, "RootFolderItem", "CLSID_MyComputer"),
+        (1, "VolumeItem", "C:\\"),
+    ]
+
+    indexes = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"tracker_machine_id", "tracker_volume_droid", "links_target_path", "strings_value"} <= indexes
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN SELECT link_id FROM strings WHERE name = 'command_line_arguments' AND value = '/A'"
+    ).fetchall()
+    assert "strings_value" in plan[0][-1]
+    db.close()
+
+    # Files are appended to an existing database
+    with SqliteSink(path) as sink:
+        assert sink.write(lnk) == 4
+
+
+def test_to_sqlite(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    files = [tmp_path.joinpath("a.lnk"), tmp_path.joinpath("b.lnk")]
+    files[0].write_bytes(synthetic_lnk)
+    files[1].write_bytes(b"not a shortcut")
+    path = tmp_path.joinpath("links.sqlite")
+
+    sources = [*files, BytesIO(synthetic_lnk), synthetic_lnk]
+    assert to_sqlite(sources, path, workers=2, chunksize=1) == 3
+
+    db = sqlite3.connect(path)
+    assert db.execute("SELECT id, path FROM links ORDER BY id").fetchall() == [(1, str(files[0])), (2, None), (3, None)]
+    db.close()
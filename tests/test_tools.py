@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dissect.shellitem.lnk import LnkBuilder, new_header
+from dissect.shellitem.tools import lnk as lnk_tool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("fmt", ["json", "jsonl", "csv"])
+def test_parse_lnk_structured_output(synthetic_lnk_file: Path, fmt: str) -> None:
+    output = StringIO()
+    writer = lnk_tool.RecordWriter(output, fmt)
+    lnk_tool.parse(synthetic_lnk_file, writer)
+    lnk_tool.parse(synthetic_lnk_file, writer)
+    writer.close()
+
+    if fmt == "json":
+        records = json.loads(output.getvalue())
+    elif fmt == "jsonl":
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+    else:
+        records = list(csv.DictReader(StringIO(output.getvalue())))
+
+    assert len(records) == 2
+    assert list(records[0].keys()) == list(lnk_tool.OUTPUT_FIELDS)
+    assert records[0]["path"] == str(synthetic_lnk_file)
+    assert records[0]["name"] == "Synthetic shortcut"
+    assert records[0]["arguments"] == "/A C:\\test.txt"
+    assert records[0]["full_path"] == "C:\\Windows\\notepad.exe"
+    assert records[0]["machine_id"] == "workstation"
+    assert records[0]["target_mtime"].startswith("2016-")
+
+
+def test_parse_lnk_ansi_jsonl(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("ansi.lnk")
+    builder = LnkBuilder(
+        new_header(),
+        strings={"name_string": "ANSI shortcut", "command_line_arguments": "/A"},
+        unicode=False,
+    )
+    path.write_bytes(builder.dumps())
+
+    output = StringIO()
+    lnk_tool.parse(path, lnk_tool.RecordWriter(output, "jsonl"))
+
+    record = json.loads(output.getvalue())
+    assert (record["name"], record["arguments"]) == ("ANSI shortcut", "/A")
+
+
+def test_parse_lnk_codepage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    path = tmp_path.joinpath("ansi.lnk")
+    builder = LnkBuilder(new_header(), strings={"name_string": "Caf\xe9"}, unicode=False, codepage="cp1252")
+    path.write_bytes(builder.dumps())
+
+    monkeypatch.setattr("sys.argv", ["parse-lnk", "--jsonl", str(path)])
+    lnk_tool.main()
+    assert json.loads(capsys.readouterr().out)["name"] == "Caf\\xe9"
+
+    monkeypatch.setattr("sys.argv", ["parse-lnk", "--jsonl", "--codepage", "cp1252", str(path)])
+    lnk_tool.main()
+    assert json.loads(capsys.readouterr().out)["name"] == "Caf\xe9"
+
+
+def test_parse_lnk_empty_json() -> None:
+    output = StringIO()
+    lnk_tool.RecordWriter(output, "json").close()
+    assert json.loads(output.getvalue()) == []
+
+
+def test_parse_lnk_text_output(synthetic_lnk_file: Path, capsys: pytest.CaptureFixture) -> None:
+    lnk_tool.parse(synthetic_lnk_file)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == f"Link Path\t\t\t: {synthetic_lnk_file}"
+    assert lines[1] == "Link Name / description\t\t: Synthetic shortcut"
+    assert len(lines) == len(lnk_tool.OUTPUT_FIELDS) + 1
+    assert "Machine id link\t\t\t: workstation" in lines
+
+
+def test_parse_lnk_machine_id(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    path = tmp_path.joinpath("machine_id.lnk")
+    path.write_bytes(synthetic_lnk.replace(b"workstation", b"workst\xe9tion"))
+
+    output = StringIO()
+    lnk_tool.parse(path, lnk_tool.RecordWriter(output, "jsonl"))
+    assert json.loads(output.getvalue())["machine_id"] == "workst\\xe9tion"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_parse_lnk_recursive(
+    tmp_path: Path, synthetic_lnk: bytes, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, jobs: str
+) -> None:
+    (tmp_path / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a.lnk").write_bytes(synthetic_lnk)
+    (tmp_path / "b" / "c" / "d.LNK").write_bytes(synthetic_lnk)
+    (tmp_path / "b" / "e.bin").write_bytes(synthetic_lnk)
+    (tmp_path / "b" / "f.lnk").write_bytes(b"not a shortcut")
+    (tmp_path / "b" / "g.lnk").write_bytes(synthetic_lnk[:0x100])
+    (tmp_path / "z.lnk").write_bytes(synthetic_lnk)
+
+    monkeypatch.setattr("sys.argv", ["parse-lnk", "--jsonl", "-r", "-j", jobs, "--progress", str(tmp_path)])
+    lnk_tool.main()
+
+    captured = capsys.readouterr()
+    paths = [json.loads(line)["path"] for line in captured.out.splitlines()]
+    assert paths == [str(tmp_path / "a.lnk"), str(tmp_path / "b" / "c" / "d.LNK"), str(tmp_path / "z.lnk")]
+    assert "5 files" in captured.err
+    assert "3 parsed, 1 skipped, 1 errors" in captured.err
+
+
+def test_walk(tmp_path: Path, synthetic_lnk: bytes) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.lnk").write_bytes(synthetic_lnk)
+    (tmp_path / "sub" / "b.bin").write_bytes(synthetic_lnk)
+
+    assert list(lnk_tool.walk([tmp_path])) == []
+    assert list(lnk_tool.walk([tmp_path], recursive=True)) == [(str(tmp_path / "a.lnk"), False)]
+    assert list(lnk_tool.walk([tmp_path], recursive=True, match="magic")) == [
+        (str(tmp_path / "a.lnk"), True),
+        (str(tmp_path / "sub" / "b.bin"), True),
+    ]
+    assert list(lnk_tool.walk([tmp_path / "sub" / "b.bin"], match="both")) == [(str(tmp_path / "sub" / "b.bin"), False)]
+
+
+def test_parse_lnk_sqlite(
+    tmp_path: Path, synthetic_lnk: bytes, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    root = tmp_path.joinpath("root")
+    root.mkdir()
+    root.joinpath("a.lnk").write_bytes(synthetic_lnk)
+    root.joinpath("b.txt").write_bytes(synthetic_lnk)
+    root.joinpath("c.txt").write_bytes(b"not a shortcut")
+    path = tmp_path.joinpath("links.sqlite")
+
+    monkeypatch.setattr("sys.argv", ["parse-lnk", "--sqlite", str(path), "-r", "--match", "magic", str(root)])
+    lnk_tool.main()
+    assert capsys.readouterr().out == ""
+
+    db = sqlite3.connect(path)
+    rows = db.execute("SELECT path, target_path FROM links ORDER BY id").fetchall()
+    assert rows == [(str(root / name), "C:\\Windows\\notepad.exe") for name in ("a.lnk", "b.txt")]
+    db.close()
+
+
+def test_parse_lnk_manifest(
+    tmp_path: Path, synthetic_lnk: bytes, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    root = tmp_path.joinpath("root")
+    root.mkdir()
+    root.joinpath("a.lnk").write_bytes(synthetic_lnk)
+    root.joinpath("b.lnk").write_bytes(synthetic_lnk)
+    root.joinpath("c.lnk").write_bytes(b"not a shortcut")
+    argv = ["parse-lnk", "--jsonl", "-r", "--manifest", str(tmp_path / "manifest.sqlite"), str(root)]
+
+    def run() -> list[tuple[str, str]]:
+        monkeypatch.setattr("sys.argv", argv)
+        lnk_tool.main()
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        return [(record["status"], record["path"]) for record in records]
+
+    assert run() == [("added", str(root / "a.lnk")), ("added", str(root / "b.lnk"))]
+    assert run() == []
+
+    root.joinpath("a.lnk").unlink()
+    root.joinpath("d.lnk").write_bytes(synthetic_lnk)
+    assert run() == [("added", str(root / "d.lnk")), ("deleted", str(root / "a.lnk"))]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from struct import pack
+
+import pytest
+
+from dissect.shellitem.lnk import Lnk, LnkBuilder, build_linkinfo, new_header, validate
+from tests.benchmarks.corpus import SHAPES, generate_lnk
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_validate_corpus(name: str) -> None:
+    buf = generate_lnk(SHAPES[name], 3)
+    report = validate(buf)
+
+    assert report.valid
+    assert report.errors == ()
+    assert report.size == len(buf)
+    assert report.offsets == Lnk.from_buffer(buf, lazy=True).offsets
+
+
+def test_validate_synthetic(synthetic_lnk: bytes) -> None:
+    junk = b"\xff" * 100
+    report = validate(junk + synthetic_lnk + junk, len(junk))
+    assert report.valid
+    assert report.size == len(synthetic_lnk)
+    assert report.warnings == ()
+
+    # Every truncation of a valid file is rejected
+    for size in range(len(synthetic_lnk)):
+        assert not validate(synthetic_lnk[:size]).valid
+    assert not validate(synthetic_lnk, max_size=len(synthetic_lnk) - 1).valid
+
+
+def test_validate_junk() -> None:
+    assert validate(b"\x00" * 0x100).errors == ("Invalid header size: 0x0", "Invalid LNK CLSID")
+    assert validate(b"L\x00").errors == ("Buffer is smaller than the SHELL_LINK_HEADER",)
+
+
+def test_validate_idlist() -> None:
+    header = new_header(link_flags=0x01).dumps()
+    item = pack("<H", 6) + b"\x2f\x00\x00\x00"
+
+    assert validate(header + pack("<H", 8) + item + b"\x00\x00" + b"\x00" * 4).valid
+
+    # The ITEMID sizes exceed the IDList size
+    report = validate(header + pack("<H", 8) + pack("<H", 10) + b"\x2f\x00\x00\x00\x00\x00" + b"\x00" * 4)
+    assert report.errors == ("ITEMID sizes don't add up to the TARGET_IDLIST size of 0x8",)
+    assert report.size == len(header) + 10 + 4
+
+    # The IDList size exceeds the buffer
+    assert not validate(header + pack("<H", 0x100) + item).valid
+
+
+def test_validate_linkinfo() -> None:
+    linkinfo = bytearray(build_linkinfo("C:\\Windows\\notepad.exe", unicode=False))
+    buf = LnkBuilder(new_header(), linkinfo=bytes(linkinfo)).dumps()
+    assert validate(buf).valid
+
+    # Point the CommonPathSuffix beyond the end of the LINK_INFO
+    linkinfo[24:28] = pack("<I", len(linkinfo))
+    report = validate(LnkBuilder(new_header(), linkinfo=bytes(linkinfo)).dumps())
+    assert not report.valid
+    assert "CommonPathSuffix offset" in report.errors[0]
+
+
+def test_validate_extradata(synthetic_lnk: bytes) -> None:
+    # Without the terminal block the chain runs into the end of the buffer
+    report = validate(synthetic_lnk[:-4])
+    assert report.errors == ("EXTRA_DATA does not end with a terminal block",)
+
+    unknown = pack("<II", 12, 0xDEADBEEF) + b"\x00" * 4
+    report = validate(synthetic_lnk[:-4] + unknown + b"\x00" * 4)
+    assert report.valid
+    assert report.warnings == (f"Unknown extra data block signature at {len(synthetic_lnk) - 4:#x}: 0xdeadbeef",)
+
+    # Sizes too small for a block header are tolerated as terminal blocks, like the parser does
+    for terminal in (1, 4, 7):
+        buf = synthetic_lnk[:-4] + pack("<I", terminal)
+        report = validate(buf)
+        assert report.valid
+        assert report.size == len(buf)
+        assert report.warnings == (f"Invalid terminal block: {terminal:#x}",)
+        assert Lnk.from_buffer(buf).size == len(buf)
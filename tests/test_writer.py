@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import dataclasses
+import io
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from dissect.shellitem.lnk import Limits, Lnk, LnkBuilder, build_idlist, build_linkinfo, new_header
+from tests.benchmarks.corpus import SHAPES, generate_corpus
+
+
+def test_builder_round_trip(synthetic_lnk: bytes) -> None:
+    lnk = Lnk.from_buffer(synthetic_lnk)
+    assert LnkBuilder.from_lnk(lnk).dumps() == synthetic_lnk
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_builder_round_trip_corpus(shape: str) -> None:
+    for buf in generate_corpus(dataclasses.replace(SHAPES[shape], count=16)):
+        assert LnkBuilder.from_lnk(Lnk.from_buffer(buf, lazy=True)).dumps() == buf
+
+
+def test_builder_round_trip_exact() -> None:
+    # A string starting with a BOM and a LINK_INFO with trailing data that isn't referenced by any offset
+    linkinfo = build_linkinfo("C:\\Windows\\notepad.exe")
+    linkinfo = (len(linkinfo) + 4).to_bytes(4, "little") + linkinfo[4:] + b"\xaa" * 4
+    buf = LnkBuilder(new_header(), linkinfo=linkinfo, strings={"name_string": "\ufeffBOM"}).dumps()
+
+    lnk = Lnk.from_buffer(buf)
+    assert LnkBuilder.from_lnk(lnk).dumps() == buf
+
+
+def test_builder_round_trip_limits(synthetic_lnk: bytes) -> None:
+    lnk = Lnk.from_buffer(synthetic_lnk, limits=Limits(max_block_size=0x40))
+    with pytest.raises(ValueError, match="exceeded the limits"):
+        LnkBuilder.from_lnk(lnk)
+
+
+def test_builder_round_trip_modified(synthetic_lnk: bytes) -> None:
+    builder = LnkBuilder.from_lnk(Lnk.from_buffer(synthetic_lnk))
+    builder.strings["command_line_arguments"] = "/B"
+    del builder.strings["name_string"]
+    builder.idlist = None
+
+    lnk = Lnk.from_buffer(builder.dumps())
+    assert not lnk.flag("has_link_target_idlist")
+    assert not lnk.flag("has_name")
+    assert lnk.stringdata.command_line_arguments.string == "/B"
+    assert lnk.linkinfo.local_base_path == b"C:\\Windows\\"
+    assert lnk.extradata.TRACKER_PROPS.machine_id.rstrip(b"\x00") == b"workstation"
+
+
+def test_builder() -> None:
+    known_folder = UUID("374de290-123f-4565-9164-39c4925e467b")
+    builder = LnkBuilder(
+        header=new_header(
+            file_flags=0x20,
+            write_time=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            filesize=0x1337,
+            hotkey_flags=(0x41, 0x02),
+        ),
+        idlist=[b"\x1f\x50" + UUID("20d04fe0-3aea-1069-a2d8-08002b30309d").bytes_le, b"\x2fC:\\" + b"\x00" * 19],
+        linkinfo=build_linkinfo(
+            local_base_path="C:\\Windows\\notepad.exe",
+            drive_serial_number=0x1234,
+            net_name="\\\\SERVER\\share",
+            device_name="Z:",
+        ),
+        strings={"name_string": "Notepad", "working_dir": "C:\\Windows"},
+        extradata=[("KNOWN_FOLDER_PROPS", known_folder.bytes_le + b"\x00" * 4)],
+    )
+
+    fh = io.BytesIO()
+    assert builder.write(fh) == len(builder.dumps())
+
+    fh.seek(0)
+    lnk = Lnk(fh)
+    assert lnk.flag("is_unicode")
+    assert lnk.link_header.filesize == 0x1337
+    assert lnk.link_header.hotkey_flags == (0x41, 0x02)
+    assert lnk.size == len(builder.dumps())
+
+    record = lnk.to_dict()
+    assert record["write_time"] == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert record["name_string"] == "Notepad"
+    assert record["working_dir"] == "C:\\Windows"
+    assert record["target_path"] == "C:\\Windows\\notepad.exe"
+    assert record["drive_serial_number"] == 0x1234
+    assert record["net_name"] == "\\\\SERVER\\share"
+    assert record["device_name"] == "Z:"
+    assert record["known_folder_id"] == str(known_folder)
+    assert lnk.target_idlist.items.path() == "C:"
+
+    # a builder writes the same file as the builder of the file it wrote
+    fh.seek(0)
+    assert LnkBuilder.from_lnk(Lnk(fh)).dumps() == builder.dumps()
+
+
+def test_builder_ansi() -> None:
+    builder = LnkBuilder(
+        linkinfo=build_linkinfo(local_base_path="C:\\caf\xe9.txt", unicode=False),
+        strings={"relative_path": "..\\caf\xe9.txt"},
+        unicode=False,
+    )
+
+    lnk = Lnk.from_buffer(builder.dumps())
+    assert not lnk.flag("is_unicode")
+    assert not lnk.linkinfo.unicode
+    assert lnk.linkinfo.local_base_path == b"C:\\caf\xe9.txt"
+    assert lnk.stringdata.relative_path.string == b"..\\caf\xe9.txt"
+
+
+def test_build_idlist() -> None:
+    assert build_idlist([]) == b"\x02\x00\x00\x00"
+    assert build_idlist([b"\x2fC:\\"]) == b"\x08\x00\x06\x00\x2fC:\\\x00\x00"
+
+
+def test_new_header_unknown_field() -> None:
+    with pytest.raises(ValueError, match="Unknown SHELL_LINK_HEADER field"):
+        new_header(size=1)
+
+
+def test_builder_from_projection(synthetic_lnk: bytes) -> None:
+    lnk = Lnk.from_buffer(synthetic_lnk, fields=["header.write_time"])
+    with pytest.raises(ValueError, match="field projection"):
+        LnkBuilder.from_lnk(lnk)